@@ -0,0 +1,126 @@
+"""Import-time benchmarks for `pydantic-kedro`.
+
+Each scenario runs in a fresh interpreter (so nothing is cached in `sys.modules`),
+and reports the wall time of the imports, as well as any "heavy" modules that
+were imported although the scenario doesn't need them.
+
+Heavy modules are only needed by some formats: `ruamel.yaml` and `pydantic_yaml`
+for YAML, `fsspec.implementations.zip` for zip files, and `kedro_datasets` for
+the default dataset of arbitrary types. Importing the package, or loading a
+JSON model, should not import any of them.
+
+For a detailed breakdown, use `python -X importtime -c "import pydantic_kedro"`.
+
+Usage
+-----
+
+```bash
+python benchmarks/bench_import.py            # report
+python benchmarks/bench_import.py --check    # exit with code 1 if a heavy module is imported
+python benchmarks/bench_import.py --repeat 10
+```
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+HEAVY_MODULES = [
+    "ruamel.yaml",
+    "pydantic_yaml",
+    "kedro_datasets",
+    "fsspec.implementations.zip",
+]
+
+# Runs `setup`, then times `stmt`, then prints the timing and the imported heavy modules
+_TEMPLATE = """
+import json, sys, time
+{setup}
+t0 = time.perf_counter()
+{stmt}
+dt = time.perf_counter() - t0
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(json.dumps({{"seconds": dt, "heavy": heavy}}))
+"""
+
+_JSON_SETUP = """
+import tempfile
+from pydantic_kedro import PydanticJsonDataset
+from pydantic_kedro._pydantic import BaseModel
+
+class Model(BaseModel):
+    x: int = 1
+
+path = tempfile.mkdtemp() + "/model.json"
+PydanticJsonDataset(path).save(Model())
+for name in [m for m in sys.modules if m.startswith("pydantic_kedro")]:
+    del sys.modules[name]
+"""
+
+
+@dataclass
+class Scenario:
+    """A timed statement, and the heavy modules that it may import."""
+
+    name: str
+    stmt: str
+    setup: str = ""
+    allowed: Sequence[str] = ()
+
+
+def get_scenarios() -> List[Scenario]:
+    """Get the scenarios to measure."""
+    return [
+        Scenario("import pydantic_kedro", "import pydantic_kedro"),
+        Scenario("public names", "from pydantic_kedro import ArbModel, PydanticAutoDataset, load_model"),
+        Scenario(
+            "load JSON model",
+            "from pydantic_kedro import load_model; load_model(path)",
+            setup=_JSON_SETUP,
+        ),
+        Scenario(
+            "all datasets",
+            "from pydantic_kedro import PydanticYamlDataset, PydanticZipDataset, ArbModel\n"
+            "ArbModel.Config.kedro_default('x')",
+            allowed=HEAVY_MODULES,
+        ),
+    ]
+
+
+def measure(scenario: Scenario) -> Dict[str, object]:
+    """Run the scenario in a fresh interpreter."""
+    code = _TEMPLATE.format(setup=scenario.setup, stmt=scenario.stmt, heavy=HEAVY_MODULES)
+    out = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the import-time benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--check", action="store_true", help="Fail if unneeded heavy modules are imported."
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Repeats per scenario (best is taken).")
+    args = parser.parse_args(argv)
+
+    flagged: List[str] = []
+    print(f"{'scenario':<24} {'best (ms)':>10}  unneeded heavy modules")
+    for scenario in get_scenarios():
+        runs = [measure(scenario) for _ in range(args.repeat)]
+        best = min(float(r["seconds"]) for r in runs)  # type: ignore
+        heavy = sorted({m for r in runs for m in r["heavy"] if m not in scenario.allowed})  # type: ignore
+        print(f"{scenario.name:<24} {best * 1000:>10.1f}  {', '.join(heavy) or '-'}")
+        if heavy:
+            flagged.append(scenario.name)
+    if flagged:
+        print(f"\nUnneeded heavy imports in: {', '.join(flagged)}")
+        if args.check:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
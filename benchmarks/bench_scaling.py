@@ -0,0 +1,322 @@
+"""Scaling benchmarks for the recursive hot paths of `pydantic-kedro`.
+
+This sweeps the dimensions that the recursive functions depend on
+(nesting depth, list length, number of arbitrary members), reports the
+time per element, and flags super-linear growth.
+
+The growth is estimated as the slope of a least-squares fit of `log(time)`
+against `log(size)`. A slope of ~1 means linear scaling; anything noticeably
+larger is flagged.
+
+Usage
+-----
+
+```bash
+python benchmarks/bench_scaling.py            # full sweep
+python benchmarks/bench_scaling.py --quick    # small sizes, e.g. for CI
+python benchmarks/bench_scaling.py --check    # exit with code 1 if anything is flagged
+python benchmarks/bench_scaling.py -k mutate  # only run matching cases
+```
+"""
+
+import argparse
+import math
+import sys
+import timeit
+from dataclasses import dataclass
+from functools import partial
+from tempfile import TemporaryDirectory
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from kedro.io.core import AbstractDataset
+
+from pydantic_kedro import ArbConfig, ArbModel
+from pydantic_kedro._dict_io import KLS_MARK_STR, _dict_manip, dict_to_model, get_kls_path
+from pydantic_kedro._pydantic import BaseModel
+from pydantic_kedro.datasets.folder import PydanticFolderDataset, mutate_jsp
+
+# Models used for the benchmarks
+
+
+class Leaf(BaseModel):
+    """Leaf model with a single field."""
+
+    x: int = 0
+
+
+class Chain(BaseModel):
+    """Recursive model, used for nesting depth."""
+
+    child: Optional["Chain"] = None
+
+
+Chain.update_forward_refs()
+
+
+class Wide(BaseModel):
+    """Model with a long list of nested models."""
+
+    items: List[Leaf] = []
+
+
+class Blob:
+    """Tiny arbitrary (non-JSON-able) object."""
+
+    def __init__(self, v: int) -> None:
+        self.v = v
+
+
+class BlobDataset(AbstractDataset[Blob, Blob]):
+    """In-memory dataset for `Blob`, so saving only measures the traversal."""
+
+    def __init__(self, filepath: str) -> None:
+        self._filepath = filepath
+        self._data: Optional[Blob] = None
+
+    def _load(self) -> Blob:
+        assert self._data is not None
+        return self._data
+
+    def _save(self, data: Blob) -> None:
+        self._data = data
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(filepath=self._filepath)
+
+
+class ArbList(ArbModel):
+    """Model with a list of arbitrary objects."""
+
+    class Config(ArbConfig):
+        """Keep the objects in memory."""
+
+        kedro_map = {Blob: BlobDataset}
+
+    items: List[Blob] = []
+
+
+# Builders for the inputs
+
+
+def _leaf_dict(i: int = 0) -> Dict[str, Any]:
+    return {KLS_MARK_STR: get_kls_path(Leaf), "x": i}
+
+
+def _chain_dict(depth: int) -> Dict[str, Any]:
+    dct: Dict[str, Any] = {KLS_MARK_STR: get_kls_path(Chain), "child": None}
+    for _ in range(depth - 1):
+        dct = {KLS_MARK_STR: get_kls_path(Chain), "child": dct}
+    return dct
+
+
+def _wide_dict(n: int) -> Dict[str, Any]:
+    return {KLS_MARK_STR: get_kls_path(Wide), "items": [_leaf_dict(i) for i in range(n)]}
+
+
+def _flat_manip_dict(n: int) -> Dict[str, Any]:
+    return {f"k{i}": _leaf_dict(i) for i in range(n)}
+
+
+def _deep_manip_dict(depth: int) -> Dict[str, Any]:
+    dct: Dict[str, Any] = {"leaf": _leaf_dict()}
+    for _ in range(depth - 1):
+        dct = {"sub": dct}
+    return dct
+
+
+def _deep_struct(depth: int) -> Dict[str, Any]:
+    dct: Dict[str, Any] = {"v": None}
+    for _ in range(depth - 1):
+        dct = {"s": dct}
+    return dct
+
+
+def _nested_item(depth: int) -> Any:
+    return None if depth <= 1 else {"s": _nested_item(depth - 1)}
+
+
+# Benchmark cases
+
+
+@dataclass
+class Case:
+    """A single scaling benchmark.
+
+    `make(n)` builds a zero-argument callable that performs the work for size `n`.
+    """
+
+    name: str
+    dimension: str
+    sizes: Sequence[int]
+    make: Callable[[int], Callable[[], Any]]
+
+
+def _case_dict_to_model_depth(n: int) -> Callable[[], Any]:
+    dct = _chain_dict(n)
+    return lambda: dict_to_model(dct)
+
+
+def _case_dict_to_model_list(n: int) -> Callable[[], Any]:
+    dct = _wide_dict(n)
+    return lambda: dict_to_model(dct)
+
+
+def _case_dict_manip_width(n: int) -> Callable[[], Any]:
+    dct = _flat_manip_dict(n)
+    return lambda: _dict_manip(dct)
+
+
+def _case_dict_manip_depth(n: int) -> Callable[[], Any]:
+    dct = _deep_manip_dict(n)
+    return lambda: _dict_manip(dct)
+
+
+def _case_mutate_jsp_members(n: int, depth: int = 1) -> Callable[[], Any]:
+    """Mimic `_load_local`: one root walk per catalog entry, for `n` members `depth` levels deep."""
+    jsps = [f".items.{i}" + ".s" * (depth - 1) for i in range(n)]
+    struct: Dict[str, Any] = {"items": [_nested_item(depth) for _ in range(n)]}
+
+    def run() -> None:
+        for jsp_str in jsps:
+            mutate_jsp(struct, jsp_str.split(".")[1:], 0)
+
+    return run
+
+
+def _case_mutate_jsp_depth(n: int) -> Callable[[], Any]:
+    """Mimic `_load_local`: a single catalog entry at nesting depth `n`."""
+    jsp_str = "." + ".".join(["s"] * (n - 1) + ["v"])
+    struct = _deep_struct(n)
+    return lambda: mutate_jsp(struct, jsp_str.split(".")[1:], 0)
+
+
+def _case_visit3_members(n: int) -> Callable[[], Any]:
+    """Save `n` arbitrary members with the folder dataset (this goes through `visit3`).
+
+    The members are kept in memory (see `BlobDataset`), so only the metadata is written.
+    """
+    model = ArbList(items=[Blob(i) for i in range(n)])
+
+    def run() -> None:
+        with TemporaryDirectory(prefix="pyd_kedro_bench_") as tmpdir:
+            PydanticFolderDataset(tmpdir)._save_local(model, tmpdir)
+
+    return run
+
+
+def get_cases(quick: bool) -> List[Case]:
+    """Get the benchmark cases, with smaller sizes if `quick` is set."""
+    if quick:
+        depths: Sequence[int] = [10, 20, 40, 80]
+        lengths: Sequence[int] = [100, 200, 400, 800]
+        members: Sequence[int] = [10, 20, 40, 80]
+    else:
+        depths = [25, 50, 100, 200, 400]
+        lengths = [1_000, 2_000, 4_000, 8_000, 16_000]
+        members = [50, 100, 200, 400, 800]
+    return [
+        Case("dict_to_model", "nesting depth", depths, _case_dict_to_model_depth),
+        Case("dict_to_model", "list length", lengths, _case_dict_to_model_list),
+        Case("_dict_manip", "dict width", lengths, _case_dict_manip_width),
+        Case("_dict_manip", "nesting depth", depths, _case_dict_manip_depth),
+        Case("mutate_jsp", "catalog entries", lengths, _case_mutate_jsp_members),
+        Case(
+            "mutate_jsp", "nested catalog entries", lengths, partial(_case_mutate_jsp_members, depth=8)
+        ),
+        Case("mutate_jsp", "nesting depth", depths, _case_mutate_jsp_depth),
+        Case("visit3", "arbitrary members", members, _case_visit3_members),
+    ]
+
+
+# Measurement
+
+
+@dataclass
+class Result:
+    """Timings of a single case."""
+
+    case: Case
+    times: List[float]
+
+    @property
+    def per_element(self) -> List[float]:
+        """Time per element, for each size."""
+        return [t / n for t, n in zip(self.times, self.case.sizes)]
+
+    @property
+    def slope(self) -> float:
+        """Slope of the log-log fit of time vs size (1.0 is linear)."""
+        xs = [math.log(n) for n in self.case.sizes]
+        ys = [math.log(max(t, 1e-12)) for t in self.times]
+        x_mean = sum(xs) / len(xs)
+        y_mean = sum(ys) / len(ys)
+        num = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))
+        den = sum((x - x_mean) ** 2 for x in xs)
+        return num / den
+
+
+def measure(case: Case, repeat: int = 5) -> Result:
+    """Measure the best-of-`repeat` time for every size of the case."""
+    times: List[float] = []
+    for n in case.sizes:
+        timer = timeit.Timer(case.make(n))
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat=repeat, number=number)) / number
+        times.append(best)
+    return Result(case=case, times=times)
+
+
+def _fmt_time(t: float) -> str:
+    for unit, scale in [("s", 1.0), ("ms", 1e-3), ("us", 1e-6)]:
+        if t >= scale:
+            return f"{t / scale:.2f}{unit}"
+    return f"{t / 1e-9:.0f}ns"
+
+
+def report(results: List[Result], max_slope: float) -> List[Result]:
+    """Print the results and return the ones with super-linear scaling."""
+    flagged: List[Result] = []
+    for res in results:
+        bad = res.slope > max_slope
+        if bad:
+            flagged.append(res)
+        mark = "SUPER-LINEAR" if bad else "ok"
+        print(f"{res.case.name} vs {res.case.dimension}: slope={res.slope:.2f} [{mark}]")
+        for n, t, pe in zip(res.case.sizes, res.times, res.per_element):
+            print(f"    n={n:>7}  total={_fmt_time(t):>9}  per element={_fmt_time(pe):>9}")
+    return flagged
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the scaling benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="Use small sizes.")
+    parser.add_argument("--check", action="store_true", help="Fail if super-linear scaling is found.")
+    parser.add_argument(
+        "--max-slope",
+        type=float,
+        default=1.3,
+        help="Maximum allowed log-log slope before flagging (default: 1.3).",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Repeats per size (best is taken).")
+    parser.add_argument("-k", dest="keyword", default="", help="Only run cases matching this keyword.")
+    args = parser.parse_args(argv)
+
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10_000))
+    cases = [
+        c
+        for c in get_cases(quick=args.quick)
+        if args.keyword.lower() in f"{c.name} {c.dimension}".lower()
+    ]
+    results = [measure(c, repeat=args.repeat) for c in cases]
+    flagged = report(results, max_slope=args.max_slope)
+    if flagged:
+        names = ", ".join(f"{r.case.name} vs {r.case.dimension}" for r in flagged)
+        print(f"\nSuper-linear scaling detected in: {names}")
+        if args.check:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,13 @@
-"""Kedro datasets for serializing Pydantic models."""
+"""Kedro datasets for serializing Pydantic models.
+
+The public names are imported lazily (on first access), so that `import pydantic_kedro`
+is fast and only pulls in the dependencies of what you actually use.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from .version import __version__
 
 __all__ = [
     "ArbConfig",
@@ -6,10 +15,22 @@ __all__ = [
     "PydanticAutoDataset",
     "PydanticFolderDataset",
     "PydanticJsonDataset",
+    "PydanticJsonLinesDataset",
+    "PydanticPackDataset",
     "PydanticYamlDataset",
     "PydanticZipDataset",
+    "clear_dispatch_cache",
+    "clear_model_cache",
+    "get_cache_usage",
+    "inspect_model",
     "load_model",
+    "load_model_async",
+    "load_models",
     "save_model",
+    "save_model_async",
+    "save_models",
+    "set_cache_quota",
+    "set_model_cache_size",
     "__version__",
     # compatibility
     "PydanticAutoDataSet",
@@ -19,19 +40,81 @@ __all__ = [
     "PydanticZipDataSet",
 ]
 
-from .datasets.auto import PydanticAutoDataset
-from .datasets.folder import PydanticFolderDataset
-from .datasets.json import PydanticJsonDataset
-from .datasets.yaml import PydanticYamlDataset
-from .datasets.zip import PydanticZipDataset
-from .models import ArbConfig, ArbModel
-from .utils import load_model, save_model
-from .version import __version__
+# Public name -> module that defines it
+_LAZY_IMPORTS: Dict[str, str] = {
+    "clear_dispatch_cache": "._internals",
+    "get_cache_usage": "._local_caching",
+    "set_cache_quota": "._local_caching",
+    "clear_model_cache": "._model_cache",
+    "set_model_cache_size": "._model_cache",
+    "PydanticAutoDataset": ".datasets.auto",
+    "PydanticFolderDataset": ".datasets.folder",
+    "PydanticJsonDataset": ".datasets.json",
+    "PydanticJsonLinesDataset": ".datasets.jsonl",
+    "PydanticPackDataset": ".datasets.pack",
+    "PydanticYamlDataset": ".datasets.yaml",
+    "PydanticZipDataset": ".datasets.zip",
+    "ArbConfig": ".models",
+    "ArbModel": ".models",
+    "inspect_model": ".utils",
+    "load_model": ".utils",
+    "load_model_async": ".utils",
+    "load_models": ".utils",
+    "save_model": ".utils",
+    "save_model_async": ".utils",
+    "save_models": ".utils",
+}
 
 # Old names for compatibility
+_ALIASES: Dict[str, str] = {
+    "PydanticAutoDataSet": "PydanticAutoDataset",
+    "PydanticFolderDataSet": "PydanticFolderDataset",
+    "PydanticJsonDataSet": "PydanticJsonDataset",
+    "PydanticYamlDataSet": "PydanticYamlDataset",
+    "PydanticZipDataSet": "PydanticZipDataset",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access (PEP 562)."""
+    if name in _ALIASES:
+        value = __getattr__(_ALIASES[name])
+    elif name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value  # cache it, so this is only called once
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from ._internals import clear_dispatch_cache
+    from ._local_caching import get_cache_usage, set_cache_quota
+    from ._model_cache import clear_model_cache, set_model_cache_size
+    from .datasets.auto import PydanticAutoDataset
+    from .datasets.folder import PydanticFolderDataset
+    from .datasets.json import PydanticJsonDataset
+    from .datasets.jsonl import PydanticJsonLinesDataset
+    from .datasets.pack import PydanticPackDataset
+    from .datasets.yaml import PydanticYamlDataset
+    from .datasets.zip import PydanticZipDataset
+    from .models import ArbConfig, ArbModel
+    from .utils import (
+        inspect_model,
+        load_model,
+        load_model_async,
+        load_models,
+        save_model,
+        save_model_async,
+        save_models,
+    )
 
-PydanticAutoDataSet = PydanticAutoDataset
-PydanticFolderDataSet = PydanticFolderDataset
-PydanticJsonDataSet = PydanticJsonDataset
-PydanticYamlDataSet = PydanticYamlDataset
-PydanticZipDataSet = PydanticZipDataset
+    PydanticAutoDataSet = PydanticAutoDataset
+    PydanticFolderDataSet = PydanticFolderDataset
+    PydanticJsonDataSet = PydanticJsonDataset
+    PydanticYamlDataSet = PydanticYamlDataset
+    PydanticZipDataSet = PydanticZipDataset
@@ -0,0 +1,176 @@
+"""Async filesystem access via `fsspec`.
+
+Filesystems that have an async implementation (`s3fs`, `gcsfs`, `adlfs`, HTTP...)
+are used natively on the running event loop, so many transfers can overlap
+without threads. Other filesystems (local, memory...) fall back to running the
+blocking call in a worker thread.
+"""
+
+import abc
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+import fsspec
+from fsspec import AbstractFileSystem
+from fsspec.asyn import AsyncFileSystem
+from fsspec.core import split_protocol, url_to_fs
+from kedro.io.core import DatasetError
+
+# Maximum number of concurrent file transfers in `get_files` and `put_files`
+TRANSFER_BATCH_SIZE = 16
+
+
+async def get_async_fs(uri: str) -> Tuple[AbstractFileSystem, str]:
+    """Get the filesystem and the path for `uri`.
+
+    If the filesystem has an async implementation, it is bound to the running loop.
+    """
+    protocol, _ = split_protocol(uri)
+    kls = fsspec.get_filesystem_class(protocol or "file")
+    if issubclass(kls, AsyncFileSystem) and kls.async_impl:
+        fs, path = url_to_fs(uri, asynchronous=True, loop=asyncio.get_running_loop())
+        set_session = getattr(fs, "set_session", None)
+        if set_session is not None:
+            await set_session()
+        return fs, path
+    return url_to_fs(uri)
+
+
+def to_uri(protocol: str, path: str) -> str:
+    """Join a protocol and a path (e.g. from `get_filepath_str`) back into a URI."""
+    if protocol == "file" or "://" in path:
+        return path
+    return f"{protocol}://{path}"
+
+
+def is_async(fs: AbstractFileSystem) -> bool:
+    """Check whether the filesystem can be used directly on the event loop."""
+    return isinstance(fs, AsyncFileSystem) and bool(fs.asynchronous)
+
+
+async def cat_file(
+    fs: AbstractFileSystem, path: str, start: Optional[int] = None, end: Optional[int] = None
+) -> bytes:
+    """Read a whole file, or the bytes from `start` to `end`."""
+    if is_async(fs):
+        return await fs._cat_file(path, start=start, end=end)  # type: ignore
+    return await asyncio.to_thread(fs.cat_file, path, start=start, end=end)
+
+
+async def pipe_file(fs: AbstractFileSystem, path: str, data: bytes) -> None:
+    """Write a whole file."""
+    if is_async(fs):
+        await fs._pipe_file(path, data)  # type: ignore
+    else:
+        await asyncio.to_thread(fs.pipe_file, path, data)
+
+
+async def get_file(fs: AbstractFileSystem, rpath: str, lpath: str) -> None:
+    """Download a file to a local path, without reading it all into memory."""
+    if is_async(fs):
+        await fs._get_file(rpath, lpath)  # type: ignore
+    else:
+        await asyncio.to_thread(fs.get_file, rpath, lpath)
+
+
+async def put_file(fs: AbstractFileSystem, lpath: str, rpath: str) -> None:
+    """Upload a local file, without reading it all into memory."""
+    if is_async(fs):
+        await fs._put_file(lpath, rpath)  # type: ignore
+    else:
+        await asyncio.to_thread(fs.put_file, lpath, rpath)
+
+
+async def get_files(
+    fs: AbstractFileSystem, files: Dict[str, str], batch_size: int = TRANSFER_BATCH_SIZE
+) -> None:
+    """Download many files (remote path -> local path), at most `batch_size` at a time."""
+    sem = asyncio.Semaphore(batch_size)
+
+    async def get_one(rpath: str, lpath: str) -> None:
+        async with sem:
+            await get_file(fs, rpath, lpath)
+
+    await asyncio.gather(*(get_one(rpath, lpath) for rpath, lpath in files.items()))
+
+
+async def put_files(
+    fs: AbstractFileSystem, files: Dict[str, str], batch_size: int = TRANSFER_BATCH_SIZE
+) -> None:
+    """Upload many files (local path -> remote path), at most `batch_size` at a time."""
+    sem = asyncio.Semaphore(batch_size)
+
+    async def put_one(lpath: str, rpath: str) -> None:
+        async with sem:
+            await put_file(fs, lpath, rpath)
+
+    await asyncio.gather(*(put_one(lpath, rpath) for lpath, rpath in files.items()))
+
+
+async def rm_file(fs: AbstractFileSystem, path: str) -> None:
+    """Remove a file, if it exists."""
+    try:
+        if is_async(fs):
+            await fs._rm_file(path)  # type: ignore
+        else:
+            await asyncio.to_thread(fs.rm_file, path)
+    except FileNotFoundError:
+        pass
+
+
+async def find(fs: AbstractFileSystem, path: str) -> List[str]:
+    """Find all files under `path` (recursively)."""
+    if is_async(fs):
+        return await fs._find(path)  # type: ignore
+    return await asyncio.to_thread(fs.find, path)
+
+
+async def isdir(fs: AbstractFileSystem, path: str) -> bool:
+    """Check whether `path` is a directory."""
+    if is_async(fs):
+        return await fs._isdir(path)  # type: ignore
+    return await asyncio.to_thread(fs.isdir, path)
+
+
+async def makedirs(fs: AbstractFileSystem, path: str) -> None:
+    """Create a directory (and parents), if it doesn't exist."""
+    if is_async(fs):
+        await fs._makedirs(path, exist_ok=True)  # type: ignore
+    else:
+        await asyncio.to_thread(fs.makedirs, path, exist_ok=True)
+
+
+class AsyncDatasetMixin(abc.ABC):
+    """Adds `load_async()` and `save_async()` to a dataset.
+
+    Subclasses implement `_load_async()` and `_save_async()`. Errors are wrapped
+    in `DatasetError`, the same way Kedro does for `load()` and `save()`.
+    """
+
+    @abc.abstractmethod
+    async def _load_async(self) -> Any:
+        """Load the data (see `load_async`)."""
+
+    @abc.abstractmethod
+    async def _save_async(self, data: Any) -> None:
+        """Save the data (see `save_async`)."""
+
+    async def load_async(self) -> Any:
+        """Load data without blocking the event loop."""
+        try:
+            return await self._load_async()
+        except DatasetError:
+            raise
+        except Exception as exc:
+            raise DatasetError(f"Failed while loading data from dataset {self}.\n{exc}") from exc
+
+    async def save_async(self, data: Any) -> None:
+        """Save data without blocking the event loop."""
+        if data is None:
+            raise DatasetError("Saving 'None' to a 'Dataset' is not allowed")
+        try:
+            await self._save_async(data)
+        except DatasetError:
+            raise
+        except Exception as exc:
+            raise DatasetError(f"Failed while saving data to dataset {self}.\n{exc}") from exc
@@ -0,0 +1,72 @@
+"""Compression of JSON and YAML files, via the compression layer of `fsspec`.
+
+Files are (de)compressed while they're streamed, with `fs.open(..., compression=...)`.
+The async datasets read and write whole files, so they use `compress_bytes` and
+`decompress_bytes` instead.
+"""
+
+import io
+from typing import Any, Dict, Optional
+
+from fsspec.compression import compr
+from fsspec.core import get_compression
+
+# Magic bytes at the start of compressed files
+COMPRESSION_MAGIC: Dict[bytes, str] = {
+    b"\x1f\x8b": "gzip",
+    b"BZh": "bz2",
+    b"\xfd7zXZ\x00": "xz",
+    b"\x28\xb5\x2f\xfd": "zstd",
+    b"\x04\x22\x4d\x18": "lz4",
+}
+MAGIC_LENGTH = max(len(m) for m in COMPRESSION_MAGIC)
+
+
+def check_compression(compression: Optional[str]) -> None:
+    """Check that the compression is known to `fsspec` (and installed), or is "infer"."""
+    if compression is None or compression == "infer":
+        return
+    if compression == "zip":
+        raise ValueError("Zip compression is not supported, use `PydanticZipDataset` instead.")
+    if compression not in compr:
+        raise ValueError(f"Unknown (or not installed) compression: {compression!r}")
+
+
+def resolve_compression(path: str, compression: Optional[str]) -> Optional[str]:
+    """Get the compression of the path, inferring it from the extension for "infer"."""
+    return get_compression(path, compression)
+
+
+def detect_compression(head: bytes) -> Optional[str]:
+    """Detect the compression from the first (`MAGIC_LENGTH`) bytes of a file."""
+    for magic, compression in COMPRESSION_MAGIC.items():
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+class _Buffer(io.BytesIO):
+    """Buffer that stays readable when the compressed file on top of it is closed."""
+
+    def close(self) -> None:
+        pass
+
+
+def compress_bytes(raw: bytes, compression: Optional[str]) -> bytes:
+    """Compress a whole file."""
+    if compression is None:
+        return raw
+    buf = _Buffer()
+    f: Any = compr[compression](buf, mode="wb")
+    with f:
+        f.write(raw)
+    return buf.getvalue()
+
+
+def decompress_bytes(raw: bytes, compression: Optional[str]) -> bytes:
+    """Decompress a whole file."""
+    if compression is None:
+        return raw
+    f: Any = compr[compression](io.BytesIO(raw), mode="rb")
+    with f:
+        return f.read()
@@ -1,10 +1,22 @@
 """Module for reading/writing from dicts."""
 
+import random
+import threading
 from contextlib import AbstractContextManager
+from contextvars import ContextVar
 from types import TracebackType
-from typing import Any, Dict, List, Optional, Type, Union
-
-from pydantic_kedro._pydantic import BaseModel
+from typing import Any, Dict, FrozenSet, Iterable, List, Literal, Optional, Tuple, Type, Union
+from weakref import WeakKeyDictionary
+
+from pydantic_kedro._pydantic import (
+    SHAPE_DICT,
+    SHAPE_LIST,
+    SHAPE_SINGLETON,
+    BaseModel,
+    Extra,
+    ModelField,
+    ValidationError,
+)
 
 from ._internals import import_string
 
@@ -16,6 +28,19 @@ def get_kls_path(pyd_kls: Type[BaseModel]) -> str:
     return f"{pyd_kls.__module__}.{pyd_kls.__qualname__}"
 
 
+_ORIG_ITER = BaseModel._iter
+_PATCH_LOCK = threading.Lock()
+_PATCH_COUNT = 0
+_ADD_KLS_MARK: ContextVar[bool] = ContextVar("_ADD_KLS_MARK", default=False)
+
+
+def _patched_iter(self, to_dict=False, **kwargs):  # type: ignore
+    """Iterate like `BaseModel._iter`, but add the class marker if enabled in this context."""
+    if _ADD_KLS_MARK.get():  # add 'class' as first item
+        yield KLS_MARK_STR, get_kls_path(type(self))
+    yield from _ORIG_ITER(self, to_dict=to_dict, **kwargs)
+
+
 class PatchPydanticIter(AbstractContextManager):
     """Patch Pydantic `_iter` method.
 
@@ -64,26 +89,19 @@ class PatchPydanticIter(AbstractContextManager):
     {"a": {"x": "x"}}
     ```
 
+    This is safe to use from several threads (or async tasks) at once: the method
+    is patched while any context is active, but only adds the class marker within
+    the threads/tasks that entered the context.
     """
 
-    def __init__(self) -> None:
-        self.orig_iter = BaseModel._iter
-        self.add_kls_mark = True
-
     def __enter__(self) -> None:
-        orig_iter = self.orig_iter
-        add_kls_mark = self.add_kls_mark
-
-        def _iter(self, to_dict=False, **kwargs):  # type: ignore
-            nonlocal orig_iter, add_kls_mark
-            if add_kls_mark:  # add 'class' as first item
-                kls_path = get_kls_path(type(self))
-                yield KLS_MARK_STR, kls_path
-
-            for k, v in orig_iter(self, to_dict=to_dict, **kwargs):
-                yield k, v
+        global _PATCH_COUNT
 
-        BaseModel._iter = _iter  # type: ignore
+        with _PATCH_LOCK:
+            if _PATCH_COUNT == 0:
+                BaseModel._iter = _patched_iter  # type: ignore
+            _PATCH_COUNT += 1
+        self._token = _ADD_KLS_MARK.set(True)
 
     def __exit__(
         self,
@@ -91,7 +109,13 @@ class PatchPydanticIter(AbstractContextManager):
         __exc_value: Optional[BaseException] = None,
         __traceback: Optional[TracebackType] = None,
     ) -> Optional[bool]:
-        BaseModel._iter = self.orig_iter  # type: ignore
+        global _PATCH_COUNT
+
+        _ADD_KLS_MARK.reset(self._token)
+        with _PATCH_LOCK:
+            _PATCH_COUNT -= 1
+            if _PATCH_COUNT == 0:
+                BaseModel._iter = _ORIG_ITER  # type: ignore
         return super().__exit__(__exc_type, __exc_value, __traceback)
 
 
@@ -102,33 +126,194 @@ def _classlike(obj: Any) -> bool:
     return False
 
 
-def _list_manip(value: List[Any]) -> List[Any]:
+def _list_manip(
+    value: List[Any], partial: bool = False, trusted: bool = False, validate_sample: float = 0.0
+) -> List[Any]:
     new_value = list(value)
     for i, v_i in enumerate(value):
         if _classlike(v_i):
-            new_value[i] = dict_to_model(v_i)
+            new_value[i] = dict_to_model(v_i, partial, trusted, validate_sample)
         elif isinstance(v_i, dict):
-            new_value[i] = _dict_manip(v_i)
+            new_value[i] = _dict_manip(v_i, partial, trusted, validate_sample)
         elif isinstance(v_i, list):
-            new_value[i] = _list_manip(v_i)
+            new_value[i] = _list_manip(v_i, partial, trusted, validate_sample)
         # otherwise ignore
     return new_value
 
 
-def _dict_manip(value: Dict[str, Any]) -> Dict[str, Any]:
+def _dict_manip(
+    value: Dict[str, Any], partial: bool = False, trusted: bool = False, validate_sample: float = 0.0
+) -> Dict[str, Any]:
     new_value = dict(value)
     for k, v_k in value.items():
         if _classlike(v_k):
-            new_value[k] = dict_to_model(v_k)
+            new_value[k] = dict_to_model(v_k, partial, trusted, validate_sample)
         elif isinstance(v_k, dict):
-            new_value[k] = _dict_manip(v_k)
+            new_value[k] = _dict_manip(v_k, partial, trusted, validate_sample)
         elif isinstance(v_k, list):
-            new_value[k] = _list_manip(v_k)
+            new_value[k] = _list_manip(v_k, partial, trusted, validate_sample)
     return new_value
 
 
-def dict_to_model(dct: Union[Dict[str, Any], List[Any]]) -> BaseModel:
-    """Convert dictionary (or, optionally, list) to model."""
+def _construct_partial(pyd_kls: Type[BaseModel], keywords: Dict[str, Any]) -> BaseModel:
+    """Create a model from only some of its fields.
+
+    The given fields are validated; missing fields get their defaults, or are left unset.
+    """
+    values: Dict[str, Any] = {}
+    errors = []
+    for name, field in pyd_kls.__fields__.items():
+        if field.alias in keywords:
+            raw = keywords[field.alias]
+        elif name in keywords:
+            raw = keywords[name]
+        else:
+            continue
+        value, err = field.validate(raw, values, loc=field.alias, cls=pyd_kls)  # type: ignore
+        if err:
+            errors.append(err)
+        else:
+            values[name] = value
+    if errors:
+        raise ValidationError(errors, pyd_kls)
+    return pyd_kls.construct(_fields_set=set(values.keys()), **values)
+
+
+# Types that are stored as-is in JSON/YAML, so loading them needs no validation
+_STORED_AS_IS = (str, int, float, bool, list, dict, type(None), Any)
+
+
+def _stored_as_is(field: ModelField) -> bool:
+    """Whether stored values of the field are already of the right (Python) type."""
+    if field.class_validators:
+        return False  # validators may change the value
+    if field.shape == SHAPE_DICT and field.key_field is not None:
+        if field.key_field.type_ not in (str, Any):
+            return False
+    elif field.shape not in (SHAPE_SINGLETON, SHAPE_LIST):
+        return False  # e.g. tuples and sets are stored as lists
+    if field.sub_fields:  # item types, or members of a union
+        return all(_stored_as_is(f) for f in field.sub_fields)
+    tp = field.type_
+    if tp in _STORED_AS_IS:
+        return True
+    # Nested models are created from their class marker
+    return isinstance(tp, type) and issubclass(tp, BaseModel)
+
+
+_VALIDATED_CACHE: "WeakKeyDictionary[Type[BaseModel], FrozenSet[str]]" = WeakKeyDictionary()
+_VALIDATED_LOCK = threading.Lock()
+
+
+def get_validated_fields(pyd_kls: Type[BaseModel]) -> FrozenSet[str]:
+    """Get the (cached) names of the fields that are validated even for trusted loads."""
+    with _VALIDATED_LOCK:
+        res = _VALIDATED_CACHE.get(pyd_kls)
+    if res is None:
+        res = frozenset(n for n, f in pyd_kls.__fields__.items() if not _stored_as_is(f))
+        with _VALIDATED_LOCK:
+            res = _VALIDATED_CACHE.setdefault(pyd_kls, res)
+    return res
+
+
+def _construct_trusted(
+    pyd_kls: Type[BaseModel], keywords: Dict[str, Any], partial: bool = False
+) -> BaseModel:
+    """Create a model from trusted data, without validating it.
+
+    Only the fields whose stored values differ from their Python type (e.g. datetimes,
+    enums and tuples, see `get_validated_fields`) or that have validators are validated.
+    Missing fields get their defaults. If a required field is missing (and this isn't
+    a `partial` load), the model is validated instead, which raises the usual error.
+    Root validators are not run.
+    """
+    validated = get_validated_fields(pyd_kls)
+    by_name = pyd_kls.__config__.allow_population_by_field_name
+    values: Dict[str, Any] = {}
+    errors = []
+    used = set()
+    for name, field in pyd_kls.__fields__.items():
+        if field.alias in keywords:
+            key = field.alias
+        elif by_name and name in keywords:
+            key = name
+        elif field.required and not partial:
+            return pyd_kls(**keywords)
+        else:
+            continue
+        used.add(key)
+        if name not in validated:
+            values[name] = keywords[key]
+            continue
+        value, err = field.validate(keywords[key], values, loc=field.alias, cls=pyd_kls)  # type: ignore
+        if err:
+            errors.append(err)
+        else:
+            values[name] = value
+    if errors:
+        raise ValidationError(errors, pyd_kls)
+    fields_set = set(values.keys())
+    if pyd_kls.__config__.extra == Extra.allow:
+        extra = {k: v for k, v in keywords.items() if k not in used}
+        values.update(extra)
+        fields_set.update(extra)
+    return pyd_kls.construct(_fields_set=fields_set, **values)
+
+
+def check_partial(fields: Optional[Iterable[str]], partial: str) -> Optional[List[str]]:
+    """Check the partial-load options, and return a copy of the field paths (if set)."""
+    if partial not in ("model", "dict"):
+        raise ValueError(f"Unknown partial result type: {partial!r}")
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        raise TypeError(f"The `fields` must be a list of field paths, but got a string: {fields!r}")
+    return list(fields)
+
+
+def check_validate_sample(validate_sample: float) -> None:
+    """Check the fraction of models to validate for trusted loads."""
+    if not 0 <= validate_sample <= 1:
+        raise ValueError(f"The `validate_sample` must be between 0 and 1, but got {validate_sample!r}")
+
+
+def split_field_path(path: str) -> List[str]:
+    """Split a `.`-separated field path, e.g. `"nested.z"`, into its parts."""
+    return [p for p in path.split(".") if p != ""]
+
+
+def select_fields(dct: Dict[str, Any], fields: Iterable[str]) -> Dict[str, Any]:
+    """Keep only the top-level keys that are selected by the field paths (and the class marker)."""
+    top = {split_field_path(f)[0] for f in fields if split_field_path(f)}
+    return {k: v for k, v in dct.items() if k == KLS_MARK_STR or k in top}
+
+
+def partial_result(
+    model: BaseModel, fields: Iterable[str], partial: Literal["model", "dict"] = "model"
+) -> Union[BaseModel, Dict[str, Any]]:
+    """Return the partially-loaded model, or a dict of its selected top-level fields."""
+    if partial == "model":
+        return model
+    elif partial == "dict":
+        top = [split_field_path(f)[0] for f in fields if split_field_path(f)]
+        return {k: getattr(model, k) for k in dict.fromkeys(top) if k in model.__fields_set__}
+    raise ValueError(f"Unknown partial result type: {partial!r}")
+
+
+def dict_to_model(
+    dct: Union[Dict[str, Any], List[Any]],
+    partial: bool = False,
+    trusted: bool = False,
+    validate_sample: float = 0.0,
+) -> BaseModel:
+    """Convert dictionary (or, optionally, list) to model.
+
+    If `partial` is set, models are created from only the fields present in the data:
+    these are validated, and the rest get their defaults (or are left unset).
+
+    If `trusted` is set, models are created without validation (see `_construct_trusted`),
+    except for a random `validate_sample` fraction of them, which are validated as usual.
+    """
     if isinstance(dct, list):
         dct = {"__root__": dct}
 
@@ -143,17 +328,99 @@ def dict_to_model(dct: Union[Dict[str, Any], List[Any]]) -> BaseModel:
     raw = dict(dct)
     for key, value in dct.items():
         if _classlike(value):
-            raw[key] = dict_to_model(value)
+            raw[key] = dict_to_model(value, partial, trusted, validate_sample)
         elif isinstance(value, list):
-            raw[key] = _list_manip(value)
+            raw[key] = _list_manip(value, partial, trusted, validate_sample)
         elif isinstance(value, dict):
-            raw[key] = _dict_manip(value)
+            raw[key] = _dict_manip(value, partial, trusted, validate_sample)
         # otherwise ignore
     keywords = dict(raw)
     del keywords[KLS_MARK_STR]
+    return _build_model(pyd_kls, keywords, partial, trusted, validate_sample)
+
+
+def _build_model(
+    pyd_kls: Type[BaseModel],
+    keywords: Dict[str, Any],
+    partial: bool = False,
+    trusted: bool = False,
+    validate_sample: float = 0.0,
+) -> BaseModel:
+    if trusted and (validate_sample <= 0 or random.random() >= validate_sample):
+        return _construct_trusted(pyd_kls, keywords, partial)
+    if partial:
+        return _construct_partial(pyd_kls, keywords)
     return pyd_kls(**keywords)  # Consider parse_obj_as(pyd_kls, keywords) ?
 
 
+_STARTS = ("start_map", "start_array")
+_ENDS = ("end_map", "end_array")
+
+
+def events_to_model(
+    events: Iterable[Tuple[str, Any]],
+    fields: Optional[Iterable[str]] = None,
+    partial: bool = False,
+    trusted: bool = False,
+    validate_sample: float = 0.0,
+) -> BaseModel:
+    """Create a model from a stream of JSON parser events, while reading it.
+
+    The events are `(event, value)` pairs, as from `ijson.basic_parse`. Each nested model
+    is created as soon as its JSON object ends, so the whole dict tree is never in memory
+    at once. If `fields` is set, the values of the other top-level keys are skipped
+    (see `select_fields`). See `dict_to_model` for the other parameters.
+    """
+    top = None if fields is None else {split_field_path(f)[0] for f in fields if split_field_path(f)}
+    stack: List[Any] = []  # open dicts and lists
+    keys: List[Any] = []  # the current key of each open dict
+    result: List[Any] = []
+    skip_depth = -1  # while skipping a value, the nesting depth within it
+
+    def add(value: Any) -> None:
+        if not stack:
+            result.append(value)
+        elif isinstance(stack[-1], list):
+            stack[-1].append(value)
+        else:
+            stack[-1][keys[-1]] = value
+
+    for event, value in events:
+        if skip_depth >= 0:
+            if event in _STARTS:
+                skip_depth += 1
+            elif event in _ENDS:
+                skip_depth -= 1
+            if skip_depth == 0:
+                skip_depth = -1
+            continue
+        if event == "map_key":
+            keys[-1] = value
+            if top is not None and len(stack) == 1 and value != KLS_MARK_STR and value not in top:
+                skip_depth = 0  # skip the next value
+                continue
+        elif event == "start_map":
+            stack.append({})
+            keys.append(None)
+        elif event == "start_array":
+            stack.append([])
+            keys.append(None)
+        elif event in _ENDS:
+            value = stack.pop()
+            keys.pop()
+            if event == "end_map" and KLS_MARK_STR in value:
+                pyd_kls = import_string(value.pop(KLS_MARK_STR))
+                assert issubclass(pyd_kls, BaseModel)
+                value = _build_model(pyd_kls, value, partial, trusted, validate_sample)
+            add(value)
+        else:  # scalar
+            add(value)
+
+    if not result or not isinstance(result[0], BaseModel):
+        raise ValueError("Model is not a supported type.")
+    return result[0]
+
+
 def model_to_dict(model: BaseModel) -> Dict[str, Any]:
     """Conver model to dictionary."""
     with PatchPydanticIter():
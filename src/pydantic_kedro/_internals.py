@@ -1,9 +1,11 @@
 """Functions for internal use."""
 
-from typing import Any, Callable, Dict, Type
+import threading
+import warnings
+from typing import Any, Callable, Dict, Optional, Type
+from weakref import WeakKeyDictionary
 
 from kedro.io.core import AbstractDataset
-from kedro_datasets.pickle.pickle_dataset import PickleDataset
 
 from ._pydantic import BaseModel, create_model
 
@@ -47,10 +49,78 @@ def import_string(dotted_path: str) -> Any:
     return obj
 
 
+def get_config_value(kls: Type[BaseModel], name: str, default: Any = None) -> Any:
+    """Get a config value, looking through the bases of `kls` until one defines it."""
+    for base_i in kls.mro():
+        cfg_i = getattr(base_i, "__config__", None)
+        if cfg_i is None:
+            continue
+        value = getattr(cfg_i, name, None)
+        if value is not None:
+            return value
+    return default
+
+
+def get_builtin_kedro_map(kls: Type[BaseModel]) -> Dict[Type, Callable[[str], AbstractDataset]]:
+    """Get the type-to-dataset mapping for built-in datasets enabled in the config of `kls`.
+
+    These have lower priority than the user-defined `kedro_map`.
+    """
+    builtin_map: Dict[Type, Callable[[str], AbstractDataset]] = {}
+    if get_config_value(kls, "kedro_npy", False):
+        try:
+            import numpy as np
+        except ImportError:  # no arrays to save anyways
+            pass
+        else:
+            from pydantic_kedro.datasets.npy import NpyDataset
+
+            mmap_mode = get_config_value(kls, "kedro_npy_mmap_mode", "r")
+            if mmap_mode not in ("r", "r+", "c", False):
+                raise ValueError(f"Unknown `kedro_npy_mmap_mode`: {mmap_mode!r}")
+
+            def npy_ds(path: str) -> AbstractDataset:
+                return NpyDataset(filepath=path, mmap_mode=mmap_mode or None)
+
+            builtin_map[np.ndarray] = npy_ds
+
+    if get_config_value(kls, "kedro_arrow", False):
+        try:
+            import pyarrow as pa
+        except ImportError:
+            warnings.warn("`kedro_arrow` is set, but `pyarrow` is not installed; ignoring it.")
+        else:
+            from pydantic_kedro.datasets.arrow import ArrowDataset
+
+            memory_map = bool(get_config_value(kls, "kedro_arrow_memory_map", True))
+
+            def arrow_table_ds(path: str) -> AbstractDataset:
+                return ArrowDataset(filepath=path, output="arrow", memory_map=memory_map)
+
+            def arrow_pandas_ds(path: str) -> AbstractDataset:
+                return ArrowDataset(filepath=path, output="pandas", memory_map=memory_map)
+
+            builtin_map[pa.Table] = arrow_table_ds
+            try:
+                import pandas as pd
+            except ImportError:  # no dataframes to save anyways
+                pass
+            else:
+                builtin_map[pd.DataFrame] = arrow_pandas_ds
+    return builtin_map
+
+
 def get_kedro_map(kls: Type[BaseModel]) -> Dict[Type, Callable[[str], AbstractDataset]]:
     """Get type-to-dataset mapper for a Pydantic class."""
     if not (isinstance(kls, type) and issubclass(kls, BaseModel)):
         raise TypeError(f"Must pass a BaseModel subclass; got {kls!r}")
+    kedro_map = get_builtin_kedro_map(kls)
+    kedro_map.update(get_user_kedro_map(kls))
+    return kedro_map
+
+
+def get_user_kedro_map(kls: Type[BaseModel]) -> Dict[Type, Callable[[str], AbstractDataset]]:
+    """Get the type-to-dataset mapping from the `kedro_map` in the config of `kls` and its bases."""
     kedro_map: Dict[Type, Callable[[str], AbstractDataset]] = {}
     # Go through bases of `kls` in order
     base_classes = reversed(kls.mro())
@@ -117,9 +187,77 @@ def get_kedro_default(kls: Type[BaseModel]) -> Callable[[str], AbstractDataset]:
                 f" but got {default!r}"
             )
 
+    from kedro_datasets.pickle.pickle_dataset import PickleDataset
+
     return PickleDataset
 
 
+DatasetFactory = Callable[[str], AbstractDataset]
+
+
+class KedroDispatch:
+    """Dataset factory lookup for a model class, compiled from its config.
+
+    Like `functools.singledispatch`, types are resolved along their MRO (so the most specific
+    `kedro_map` entry wins) and the result is memoized per type. The user's `kedro_map` is
+    searched first, and the built-in datasets only if no user entry matches.
+    Virtual base classes (e.g. registered ABCs) are found with an `issubclass` fallback.
+    """
+
+    def __init__(self, kls: Type[BaseModel]) -> None:
+        self.user_kedro_map: Dict[Type, DatasetFactory] = get_user_kedro_map(kls)
+        self.builtin_kedro_map: Dict[Type, DatasetFactory] = get_builtin_kedro_map(kls)
+        self.kedro_default: DatasetFactory = get_kedro_default(kls)
+        self._cache: Dict[Type, Optional[DatasetFactory]] = {}
+
+    def dispatch(self, tp: Type) -> Optional[DatasetFactory]:
+        """Get the dataset factory for the type, or `None` if `kedro_default` should be used."""
+        try:
+            return self._cache[tp]
+        except KeyError:
+            pass
+        res = self._resolve(tp)
+        self._cache[tp] = res
+        return res
+
+    def is_user_mapped(self, tp: Type) -> bool:
+        """Check whether the type is mapped by the user's `kedro_map` (rather than built-ins)."""
+        factory = self.dispatch(tp)
+        return factory is not None and any(factory is v for v in self.user_kedro_map.values())
+
+    def _resolve(self, tp: Type) -> Optional[DatasetFactory]:
+        # User entries take precedence over built-ins, even for base classes of `tp`
+        for kedro_map in (self.user_kedro_map, self.builtin_kedro_map):
+            for base in tp.__mro__:
+                if base in kedro_map:
+                    return kedro_map[base]
+            for k, v in kedro_map.items():
+                if issubclass(tp, k):
+                    return v
+        return None
+
+
+_DISPATCH_CACHE: "WeakKeyDictionary[Type[BaseModel], KedroDispatch]" = WeakKeyDictionary()
+_DISPATCH_LOCK = threading.Lock()
+
+
+def get_kedro_dispatch(kls: Type[BaseModel]) -> KedroDispatch:
+    """Get the (cached) dataset factory lookup for a Pydantic class."""
+    with _DISPATCH_LOCK:
+        res = _DISPATCH_CACHE.get(kls)
+    if res is None:
+        res = KedroDispatch(kls)
+        with _DISPATCH_LOCK:
+            res = _DISPATCH_CACHE.setdefault(kls, res)
+    return res
+
+
+def clear_dispatch_cache() -> None:
+    """Clear the cached dataset lookups, e.g. after changing the `Config` of a model class."""
+    with _DISPATCH_LOCK:
+        _DISPATCH_CACHE.clear()
+
+
 def create_expanded_model(model: BaseModel) -> BaseModel:
     """Create an 'expanded' model with additional metadata."""
     pyd_kls = type(model)
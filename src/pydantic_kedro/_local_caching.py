@@ -7,14 +7,27 @@ libraries (e.g. Spark) not working with `fsspec` URLs.
 Ideally we would just use a `tempfile.TemporaryDirectory`, however because some
 libraries do lazy loading (Spark, Polars, so many...) we actually need to
 instantiate the files locally.
+
+Each load stages its files in a new directory from `make_staging_dir()`.
+If all members were read eagerly, the directory is removed right after loading
+(`release_staging_dir()`). Otherwise, it is kept (`keep_staging_dir()`) until the dataset
+is released, the cache quota evicts it (oldest first), or the application exits.
+We can't tie directories to the loaded models themselves, since Pydantic models
+don't support weak references. But if the lazy members are all memory-mapped,
+the directory is also removed once these objects are garbage-collected.
 """
 
 import atexit
 import logging
 import shutil
 import tempfile
+import threading
+import warnings
+import weakref
+from collections import OrderedDict
 from pathlib import Path
-from typing import Union
+from typing import Any, List, Optional, Sequence, Union
+from uuid import uuid4
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +40,10 @@ DO NOT MODIFY - use `set_cache_dir(path)` and `get_cache_dir()` instead.
 TODO: Consider using module-level getattr. See https://peps.python.org/pep-0562/
 """
 
+_CACHE_QUOTA: Optional[int] = None
+_STAGING_DIRS: "OrderedDict[Path, int]" = OrderedDict()  # kept directory -> size, oldest first
+_STAGING_LOCK = threading.Lock()
+
 
 def set_cache_dir(path: Union[Path, str]) -> None:
     """Set the 'local' caching directory for pydantic-kedro.
@@ -56,6 +73,124 @@ def get_cache_dir() -> Path:
     return PYD_KEDRO_CACHE_DIR
 
 
+def set_cache_quota(max_bytes: Optional[int]) -> None:
+    """Set the maximum disk usage (in bytes) of kept staging directories, or `None` for no limit.
+
+    When the quota is exceeded, the oldest staging directories are removed with a warning.
+    Lazily-loaded members (e.g. memory-mapped arrays or Spark dataframes) of models loaded
+    from these directories may then fail, so set the quota well above your working set.
+    """
+    global _CACHE_QUOTA
+
+    if max_bytes is not None and max_bytes < 0:
+        raise ValueError(f"The cache quota must be non-negative, but got {max_bytes!r}")
+    _CACHE_QUOTA = max_bytes
+    with _STAGING_LOCK:
+        _enforce_quota()
+
+
+def get_cache_quota() -> Optional[int]:
+    """Get the maximum disk usage (in bytes) of kept staging directories, if set."""
+    return _CACHE_QUOTA
+
+
+def get_cache_usage() -> int:
+    """Get the disk usage (in bytes) of kept staging directories."""
+    with _STAGING_LOCK:
+        return sum(_STAGING_DIRS.values())
+
+
+def make_staging_dir() -> Path:
+    """Make a new local staging directory in the cache directory."""
+    path = get_cache_dir() / str(uuid4()).replace("-", "")
+    path.mkdir(exist_ok=False, parents=True)
+    return path
+
+
+def keep_staging_dir(path: Path) -> None:
+    """Keep the staging directory, since loaded objects may still read from it."""
+    size = sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+    with _STAGING_LOCK:
+        _STAGING_DIRS[path] = size
+        _STAGING_DIRS.move_to_end(path)
+        _enforce_quota(keep=path)
+
+
+def release_staging_dir(path: Path) -> None:
+    """Remove the staging directory."""
+    with _STAGING_LOCK:
+        _STAGING_DIRS.pop(path, None)
+    shutil.rmtree(path, ignore_errors=True)
+
+
+class StagingDirs:
+    """Staging directories kept for the objects loaded by a single dataset."""
+
+    def __init__(self) -> None:
+        self._dirs: List[Path] = []
+        self._lock = threading.Lock()
+
+    def keep(self, path: Path, objects: Sequence[Any] = ()) -> None:
+        """Keep the staging directory until `release()` is called (or it is evicted).
+
+        If `objects` are given, the directory is also removed once they are all garbage-collected.
+        Objects that don't support weak references are ignored, and then it is only kept.
+        """
+        keep_staging_dir(path)
+        with self._lock:
+            self._dirs.append(path)
+        if not objects or not all(_supports_weakref(obj) for obj in objects):
+            return
+        remaining = [len(objects)]
+
+        def collected() -> None:
+            with self._lock:
+                remaining[0] -= 1
+                if remaining[0] > 0 or path not in self._dirs:
+                    return
+                self._dirs.remove(path)
+            release_staging_dir(path)
+
+        for obj in objects:
+            weakref.finalize(obj, collected)
+
+    def release(self) -> None:
+        """Remove all kept staging directories."""
+        with self._lock:
+            dirs, self._dirs = self._dirs, []
+        for path in dirs:
+            release_staging_dir(path)
+
+
+def _supports_weakref(obj: Any) -> bool:
+    try:
+        weakref.ref(obj)
+    except TypeError:
+        return False
+    return True
+
+
+def _enforce_quota(keep: Optional[Path] = None) -> None:
+    """Evict the oldest staging directories (except `keep`) until within the quota.
+
+    This must be called while holding `_STAGING_LOCK`.
+    """
+    if _CACHE_QUOTA is None:
+        return
+    total = sum(_STAGING_DIRS.values())
+    for path in list(_STAGING_DIRS.keys()):
+        if total <= _CACHE_QUOTA:
+            break
+        if path == keep:
+            continue
+        total -= _STAGING_DIRS.pop(path)
+        warnings.warn(
+            f"Evicting staging directory {path} to stay within the cache quota of {_CACHE_QUOTA} bytes;"
+            " lazily-loaded members of models loaded from it may fail."
+        )
+        shutil.rmtree(path, ignore_errors=True)
+
+
 def remove_temp_objects() -> None:
     """Remove temporary objects at exist.
 
@@ -66,6 +201,8 @@ def remove_temp_objects() -> None:
     """
     global PYD_KEDRO_CACHE_DIR, _INITIAL_TMPDIR
 
+    with _STAGING_LOCK:
+        _STAGING_DIRS.clear()
     shutil.rmtree(PYD_KEDRO_CACHE_DIR, ignore_errors=True)
     PYD_KEDRO_CACHE_DIR.unlink(missing_ok=True)
     if _INITIAL_TMPDIR is not None:
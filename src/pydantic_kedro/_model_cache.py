@@ -0,0 +1,139 @@
+"""Process-level cache of loaded models (see the `cache` option of `PydanticAutoDataset`).
+
+Entries are keyed by the URI (and the load options), and are only used while the
+stored version is unchanged: each cached load first checks the modification time
+or ETag of the file (or, for folders, of the metadata file), which is a single
+metadata request instead of a full load.
+
+The cache is a LRU of at most `max_entries` models. Concurrent loads of the same
+key and version are coalesced into one load, and the other callers wait for it.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from copy import deepcopy
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import fsspec
+
+logger = logging.getLogger(__name__)
+
+# Info fields that change when a file is rewritten, depending on the filesystem
+_VERSION_FIELDS = (
+    "ETag",
+    "etag",
+    "md5Hash",
+    "mtime",
+    "LastModified",
+    "last_modified",
+    "updated",
+    "created",
+)
+
+Version = Tuple[Tuple[str, str], ...]
+CacheKey = Tuple[str, Hashable]
+
+_MAX_ENTRIES = 128
+_ENTRIES: "OrderedDict[CacheKey, Tuple[Version, Any]]" = OrderedDict()  # oldest first
+_INFLIGHT: Dict[Tuple[CacheKey, Version], "Future[Any]"] = {}
+_LOCK = threading.Lock()
+
+
+def set_model_cache_size(max_entries: int) -> None:
+    """Set the maximum number of models kept in the model cache, evicting the least recently used."""
+    global _MAX_ENTRIES
+
+    if max_entries < 0:
+        raise ValueError(f"The `max_entries` must be non-negative, but got {max_entries!r}")
+    with _LOCK:
+        _MAX_ENTRIES = max_entries
+        _evict_lru()
+
+
+def clear_model_cache() -> None:
+    """Remove all models from the model cache."""
+    with _LOCK:
+        _ENTRIES.clear()
+
+
+def evict_model(uri: str) -> None:
+    """Remove all cached models (with any load options) of the URI."""
+    with _LOCK:
+        for key in [k for k in _ENTRIES if k[0] == uri]:
+            del _ENTRIES[key]
+
+
+def _evict_lru() -> None:
+    while len(_ENTRIES) > _MAX_ENTRIES:
+        _ENTRIES.popitem(last=False)
+
+
+def stored_version(uri: str) -> Version:
+    """Get the stored version of the model at `uri`, from the file (or folder metadata) info."""
+    fs, path = fsspec.core.url_to_fs(uri)
+    info = fs.info(path)
+    if info.get("type") == "directory":
+        from pydantic_kedro.datasets.folder import META_FILES
+
+        for name in META_FILES:
+            try:
+                info = fs.info(f"{path.rstrip('/')}/{name}")
+                break
+            except FileNotFoundError:
+                continue
+    fields = tuple((k, str(info[k])) for k in _VERSION_FIELDS if info.get(k) is not None)
+    return (("name", str(info.get("name"))), ("size", str(info.get("size"))), *fields)
+
+
+def load_cached(uri: str, load: Callable[[], Any], variant: Hashable = None, copy: bool = False) -> Any:
+    """Load the model at `uri` from the cache, or with `load()` (once, for concurrent callers).
+
+    Parameters
+    ----------
+    uri : str
+        The URI of the model.
+    load : callable
+        Loads the model, if it isn't cached.
+    variant : hashable
+        Load options that change the result (e.g. the fields to load).
+    copy : bool
+        Whether to return a deep copy, so that callers can't change the cached model.
+    """
+    key: CacheKey = (uri, variant)
+    version = stored_version(uri)
+    owner = False
+    with _LOCK:
+        entry = _ENTRIES.get(key)
+        if entry is not None and entry[0] == version:
+            _ENTRIES.move_to_end(key)
+            res = entry[1]
+            future: Optional["Future[Any]"] = None
+        else:
+            future = _INFLIGHT.get((key, version))
+            if future is None:
+                future = _INFLIGHT[(key, version)] = Future()
+                owner = True
+
+    if future is not None:
+        if owner:
+            try:
+                res = load()
+            except BaseException as exc:
+                future.set_exception(exc)
+                raise
+            else:
+                future.set_result(res)
+                with _LOCK:
+                    if _MAX_ENTRIES > 0:
+                        _ENTRIES[key] = (version, res)
+                        _ENTRIES.move_to_end(key)
+                        _evict_lru()
+            finally:
+                with _LOCK:
+                    _INFLIGHT.pop((key, version), None)
+        else:
+            logger.debug("Waiting for concurrent load of %s", uri)
+            res = future.result()
+    return deepcopy(res) if copy else res
@@ -0,0 +1,85 @@
+"""Registry of datasets that are being loaded ahead of time (see `PrefetchHooks`).
+
+A prefetched load runs `dataset.load()` in a background thread. When the dataset is
+loaded for real, its `_load()` claims the result via `claim_prefetched()` instead of
+loading again. Prefetched results are handed out once.
+"""
+
+import logging
+import threading
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from kedro.io.core import AbstractDataset
+
+logger = logging.getLogger(__name__)
+
+_LOCK = threading.Lock()
+# id(dataset) -> (dataset, future, callback); we keep the dataset, so that its id isn't reused
+_PREFETCHED: Dict[int, Tuple[AbstractDataset, "Future[Any]", Optional[Callable[[], None]]]] = {}
+_LOCAL = threading.local()
+
+
+def is_prefetching() -> bool:
+    """Check whether the current thread is running a prefetched load."""
+    return getattr(_LOCAL, "prefetching", False)
+
+
+def _run_prefetch(ds: AbstractDataset) -> Any:
+    _LOCAL.prefetching = True
+    try:
+        return ds.load()
+    finally:
+        _LOCAL.prefetching = False
+
+
+def prefetch(
+    ds: AbstractDataset, executor: Executor, on_release: Optional[Callable[[], None]] = None
+) -> "Future[Any]":
+    """Start loading the dataset in the background, so that its next load can claim the result.
+
+    `on_release` is called once the result is claimed or discarded.
+    """
+    with _LOCK:
+        if id(ds) in _PREFETCHED:
+            return _PREFETCHED[id(ds)][1]
+        future = executor.submit(_run_prefetch, ds)
+        _PREFETCHED[id(ds)] = (ds, future, on_release)
+    return future
+
+
+def claim_prefetched(ds: AbstractDataset) -> Optional[Any]:
+    """Take the prefetched result of the dataset, waiting for it if needed.
+
+    Returns `None` if nothing was prefetched, or if the prefetched load failed,
+    so that the caller loads the dataset normally.
+    """
+    if is_prefetching():
+        return None
+    with _LOCK:
+        entry = _PREFETCHED.pop(id(ds), None)
+    if entry is None:
+        return None
+    _, future, on_release = entry
+    try:
+        return future.result()
+    except Exception:
+        logger.debug("Prefetching %s failed, loading it again.", ds, exc_info=True)
+        return None
+    finally:
+        if on_release is not None:
+            on_release()
+
+
+def discard_prefetched(datasets: Optional[Iterable[AbstractDataset]] = None) -> None:
+    """Forget prefetched results (of `datasets`, or all) that weren't claimed.
+
+    Loads that didn't start yet are cancelled.
+    """
+    with _LOCK:
+        keys = list(_PREFETCHED) if datasets is None else [id(ds) for ds in datasets]
+        entries = [_PREFETCHED.pop(k) for k in keys if k in _PREFETCHED]
+    for _, future, on_release in entries:
+        future.cancel()
+        if on_release is not None:
+            on_release()
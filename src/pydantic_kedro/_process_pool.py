@@ -0,0 +1,173 @@
+"""Saving and loading folder members in worker processes.
+
+Pickling big object graphs, or writing compressed files, holds the GIL, so threads
+don't help. Instead, each `(KedroDatasetSpec, object)` pair is sent to a worker process,
+which creates the dataset from its spec and saves the object (or loads it, and sends
+it back).
+
+Objects are sent with pickle protocol 5: big buffers, such as the data of NumPy arrays
+and pandas dataframes, are passed out-of-band in shared memory instead of the pipe.
+Shared memory blocks are always unlinked by the parent process, once they're read.
+"""
+
+import pickle
+import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing.shared_memory import SharedMemory
+
+    from pydantic_kedro.datasets.folder import KedroDatasetSpec
+
+# Buffers at least this big are passed in shared memory, smaller ones are pickled in-band
+SHM_MIN_BYTES = 1 << 20
+
+# Pickled object, and the (name, size) of the shared memory blocks with its buffers
+Packed = Tuple[bytes, List[Tuple[str, int]]]
+
+_pools: Dict[int, "ProcessPoolExecutor"] = {}
+_pools_lock = threading.Lock()
+
+
+def check_processes(processes: int) -> None:
+    """Check the number of worker processes (0 means saving/loading in this process)."""
+    if processes < 0:
+        raise ValueError(f"The number of `processes` must not be negative, but got {processes!r}")
+
+
+def pack(obj: Any) -> Tuple[Packed, List["SharedMemory"]]:
+    """Pickle the object, with big buffers in (new) shared memory blocks.
+
+    The caller must `free` the returned blocks once the receiver has unpacked them.
+    """
+    from multiprocessing.shared_memory import SharedMemory
+
+    blocks: List[SharedMemory] = []
+    refs: List[Tuple[str, int]] = []
+
+    def to_shm(buf: pickle.PickleBuffer) -> bool:
+        raw = buf.raw()
+        if raw.nbytes < SHM_MIN_BYTES:
+            return True  # in-band
+        shm = SharedMemory(create=True, size=raw.nbytes)
+        blocks.append(shm)
+        refs.append((shm.name, raw.nbytes))
+        shm.buf[: raw.nbytes] = raw
+        return False
+
+    try:
+        payload = pickle.dumps(obj, protocol=5, buffer_callback=to_shm)
+    except BaseException:
+        free(blocks)
+        raise
+    return (payload, refs), blocks
+
+
+def unpack(packed: Packed, unlink: bool = False) -> Any:
+    """Unpickle the object, copying its buffers out of shared memory.
+
+    If `unlink` is set, the shared memory blocks are freed (even if unpickling fails).
+    """
+    from multiprocessing.shared_memory import SharedMemory
+
+    payload, refs = packed
+    buffers: List[bytearray] = []
+    try:
+        for name, size in refs:
+            shm = SharedMemory(name=name)
+            try:
+                with shm.buf[:size] as view:
+                    buffers.append(bytearray(view))
+            finally:
+                shm.close()
+    finally:
+        if unlink:
+            free_refs(packed)
+    return pickle.loads(payload, buffers=buffers)
+
+
+def free(blocks: List["SharedMemory"]) -> None:
+    """Close and unlink shared memory blocks."""
+    for shm in blocks:
+        shm.close()
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def save_task(spec: "KedroDatasetSpec", base_path: str, keep_protocol: bool, packed: Packed) -> None:
+    """Save the object with the dataset of `spec` (in a worker process)."""
+    obj = unpack(packed)
+    spec.to_dataset(base_path=base_path, keep_protocol=keep_protocol).save(obj)
+
+
+def load_task(spec: "KedroDatasetSpec", base_path: str, keep_protocol: bool) -> Packed:
+    """Load the object with the dataset of `spec` (in a worker process).
+
+    The shared memory blocks are only closed here, and the receiver must unlink them
+    (see `unpack` and `free_refs`).
+    """
+    obj = spec.to_dataset(base_path=base_path, keep_protocol=keep_protocol).load()
+    packed, blocks = pack(obj)
+    for shm in blocks:
+        shm.close()
+    return packed
+
+
+def free_refs(packed: Packed) -> None:
+    """Unlink the shared memory blocks of a packed object, e.g. a `load_task` result."""
+    from multiprocessing.shared_memory import SharedMemory
+
+    for name, _ in packed[1]:
+        try:
+            shm = SharedMemory(name=name)
+        except FileNotFoundError:
+            continue
+        free([shm])
+
+
+def discard(futures: Iterable[Future], cleanup: Optional[Callable[[Any], None]] = None) -> None:
+    """Cancel the futures, or wait for them and `cleanup` their results (errors are ignored)."""
+    for fut in futures:
+        if fut.cancel():
+            continue
+        try:
+            res = fut.result()
+        except BaseException:
+            continue
+        if cleanup is not None:
+            cleanup(res)
+
+
+def submit(processes: int, fn: Callable[..., Any], *args: Any) -> Future:
+    """Run `fn(*args)` in the (shared) pool of `processes` worker processes.
+
+    Pools are created on first use, and kept until the interpreter exits.
+    Workers are spawned rather than forked, as forking a process with threads
+    (e.g. the event loop of `fsspec`) may deadlock.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+    from multiprocessing import get_context
+
+    with _pools_lock:
+        pool = _pools.get(processes)
+        if pool is None:
+            pool = _pools[processes] = ProcessPoolExecutor(processes, mp_context=get_context("spawn"))
+        try:
+            return pool.submit(fn, *args)
+        except BrokenProcessPool:  # a worker died, e.g. killed for using too much memory
+            pool = _pools[processes] = ProcessPoolExecutor(processes, mp_context=get_context("spawn"))
+            return pool.submit(fn, *args)
+
+
+def shutdown_pools() -> None:
+    """Stop all worker processes."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown()
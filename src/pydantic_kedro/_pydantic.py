@@ -8,7 +8,13 @@ __all__ = [
     "BaseSettings",
     "Extra",
     "Field",
+    "ModelField",
+    "SHAPE_DICT",
+    "SHAPE_LIST",
+    "SHAPE_SINGLETON",
+    "ValidationError",
     "create_model",
+    "validator",
 ]
 
 import pydantic
@@ -16,8 +22,28 @@ import pydantic
 PYDANTIC_VERSION = pydantic.version.VERSION
 
 if PYDANTIC_VERSION > "2" and PYDANTIC_VERSION < "3":
-    from pydantic.v1 import BaseConfig, BaseModel, BaseSettings, Extra, Field, create_model
+    from pydantic.v1 import (
+        BaseConfig,
+        BaseModel,
+        BaseSettings,
+        Extra,
+        Field,
+        ValidationError,
+        create_model,
+        validator,
+    )
+    from pydantic.v1.fields import SHAPE_DICT, SHAPE_LIST, SHAPE_SINGLETON, ModelField
 elif PYDANTIC_VERSION < "2":
-    from pydantic import BaseConfig, BaseModel, BaseSettings, Extra, Field, create_model  # noqa
+    from pydantic import (  # noqa
+        BaseConfig,
+        BaseModel,
+        BaseSettings,
+        Extra,
+        Field,
+        ValidationError,
+        create_model,
+        validator,
+    )
+    from pydantic.fields import SHAPE_DICT, SHAPE_LIST, SHAPE_SINGLETON, ModelField  # noqa
 else:
     raise ImportError("Unknown version of Pydantic.")
@@ -1 +1,60 @@
-"""Defining Kedro datasets."""
+"""Defining Kedro datasets.
+
+The dataset classes are imported lazily (on first access), like in `pydantic_kedro`.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+__all__ = [
+    "ArrowDataset",
+    "NpyDataset",
+    "PackedCollectionDataset",
+    "PydanticAutoDataset",
+    "PydanticFolderDataset",
+    "PydanticJsonDataset",
+    "PydanticJsonLinesDataset",
+    "PydanticPackDataset",
+    "PydanticYamlDataset",
+    "PydanticZipDataset",
+]
+
+# Public name -> module that defines it
+_LAZY_IMPORTS: Dict[str, str] = {
+    "ArrowDataset": ".arrow",
+    "NpyDataset": ".npy",
+    "PackedCollectionDataset": ".packed",
+    "PydanticAutoDataset": ".auto",
+    "PydanticFolderDataset": ".folder",
+    "PydanticJsonDataset": ".json",
+    "PydanticJsonLinesDataset": ".jsonl",
+    "PydanticPackDataset": ".pack",
+    "PydanticYamlDataset": ".yaml",
+    "PydanticZipDataset": ".zip",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import dataset classes on first access (PEP 562)."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value  # cache it, so this is only called once
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .arrow import ArrowDataset
+    from .auto import PydanticAutoDataset
+    from .folder import PydanticFolderDataset
+    from .json import PydanticJsonDataset
+    from .jsonl import PydanticJsonLinesDataset
+    from .npy import NpyDataset
+    from .pack import PydanticPackDataset
+    from .packed import PackedCollectionDataset
+    from .yaml import PydanticYamlDataset
+    from .zip import PydanticZipDataset
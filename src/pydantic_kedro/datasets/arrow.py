@@ -0,0 +1,103 @@
+"""Arrow IPC (Feather V2) dataset for Pandas dataframes and Arrow tables."""
+
+from pathlib import PurePosixPath
+from typing import Any, Dict, Literal, Optional
+
+import fsspec
+import pyarrow as pa
+from fsspec import AbstractFileSystem
+from kedro.io.core import AbstractDataset, get_filepath_str, get_protocol_and_path
+
+__all__ = ["ArrowDataset"]
+
+
+class ArrowDataset(AbstractDataset[Any, Any]):
+    """Dataset for saving/loading Pandas dataframes or Arrow tables as Arrow IPC files.
+
+    Arrow IPC files are the same as Feather V2 files, so they can be read with
+    `pandas.read_feather` or `pyarrow.feather.read_table`.
+
+    If `memory_map` is set and the file is local, the file is memory-mapped on load,
+    so Arrow tables are read without copying (the same holds for many dataframe columns).
+    This requires the file to be uncompressed.
+
+    Example:
+    -------
+    ```python
+    ds = ArrowDataset("path/to/df.arrow", output="pandas")
+    ds.save(pd.DataFrame({"x": [1, 2, 3]}))
+    df = ds.load()
+    ```
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        output: Literal["pandas", "arrow"] = "pandas",
+        memory_map: bool = True,
+        compression: Optional[Literal["lz4", "zstd"]] = None,
+    ) -> None:
+        """Create a new instance of ArrowDataset for the given filepath.
+
+        Args:
+        ----
+        filepath : The location of the Arrow IPC file.
+        output : Whether to load a Pandas dataframe ("pandas") or an Arrow table ("arrow").
+        memory_map : Whether to memory-map local files when loading.
+        compression : Buffer compression to use when saving. This prevents zero-copy reads.
+        """
+        if output not in ("pandas", "arrow"):
+            raise ValueError(f"Unknown output type: {output!r}")
+        protocol, path = get_protocol_and_path(filepath)
+        self._protocol = protocol
+        self._filepath = PurePosixPath(path)
+        self._fs: AbstractFileSystem = fsspec.filesystem(self._protocol)
+        self._output: Literal["pandas", "arrow"] = output
+        self._memory_map = memory_map
+        self._compression: Optional[Literal["lz4", "zstd"]] = compression
+
+    @property
+    def filepath(self) -> str:
+        """File path name."""
+        return str(self._filepath)
+
+    @property
+    def memory_mapped(self) -> bool:
+        """Whether loaded data only read the file through a memory map (the same as `lazy`)."""
+        return self.lazy
+
+    @property
+    def lazy(self) -> bool:
+        """Whether loaded data is memory-mapped, so it keeps reading from the file."""
+        return self._memory_map and self._protocol == "file"
+
+    def _load(self) -> Any:
+        load_path = get_filepath_str(self._filepath, self._protocol)
+        if self._memory_map and self._protocol == "file":
+            table = pa.ipc.open_file(pa.memory_map(load_path, "r")).read_all()
+        else:
+            with self._fs.open(load_path, mode="rb") as f:
+                table = pa.ipc.open_file(f).read_all()
+        if self._output == "arrow":
+            return table
+        return table.to_pandas(split_blocks=True)
+
+    def _save(self, data: Any) -> None:
+        if isinstance(data, pa.Table):
+            table = data
+        else:  # assume it's a Pandas dataframe
+            table = pa.Table.from_pandas(data)
+        save_path = get_filepath_str(self._filepath, self._protocol)
+        options = pa.ipc.IpcWriteOptions(compression=self._compression)
+        with self._fs.open(save_path, mode="wb") as f:
+            with pa.ipc.new_file(f, table.schema, options=options) as writer:
+                writer.write_table(table)
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(
+            filepath=self.filepath,
+            protocol=self._protocol,
+            output=self._output,
+            memory_map=self._memory_map,
+            compression=self._compression,
+        )
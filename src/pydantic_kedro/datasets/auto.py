@@ -1,22 +1,43 @@
 """Generic Kedro dataset."""
 
-from typing import Any, Dict, Literal, Union
+import asyncio
+from importlib import import_module
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union
 
 import fsspec
 from fsspec import AbstractFileSystem
-from kedro.io.core import AbstractDataset, get_protocol_and_path
+from kedro.io.core import AbstractDataset, get_filepath_str, get_protocol_and_path
 
+from pydantic_kedro._async_io import AsyncDatasetMixin, cat_file, get_async_fs, isdir, to_uri
+from pydantic_kedro._compression import MAGIC_LENGTH, check_compression, detect_compression
+from pydantic_kedro._dict_io import check_partial, check_validate_sample
+from pydantic_kedro._local_caching import StagingDirs
+from pydantic_kedro._model_cache import evict_model, load_cached
+from pydantic_kedro._prefetch import claim_prefetched
+from pydantic_kedro._process_pool import check_processes
 from pydantic_kedro._pydantic import BaseModel
 
-from .folder import PydanticFolderDataset
-from .json import PydanticJsonDataset
-from .yaml import PydanticYamlDataset
-from .zip import PydanticZipDataset
+if TYPE_CHECKING:
+    from .folder import PydanticFolderDataset
+    from .json import PydanticJsonDataset
+    from .pack import PydanticPackDataset
+    from .yaml import PydanticYamlDataset
+    from .zip import PydanticZipDataset
 
 __all__ = ["PydanticAutoDataset"]
 
+# Format name -> (module, class); imported on first use, to keep `import pydantic_kedro` fast
+_FORMATS: Dict[str, tuple] = {
+    "yaml": (".yaml", "PydanticYamlDataset"),
+    "json": (".json", "PydanticJsonDataset"),
+    "zip": (".zip", "PydanticZipDataset"),
+    "folder": (".folder", "PydanticFolderDataset"),
+    "pack": (".pack", "PydanticPackDataset"),
+}
 
-class PydanticAutoDataset(AbstractDataset[BaseModel, BaseModel]):
+
+class PydanticAutoDataset(AsyncDatasetMixin, AbstractDataset[BaseModel, BaseModel]):
     """Dataset for self-describing Pydantic models.
 
     This allows fields with arbitrary types.
@@ -55,13 +76,31 @@ class PydanticAutoDataset(AbstractDataset[BaseModel, BaseModel]):
     )
     ds2.save(MyModel(x="example"))  # selects JSON
     ```
+
+    Passing `fields` loads only these fields, whatever the detected format,
+    see [PydanticFolderDataset][pydantic_kedro.PydanticFolderDataset].
+
+    With `cache=True`, loaded models are kept in a process-level cache, which is shared
+    by all datasets (and threads) loading the same path, see
+    [set_model_cache_size][pydantic_kedro.set_model_cache_size].
+
+    With `compression`, "pure" models saved as JSON or YAML are compressed.
+    Compressed JSON and YAML files are detected when loading, whatever `compression` is.
     """
 
     def __init__(
         self,
         filepath: str,
-        default_format_pure: Literal["yaml", "json", "zip", "folder"] = "yaml",
-        default_format_arbitrary: Literal["zip", "folder"] = "zip",
+        default_format_pure: Literal["yaml", "json", "zip", "folder", "pack"] = "yaml",
+        default_format_arbitrary: Literal["zip", "folder", "pack"] = "zip",
+        fields: Optional[List[str]] = None,
+        partial: Literal["model", "dict"] = "model",
+        cache: bool = False,
+        cache_copy: bool = False,
+        trusted: bool = False,
+        validate_sample: float = 0.0,
+        compression: Optional[str] = None,
+        processes: int = 0,
     ) -> None:
         """Create a new instance of PydanticAutoDataset to load/save Pydantic models for given filepath.
 
@@ -70,12 +109,38 @@ class PydanticAutoDataset(AbstractDataset[BaseModel, BaseModel]):
         filepath : The location of the Zip file.
         default_format_pure : Default format for saving "pure" models.
         default_format_arbitrary : Default format for saving "arbitrary" models.
+        fields : If set, only load these (`.`-separated) field paths, e.g. `["df", "nested.arr"]`.
+        partial : Whether a partial load returns a (partially-validated) "model" or a "dict"
+            of the selected top-level fields. Ignored if `fields` is not set.
+        cache : Whether to use the process-level model cache. Cached models are reused while
+            the stored file (or folder metadata) is unchanged, by modification time or ETag.
+        cache_copy : Whether loads from the cache return a deep copy, so that changing the
+            loaded model doesn't change the cached one. Ignored if `cache` is not set.
+        trusted : Whether the stored data is known to be good, so models are created without
+            validation, see [PydanticFolderDataset][pydantic_kedro.PydanticFolderDataset].
+        validate_sample : Fraction of the models that are validated anyway, for trusted loads.
+        compression : Compression of JSON and YAML files when saving ("gzip", "bz2", "xz", "zstd", ...),
+            or "infer" to infer it from the file extension. Loads detect the compression.
+        processes : Number of worker processes that save and load the members of folder-based
+            formats, see [PydanticFolderDataset][pydantic_kedro.PydanticFolderDataset].
         """
-        assert default_format_pure in ["yaml", "json", "zip", "folder"]
-        assert default_format_arbitrary in ["zip", "folder"]
+        assert default_format_pure in ["yaml", "json", "zip", "folder", "pack"]
+        assert default_format_arbitrary in ["zip", "folder", "pack"]
         self._filepath = str(filepath)
-        self._default_format_pure: Literal["yaml", "json", "zip", "folder"] = default_format_pure
-        self._default_format_arbitrary: Literal["zip", "folder"] = default_format_arbitrary
+        self._default_format_pure: Literal["yaml", "json", "zip", "folder", "pack"] = default_format_pure
+        self._default_format_arbitrary: Literal["zip", "folder", "pack"] = default_format_arbitrary
+        check_validate_sample(validate_sample)
+        check_compression(compression)
+        check_processes(processes)
+        self._fields = check_partial(fields, partial)
+        self._partial: Literal["model", "dict"] = partial
+        self._trusted = trusted
+        self._validate_sample = validate_sample
+        self._compression = compression
+        self._processes = processes
+        self._staging = StagingDirs()  # shared by the folder-based datasets, see `_get_ds`
+        self._cache = cache
+        self._cache_copy = cache_copy
 
     @property
     def filepath(self) -> str:
@@ -83,28 +148,50 @@ class PydanticAutoDataset(AbstractDataset[BaseModel, BaseModel]):
         return str(self._filepath)
 
     @property
-    def default_format_pure(self) -> Literal["yaml", "json", "zip", "folder"]:
+    def default_format_pure(self) -> Literal["yaml", "json", "zip", "folder", "pack"]:
         """The default saving format used for 'pure' pydantic models."""
         return self._default_format_pure
 
     @property
-    def default_format_arbitrary(self) -> Literal["zip", "folder"]:
+    def default_format_arbitrary(self) -> Literal["zip", "folder", "pack"]:
         """The default saving format used for 'arbitrary' pydantic models."""
         return self._default_format_arbitrary
 
     def _get_ds(
-        self, name: Literal["yaml", "json", "zip", "folder"]
-    ) -> Union[PydanticYamlDataset, PydanticJsonDataset, PydanticFolderDataset, PydanticZipDataset]:
-        """Map the format name to dataset type, and create it."""
-        if name == "yaml":
-            return PydanticYamlDataset(self.filepath)
-        if name == "json":
-            return PydanticJsonDataset(self.filepath)
-        if name == "zip":
-            return PydanticZipDataset(self.filepath)
-        if name == "folder":
-            return PydanticFolderDataset(self.filepath)
-        raise ValueError(f"Unknown dataset keyword: {name}")
+        self, name: Literal["yaml", "json", "zip", "folder", "pack"], compression: Optional[str] = None
+    ) -> Union[
+        "PydanticYamlDataset",
+        "PydanticJsonDataset",
+        "PydanticFolderDataset",
+        "PydanticZipDataset",
+        "PydanticPackDataset",
+    ]:
+        """Map the format name to dataset type, and create it.
+
+        The `compression` is only used by the JSON and YAML datasets,
+        and the number of `processes` by the folder-based ones. These also keep their
+        staging directories in this dataset's, so `release()` removes them.
+        """
+        if name not in _FORMATS:
+            raise ValueError(f"Unknown dataset keyword: {name}")
+        module, kls = _FORMATS[name]
+        ds_type = getattr(import_module(module, __package__), kls)
+        kwargs: Dict[str, Any] = {}
+        if name in ("json", "yaml"):
+            kwargs["compression"] = compression
+        else:
+            kwargs["processes"] = self._processes
+        ds = ds_type(
+            self.filepath,
+            fields=self._fields,
+            partial=self._partial,
+            trusted=self._trusted,
+            validate_sample=self._validate_sample,
+            **kwargs,
+        )
+        if name not in ("json", "yaml"):
+            ds._staging = self._staging
+        return ds
 
     def _load(self) -> BaseModel:
         """Load Pydantic model from the filepath.
@@ -113,6 +200,16 @@ class PydanticAutoDataset(AbstractDataset[BaseModel, BaseModel]):
         -------
         Pydantic model.
         """
+        prefetched = claim_prefetched(self)  # see `PrefetchHooks`
+        if prefetched is not None:
+            return prefetched
+        if self._cache:
+            fields = None if self._fields is None else tuple(self._fields)
+            variant = (fields, self._partial, self._trusted, self._validate_sample)
+            return load_cached(self._filepath, self._load_uncached, variant, copy=self._cache_copy)
+        return self._load_uncached()
+
+    def _load_uncached(self) -> BaseModel:
         filepath = self._filepath
         of = fsspec.open(filepath)
         fs: AbstractFileSystem = of.fs  # type: ignore
@@ -121,45 +218,119 @@ class PydanticAutoDataset(AbstractDataset[BaseModel, BaseModel]):
         # If it's a directory, try to open as a folder
         if fs.isdir(path):
             try:
-                return PydanticFolderDataset(filepath).load()
+                return self._get_ds("folder").load()
             except Exception as exc:
                 raise RuntimeError(
                     f"Path {filepath} is a directory, but failed to load PydanticFolderDataset from it."
                 ) from exc
 
+        # Compressed files can only be JSON or YAML
+        try:
+            with fs.open(path, mode="rb") as f:
+                compression = detect_compression(f.read(MAGIC_LENGTH))
+        except Exception:
+            compression = None  # the datasets below report the error
+
         # Try other datatsets
         # Yes, this looks hacky
         errors: list[Exception] = []
         try:
-            return PydanticJsonDataset(filepath).load()
+            return self._get_ds("json", compression).load()
         except Exception as e1:
             errors.append(e1)
 
         try:
-            return PydanticYamlDataset(filepath).load()
+            return self._get_ds("yaml", compression).load()
         except Exception as e2:
             errors.append(e2)
 
         try:
-            return PydanticZipDataset(filepath).load()
+            return self._get_ds("zip").load()
         except Exception as e3:
             errors.append(e3)
 
+        try:
+            return self._get_ds("pack").load()
+        except Exception as e4:
+            errors.append(e4)
+
+        err_info = "\n".join([str(e) for e in errors])
+        raise RuntimeError(f"Failed to load any dataset from the path {filepath!r}.\n{err_info}")
+
+    async def _load_async(self) -> BaseModel:
+        if self._cache:  # the model cache is synchronous, and waits for concurrent loads
+            return await asyncio.to_thread(self._load)
+        filepath = self._filepath
+        fs, path = await get_async_fs(filepath)
+
+        # If it's a directory, try to open as a folder
+        if await isdir(fs, path):
+            try:
+                return await self._get_ds("folder").load_async()
+            except Exception as exc:
+                raise RuntimeError(
+                    f"Path {filepath} is a directory, but failed to load PydanticFolderDataset from it."
+                ) from exc
+
+        # Compressed files can only be JSON or YAML, so read the file that these would read
+        protocol, json_path = get_protocol_and_path(filepath)
+        json_uri = to_uri(protocol, get_filepath_str(PurePosixPath(json_path), protocol))
+        head_fs, head_path = await get_async_fs(json_uri)
+        compression = detect_compression(await cat_file(head_fs, head_path, start=0, end=MAGIC_LENGTH))
+
+        # Try other datatsets, in the same order as `_load()`
+        errors: list[Exception] = []
+        candidates: List[AsyncDatasetMixin] = [
+            self._get_ds("json", compression),
+            self._get_ds("yaml", compression),
+            self._get_ds("zip"),
+            self._get_ds("pack"),
+        ]
+        for ds in candidates:
+            try:
+                return await ds.load_async()
+            except Exception as e:
+                errors.append(e)
+
         err_info = "\n".join([str(e) for e in errors])
         raise RuntimeError(f"Failed to load any dataset from the path {filepath!r}.\n{err_info}")
 
     def _save(self, data: BaseModel) -> None:
         """Save Pydantic model to the filepath."""
+        evict_model(self._filepath)
         try:
-            self._get_ds(self.default_format_pure).save(data)
+            self._get_ds(self.default_format_pure, self._compression).save(data)
             return
         except Exception:
             pass
         self._get_ds(self.default_format_arbitrary).save(data)
 
+    async def _save_async(self, data: BaseModel) -> None:
+        evict_model(self._filepath)
+        try:
+            await self._get_ds(self.default_format_pure, self._compression).save_async(data)
+            return
+        except Exception:
+            pass
+        await self._get_ds(self.default_format_arbitrary).save_async(data)
+
+    def _release(self) -> None:
+        """Remove models of this path from the model cache, and the kept staging directories."""
+        super()._release()
+        evict_model(self._filepath)
+        self._staging.release()
+
     def _describe(self) -> Dict[str, Any]:
         return dict(
             filepath=self.filepath,
             default_format_pure=self.default_format_pure,
             default_format_arbitrary=self.default_format_arbitrary,
+            fields=self._fields,
+            partial=self._partial,
+            cache=self._cache,
+            cache_copy=self._cache_copy,
+            trusted=self._trusted,
+            validate_sample=self._validate_sample,
+            compression=self._compression,
+            processes=self._processes,
         )
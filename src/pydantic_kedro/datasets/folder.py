@@ -1,29 +1,116 @@
 """Folder-based dataset for Pydantic models with arbitrary types."""
 
+import asyncio
+import base64
 import inspect
+import io
 import json
 import logging
+import pickle
 import warnings
+from collections import deque
+from concurrent.futures import Future
 from copy import deepcopy
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 from uuid import uuid4
 
 import fsspec
 from fsspec import AbstractFileSystem
-from fsspec.core import strip_protocol
+from fsspec.core import strip_protocol, url_to_fs
 from fsspec.implementations.local import LocalFileSystem
-from kedro.io.core import AbstractDataset, parse_dataset_definition
+from kedro.io.core import AbstractDataset, get_protocol_and_path, parse_dataset_definition
 
-from pydantic_kedro._dict_io import PatchPydanticIter, dict_to_model
-from pydantic_kedro._internals import get_kedro_default, get_kedro_map, import_string
-from pydantic_kedro._local_caching import get_cache_dir
+from pydantic_kedro._async_io import (
+    AsyncDatasetMixin,
+    cat_file,
+    find,
+    get_async_fs,
+    get_files,
+    put_files,
+    rm_file,
+)
+from pydantic_kedro._dict_io import (
+    PatchPydanticIter,
+    check_partial,
+    check_validate_sample,
+    dict_to_model,
+    partial_result,
+    select_fields,
+    split_field_path,
+)
+from pydantic_kedro._internals import get_config_value, get_kedro_dispatch, import_string
+from pydantic_kedro._local_caching import StagingDirs, make_staging_dir, release_staging_dir
+from pydantic_kedro._prefetch import claim_prefetched
+from pydantic_kedro._process_pool import (
+    check_processes,
+    discard,
+    free,
+    free_refs,
+    load_task,
+    pack,
+    save_task,
+    submit,
+    unpack,
+)
 from pydantic_kedro._pydantic import BaseConfig, BaseModel, Extra, Field
+from pydantic_kedro.instrumentation import (
+    STEP_DICT_TO_MODEL,
+    STEP_LOAD_MEMBER,
+    STEP_READ_METADATA,
+    STEP_SAVE_MEMBER,
+    STEP_STAGE_COPY,
+    STEP_WRITE_METADATA,
+    record_step,
+)
 
-__all__ = ["PydanticFolderDataset"]
+if TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory
+
+__all__ = ["FolderFormatInspection", "PydanticFolderDataset"]
 
 
 DATA_PLACEHOLDER = "__DATA_PLACEHOLDER__"
+META_FILES = ("meta.json", "meta.bin")
+MetadataFormat = Literal["json", "msgpack"]
+# File name of the metadata, per format
+METADATA_FILES: Dict[MetadataFormat, str] = {"json": "meta.json", "msgpack": "meta.bin"}
+# The compact metadata is MAGIC + version (1 byte) + zstd-compressed msgpack
+COMPACT_META_MAGIC = b"PYDKMETA"
+COMPACT_META_VERSION = 1
+# Import name prefixes of datasets that can read `fsspec` URLs directly (see `direct_load`)
+REMOTE_DATASET_PREFIXES: List[str] = [
+    "kedro_datasets.json.",
+    "kedro_datasets.pandas.",
+    "kedro_datasets.pickle.",
+    "kedro_datasets.text.",
+    "kedro_datasets.yaml.",
+    "pydantic_kedro.datasets.arrow.",
+    "pydantic_kedro.datasets.npy.",
+    "pydantic_kedro.datasets.packed.",
+]
+# Import name prefixes of datasets that read everything into memory when loading
+EAGER_DATASET_PREFIXES = (
+    "kedro_datasets.json.",
+    "kedro_datasets.pandas.",
+    "kedro_datasets.pickle.",
+    "kedro_datasets.text.",
+    "kedro_datasets.yaml.",
+)
 
 JsonPath = str  # not a "real" JSON Path, but just `.`-separated
 ImportStr = str
@@ -73,14 +160,23 @@ class KedroDatasetSpec(BaseModel):
         return cls(type=get_import_name(type(ds)), relative_path=relative_path, args=clean_args)
 
     def to_dataset(
-        self, base_path: str, load_version: Optional[str] = None, save_version: Optional[str] = None
+        self,
+        base_path: str,
+        load_version: Optional[str] = None,
+        save_version: Optional[str] = None,
+        keep_protocol: bool = False,
     ) -> AbstractDataset:
         """Build the Dataset object.
 
         This assumes the local path is called `filepath`.
+        If `keep_protocol` is set, the dataset gets the full (e.g. remote) URL of the member,
+        otherwise `base_path` is assumed to be local.
         """
-        fsp = strip_protocol(base_path)  # I mean, this should be a local path...
-        new_path = f"{fsp}/{self.relative_path}"
+        if keep_protocol:
+            new_path = f"{base_path.rstrip('/')}/{self.relative_path}"
+        else:
+            fsp = strip_protocol(base_path)  # I mean, this should be a local path...
+            new_path = f"{fsp}/{self.relative_path}"
         config = self.dict(exclude={"relative_path"}, by_alias=True)
         config = {"type": self.type_, **self.args}
         config["filepath"] = new_path
@@ -102,6 +198,76 @@ class KedroDatasetSpec(BaseModel):
 KedroDatasetSpec.update_forward_refs()
 
 
+InlineEncoding = Literal["pickle", "npy"]
+
+
+class _SizeExceeded(Exception):
+    """Raised when an inline encoding gets too big."""
+
+
+class _CappedBuffer(io.BytesIO):
+    """Bytes buffer that refuses to grow past `cap` bytes, so big objects aren't fully encoded."""
+
+    def __init__(self, cap: int) -> None:
+        super().__init__()
+        self.cap = cap
+
+    def write(self, b: Any) -> int:
+        if self.tell() + memoryview(b).nbytes > self.cap:
+            raise _SizeExceeded()
+        return super().write(b)
+
+
+class InlineObject(BaseModel):
+    """An arbitrary object stored in the metadata itself, as base64-encoded bytes."""
+
+    encoding: InlineEncoding
+    data: str
+
+    @classmethod
+    def encode(cls, obj: Any, encoding: InlineEncoding, max_bytes: int) -> Optional["InlineObject"]:
+        """Encode the object, or return `None` if it takes more than `max_bytes` bytes."""
+        buf = _CappedBuffer(max_bytes)
+        try:
+            if encoding == "npy":
+                import numpy as np
+
+                if not isinstance(obj, np.ndarray) or obj.nbytes > max_bytes:
+                    return None
+                np.save(buf, obj, allow_pickle=False)
+            else:
+                pickle.dump(obj, buf, protocol=pickle.HIGHEST_PROTOCOL)
+        except _SizeExceeded:
+            return None
+        return cls(encoding=encoding, data=base64.b64encode(buf.getvalue()).decode("ascii"))
+
+    def decode(self) -> Any:
+        """Decode the object."""
+        raw = base64.b64decode(self.data)
+        if self.encoding == "npy":
+            import numpy as np
+
+            return np.load(io.BytesIO(raw), allow_pickle=False)
+        return pickle.loads(raw)
+
+
+def inline_encoding(spec: KedroDatasetSpec) -> Optional[InlineEncoding]:
+    """Get the encoding for inlining objects that would be saved with this dataset, if any.
+
+    Only the plain `PickleDataset` and `NpyDataset` are inlined, since inlining
+    must load the same object that the dataset would.
+    """
+    args = spec.args
+    if spec.type_ == "kedro_datasets.pickle.pickle_dataset.PickleDataset":
+        plain = args.get("backend", "pickle") == "pickle" and args.get("version") is None
+        if plain and not args.get("load_args") and not args.get("save_args"):
+            return "pickle"
+    elif spec.type_ == "pydantic_kedro.datasets.npy.NpyDataset":
+        if not args.get("allow_pickle"):
+            return "npy"
+    return None
+
+
 class FolderFormatMetadata(BaseModel):
     """Metadata for the folder-formatted dataset.
 
@@ -113,6 +279,8 @@ class FolderFormatMetadata(BaseModel):
         Model parameters, encoded with a data path.
     catalog : dict
         Mapping of "json path" to a dataset spec.
+    inline : dict
+        Mapping of "json path" to small objects that are stored in the metadata itself.
     pydantic_types : dict
         Mapping of "json path" to the Pydantic model type, for nested models.
     """
@@ -120,9 +288,44 @@ class FolderFormatMetadata(BaseModel):
     model_class: str
     model_info: Dict[str, Any]
     catalog: Dict[JsonPath, KedroDatasetSpec] = {}
+    inline: Dict[JsonPath, InlineObject] = {}
     # pydantic_types: Dict[JsonPath, ImportStr] = {}
 
 
+class FolderFormatInspection(FolderFormatMetadata):
+    """Metadata of a saved model, along with the sizes of its members.
+
+    Attributes
+    ----------
+    member_sizes : dict
+        Mapping of "json path" to the total size of the member's files, in bytes.
+    """
+
+    member_sizes: Dict[JsonPath, int] = {}
+
+    @classmethod
+    def from_metadata(
+        cls, meta: FolderFormatMetadata, file_sizes: Dict[str, int]
+    ) -> "FolderFormatInspection":
+        """Create from the metadata and the sizes of files (relative to the model root)."""
+        rel_to_jsp = {spec.relative_path: jsp for jsp, spec in meta.catalog.items()}
+        member_sizes = {jsp: 0 for jsp in meta.catalog}
+        for key, size in file_sizes.items():
+            parts = key.lstrip("/").split("/")
+            for i in range(1, len(parts) + 1):
+                jsp = rel_to_jsp.get("/".join(parts[:i]))
+                if jsp is not None:
+                    member_sizes[jsp] += size
+                    break
+        return cls(
+            model_class=meta.model_class,
+            model_info=meta.model_info,
+            catalog=meta.catalog,
+            inline=meta.inline,
+            member_sizes=member_sizes,
+        )
+
+
 def mutate_jsp(struct: Union[Dict[str, Any], List[Any]], jsp: List[JsonPath], obj: Any) -> None:
     """Mutates `struct` in-place given the jsp (which is json-path-like)."""
     if isinstance(struct, dict):
@@ -144,6 +347,179 @@ def mutate_jsp(struct: Union[Dict[str, Any], List[Any]], jsp: List[JsonPath], ob
         raise TypeError(f"Unknown struct passed: {struct!r}")
 
 
+def drop_jsp(struct: Union[Dict[str, Any], List[Any]], jsp: List[JsonPath]) -> None:
+    """Remove the element at the jsp from `struct` in-place, if it exists.
+
+    Elements of lists are replaced with `None`, so that the indices of other elements don't change.
+    """
+    key = jsp[0]
+    if isinstance(struct, dict):
+        if key not in struct:
+            return
+        if len(jsp) == 1:
+            del struct[key]
+        else:
+            drop_jsp(struct[key], jsp[1:])
+    elif isinstance(struct, list):
+        idx = int(key)
+        if idx >= len(struct):
+            return
+        if len(jsp) == 1:
+            struct[idx] = None
+        else:
+            drop_jsp(struct[idx], jsp[1:])
+
+
+def _truncate_at_list(struct: Any, path: List[str]) -> List[str]:
+    """Truncate the field path at the first list, since lists are only loaded as a whole."""
+    for i, key in enumerate(path):
+        if isinstance(struct, list):
+            return path[:i]
+        if not isinstance(struct, dict) or key not in struct:
+            break
+        struct = struct[key]
+    return path
+
+
+def select_catalog(
+    meta: FolderFormatMetadata, fields: Optional[Iterable[str]]
+) -> Dict[JsonPath, KedroDatasetSpec]:
+    """Select the catalog entries required to load the given field paths (or all, if `None`).
+
+    An entry is required if it lies within a selected field, or if a selected field lies within it.
+    Lists are always selected as a whole.
+    """
+    is_selected = _jsp_selector(meta, fields)
+    return {k: v for k, v in meta.catalog.items() if is_selected(k)}
+
+
+def select_inline(
+    meta: FolderFormatMetadata, fields: Optional[Iterable[str]]
+) -> Dict[JsonPath, InlineObject]:
+    """Select the inline objects required to load the given field paths (or all, if `None`)."""
+    is_selected = _jsp_selector(meta, fields)
+    return {k: v for k, v in meta.inline.items() if is_selected(k)}
+
+
+def _jsp_selector(
+    meta: FolderFormatMetadata, fields: Optional[Iterable[str]]
+) -> Callable[[JsonPath], bool]:
+    if fields is None:
+        return lambda jsp_str: True
+    paths = [_truncate_at_list(meta.model_info, split_field_path(f)) for f in fields]
+
+    def is_selected(jsp_str: JsonPath) -> bool:
+        jsp = jsp_str.split(".")[1:]
+        return any(jsp[: len(p)] == p or p[: len(jsp)] == jsp for p in paths)
+
+    return is_selected
+
+
+def member_filter(catalog: Dict[JsonPath, KedroDatasetSpec]) -> Callable[[str], bool]:
+    """Make a filter for relative file paths in the folder, keeping metadata and `catalog` members."""
+    members = {spec.relative_path for spec in catalog.values()}
+
+    def keep(key: str) -> bool:
+        key = key.lstrip("/")
+        if key in META_FILES:
+            return True
+        parts = key.split("/")
+        return any("/".join(parts[:i]) in members for i in range(1, len(parts) + 1))
+
+    return keep
+
+
+def _metadata_key(keys: Iterable[str]) -> str:
+    """Find the metadata file among the (relative) file paths of a folder."""
+    stripped = {k.lstrip("/") for k in keys}
+    for name in META_FILES:
+        if name in stripped:
+            return name
+    raise FileNotFoundError(f"No metadata file found, expected one of {META_FILES}")
+
+
+def _metadata_from_dict(dct: Dict[str, Any]) -> FolderFormatMetadata:
+    """Build the metadata without validation, since `model_info` is validated by the model anyway."""
+    try:
+        return FolderFormatMetadata.construct(
+            model_class=dct["model_class"],
+            model_info=dct["model_info"],
+            catalog={k: KedroDatasetSpec.construct(**v) for k, v in dct.get("catalog", {}).items()},
+            inline={k: InlineObject.construct(**v) for k, v in dct.get("inline", {}).items()},
+        )
+    except (KeyError, TypeError, AttributeError) as exc:
+        raise ValueError(f"Malformed folder metadata: {exc!r}") from exc
+
+
+def _parse_metadata(raw: Union[str, bytes]) -> FolderFormatMetadata:
+    """Parse the contents of a metadata file, in any format."""
+    if isinstance(raw, bytes) and raw.startswith(COMPACT_META_MAGIC):
+        if len(raw) <= len(COMPACT_META_MAGIC):
+            raise ValueError("Malformed folder metadata: truncated after the compact format marker.")
+        version = raw[len(COMPACT_META_MAGIC)]
+        if version > COMPACT_META_VERSION:
+            raise ValueError(f"Unsupported compact metadata version: {version}")
+        import msgpack
+        import zstandard
+
+        payload = (
+            zstandard.ZstdDecompressor().decompressobj().decompress(raw[len(COMPACT_META_MAGIC) + 1 :])
+        )
+        dct = msgpack.unpackb(payload, raw=False)
+    else:
+        dct = json.loads(raw)
+    if not isinstance(dct, dict):
+        raise ValueError("Malformed folder metadata: expected a mapping.")
+    return _metadata_from_dict(dct)
+
+
+def _dump_metadata(meta: FolderFormatMetadata, fmt: MetadataFormat = "json") -> bytes:
+    """Dump the metadata to bytes in the given format."""
+    if fmt == "json":
+        return meta.json().encode("utf-8")
+    if fmt == "msgpack":
+        import msgpack
+        import zstandard
+
+        dct = meta.dict()
+        payload = msgpack.packb(dct, default=FolderFormatMetadata.__json_encoder__, use_bin_type=True)
+        compressed = zstandard.ZstdCompressor().compress(payload)
+        return COMPACT_META_MAGIC + bytes([COMPACT_META_VERSION]) + compressed
+    raise ValueError(f"Unknown metadata format: {fmt!r}")
+
+
+def _read_metadata(filepath: str) -> FolderFormatMetadata:
+    """Read the metadata file (in any format) from the folder at `filepath`."""
+    for name in META_FILES:
+        meta_path = f"{filepath}/{name}"
+        with record_step(STEP_READ_METADATA, meta_path) as ev:
+            try:
+                with fsspec.open(meta_path) as f:
+                    raw = f.read()  # type: ignore
+            except FileNotFoundError:
+                continue
+            if ev is not None:
+                ev.nbytes = len(raw)
+            return _parse_metadata(raw)
+    raise FileNotFoundError(f"No metadata file found in {filepath!r}, expected one of {META_FILES}")
+
+
+def _write_metadata(meta: FolderFormatMetadata, filepath: str, fmt: MetadataFormat = "json") -> None:
+    """Write the metadata file to the folder at `filepath`, removing metadata in other formats."""
+    name = METADATA_FILES[fmt]
+    meta_path = f"{filepath}/{name}"
+    with record_step(STEP_WRITE_METADATA, meta_path) as ev:
+        raw = _dump_metadata(meta, fmt)
+        fs, path = url_to_fs(filepath)
+        for other in META_FILES:
+            if other != name and fs.exists(f"{path}/{other}"):
+                fs.rm_file(f"{path}/{other}")
+        with fsspec.open(meta_path, mode="wb") as f:
+            f.write(raw)  # type: ignore
+        if ev is not None:
+            ev.nbytes = len(raw)
+
+
 def get_import_name(obj: Any) -> str:
     """Get the import name for a type."""
     module_i = inspect.getmodule(obj)
@@ -153,7 +529,48 @@ def get_import_name(obj: Any) -> str:
     return f"{module_i.__name__}.{r_name}"
 
 
-class PydanticFolderDataset(AbstractDataset[BaseModel, BaseModel]):
+def register_remote_dataset(kls: Union[Type[AbstractDataset], str]) -> None:
+    """Register a dataset type (or import name prefix) as able to read `fsspec` URLs directly.
+
+    Members of these types are not staged locally when loading with `direct_load=True`.
+    """
+    prefix = kls if isinstance(kls, str) else get_import_name(kls)
+    if prefix not in REMOTE_DATASET_PREFIXES:
+        REMOTE_DATASET_PREFIXES.append(prefix)
+
+
+def is_remote_dataset(type_name: str) -> bool:
+    """Check whether the dataset type (by import name) can read `fsspec` URLs directly."""
+    return type_name.startswith(tuple(REMOTE_DATASET_PREFIXES))
+
+
+def is_process_local(path: str) -> bool:
+    """Check whether the path is only visible in this process (i.e. `memory://`)."""
+    return get_protocol_and_path(path)[0] == "memory"
+
+
+def is_lazy_dataset(ds: AbstractDataset) -> bool:
+    """Check whether objects loaded from the dataset may still read its files (e.g. memory maps).
+
+    Datasets can tell us via a boolean `lazy` attribute. Otherwise, only the datasets
+    in `EAGER_DATASET_PREFIXES` are known to read everything into memory.
+    """
+    lazy = getattr(ds, "lazy", None)
+    if isinstance(lazy, bool):
+        return lazy
+    return not get_import_name(type(ds)).startswith(EAGER_DATASET_PREFIXES)
+
+
+def is_memory_mapped_dataset(ds: AbstractDataset) -> bool:
+    """Check whether objects loaded from the dataset only read its files through memory maps.
+
+    Datasets can tell us via a boolean `memory_mapped` attribute. Memory maps stay valid
+    when their files are removed, so these files can be removed once the objects are gone.
+    """
+    return getattr(ds, "memory_mapped", None) is True
+
+
+class PydanticFolderDataset(AsyncDatasetMixin, AbstractDataset[BaseModel, BaseModel]):
     """Dataset for saving/loading Pydantic models, based on saving sub-datasets in a folder.
 
     This allows fields with arbitrary types.
@@ -168,22 +585,90 @@ class PydanticFolderDataset(AbstractDataset[BaseModel, BaseModel]):
     ds.save(MyModel(x="example"))
     assert ds.load().x == "example"
     ```
+
+    To load only some fields, pass their (`.`-separated) paths as `fields`.
+    Only the sub-datasets these fields need are read (and, for remote folders, copied).
+    The remaining fields get their defaults, or are left unset.
+
+    ```python
+    ds = PydanticFolderDataset('memory://path/to/model', fields=["x"])
+    ```
+
+    With `processes`, the members are saved and loaded by a pool of worker processes,
+    which helps when this is CPU-bound (e.g. pickling, or compressing parquet files).
+    Members are sent to the workers with their `KedroDatasetSpec`, and big array buffers
+    are passed in shared memory. Lazily-loaded members are still loaded in this process.
     """
 
-    def __init__(self, filepath: str) -> None:
+    def __init__(
+        self,
+        filepath: str,
+        fields: Optional[List[str]] = None,
+        partial: Literal["model", "dict"] = "model",
+        direct_load: bool = False,
+        direct_save: bool = False,
+        metadata_format: MetadataFormat = "json",
+        trusted: bool = False,
+        validate_sample: float = 0.0,
+        processes: int = 0,
+    ) -> None:
         """Create a new instance of PydanticFolderDataset to load/save Pydantic models for given path.
 
         Args:
         ----
         filepath : The location of the folder.
+        fields : If set, only load these (`.`-separated) field paths, e.g. `["df", "nested.arr"]`.
+        partial : Whether a partial load returns a (partially-validated) "model" or a "dict"
+            of the selected top-level fields. Ignored if `fields` is not set.
+        direct_load : For remote folders, whether members that can read remote paths directly
+            (see `register_remote_dataset`) are loaded without local staging.
+        direct_save : For remote folders, whether members that can write remote paths directly
+            are saved without local staging. The metadata is always written last.
+        metadata_format : Format of the metadata when saving: "json" (`meta.json`, the default)
+            or the compact "msgpack" (`meta.bin`, zstd-compressed msgpack; needs `msgpack` and
+            `zstandard`). Either format is read when loading.
+        trusted : Whether the stored data is known to be good, so models are created without
+            validation (only fields that need conversion, e.g. datetimes, are validated).
+        validate_sample : Fraction of the models that are validated anyway, for trusted loads.
+        processes : Number of worker processes that save and load the members,
+            or 0 (the default) to do it in this process. Pools are shared by all datasets.
         """
+        if metadata_format not in METADATA_FILES:
+            raise ValueError(f"Unknown metadata format: {metadata_format!r}")
+        check_validate_sample(validate_sample)
+        check_processes(processes)
         self._filepath = filepath
+        self._fields = check_partial(fields, partial)
+        self._partial: Literal["model", "dict"] = partial
+        self._direct_load = direct_load
+        self._direct_save = direct_save
+        self._metadata_format: MetadataFormat = metadata_format
+        self._trusted = trusted
+        self._validate_sample = validate_sample
+        self._processes = processes
+        self._staging = StagingDirs()
 
     @property
     def filepath(self) -> str:
         """File path name."""
         return str(self._filepath)
 
+    def inspect(self) -> FolderFormatInspection:
+        """Read the model metadata and member sizes, without loading any members.
+
+        Only the metadata and a listing of the folder are read.
+        """
+        fs, path = url_to_fs(self._filepath)
+        meta = _read_metadata(self._filepath)
+        base = path.rstrip("/")
+        infos: Dict[str, Dict[str, Any]] = fs.find(base, detail=True)  # type: ignore
+        file_sizes = {
+            k[len(base) :].lstrip("/"): int(v.get("size") or 0)
+            for k, v in infos.items()
+            if k.startswith(base)
+        }
+        return FolderFormatInspection.from_metadata(meta, file_sizes)
+
     def _save(self, data: BaseModel) -> None:
         """Save Pydantic model to the filepath."""
         fs: AbstractFileSystem = fsspec.open(self._filepath).fs  # type: ignore
@@ -193,12 +678,25 @@ class PydanticFolderDataset(AbstractDataset[BaseModel, BaseModel]):
             from tempfile import TemporaryDirectory
 
             with TemporaryDirectory(prefix="pyd_kedro_") as tmpdir:
-                self._save_local(data, tmpdir)
-                # Copy to remote
-                m_local = fsspec.get_mapper(tmpdir)
-                m_remote = fsspec.get_mapper(self._filepath, create=True)
-                for k, v in m_local.items():
-                    m_remote[k] = v
+                if self._direct_save:
+                    fs.makedirs(fs._strip_protocol(self._filepath), exist_ok=True)
+                    self._save_local(data, tmpdir, direct_base=self._filepath)
+                else:
+                    self._save_local(data, tmpdir)
+                # Copy to remote, with the metadata last (so it's only there if everything else is)
+                with record_step(STEP_STAGE_COPY, self._filepath) as ev:
+                    m_local = fsspec.get_mapper(tmpdir)
+                    m_remote = fsspec.get_mapper(self._filepath, create=True)
+                    for other in META_FILES:  # drop stale metadata in other formats
+                        if other not in m_local and other in m_remote:
+                            del m_remote[other]
+                    nbytes = 0
+                    for k in sorted(m_local.keys(), key=lambda k: k in META_FILES):
+                        v = m_local[k]
+                        m_remote[k] = v
+                        nbytes += len(v)
+                    if ev is not None:
+                        ev.nbytes = nbytes
 
             # Close (this might be required for some filesystems)
             try:
@@ -213,32 +711,198 @@ class PydanticFolderDataset(AbstractDataset[BaseModel, BaseModel]):
         -------
         Pydantic model.
         """
+        prefetched = claim_prefetched(self)  # see `PrefetchHooks`
+        if prefetched is not None:
+            return prefetched
         fs: AbstractFileSystem = fsspec.open(self._filepath).fs  # type: ignore
         if isinstance(fs, LocalFileSystem):
             return self._load_local(self._filepath)
+        elif self._direct_load:
+            return self._load_direct()
         else:
             # Making a temp directory in the current cache dir location
-            tmpdir = get_cache_dir() / str(uuid4()).replace("-", "")
-            tmpdir.mkdir(exist_ok=False, parents=True)
+            tmpdir = make_staging_dir()
+            try:
+                self._stage(tmpdir)
+            except BaseException:
+                release_staging_dir(tmpdir)
+                raise
+            # Load locally
+            return self._load_staged(tmpdir)
+
+    def _load_direct(self) -> BaseModel:
+        """Load from remote, only staging the members that can't read remote paths."""
+        meta = _read_metadata(self._filepath)
+        staged = {
+            spec.relative_path: spec
+            for spec in select_catalog(meta, self._fields).values()
+            if not is_remote_dataset(spec.type_)
+        }
+        if not staged:
+            return self._load_local(
+                self._filepath, meta=meta, member_base=lambda spec: (self._filepath, True)
+            )
+
+        tmpdir = make_staging_dir()
+        try:
+            self._stage(tmpdir, keep=member_filter(staged))
+        except BaseException:
+            release_staging_dir(tmpdir)
+            raise
+
+        def member_base(spec: KedroDatasetSpec) -> Tuple[str, bool]:
+            if spec.relative_path in staged:
+                return str(tmpdir), False
+            return self._filepath, True
 
-            # Copy from remote... yes, this is not ideal!
+        return self._load_staged(tmpdir, meta=meta, member_base=member_base)
+
+    def _stage(self, tmpdir: Path, keep: Optional[Callable[[str], bool]] = None) -> None:
+        """Copy the (required, or `keep`-filtered) remote files to the local staging directory."""
+        if keep is None:
+            keep = lambda k: True  # noqa: E731
+            if self._fields is not None:
+                # Only copy the members that we need
+                keep = member_filter(select_catalog(_read_metadata(self._filepath), self._fields))
+
+        # Copy from remote... yes, this is not ideal!
+        with record_step(STEP_STAGE_COPY, self._filepath) as ev:
             m_remote = fsspec.get_mapper(self._filepath)
             m_local = fsspec.get_mapper(str(tmpdir))
-            for k, v in m_remote.items():
+            nbytes = 0
+            for k in m_remote.keys():
+                if not keep(k):
+                    continue
+                v = m_remote[k]
                 m_local[k] = v
+                nbytes += len(v)
+            if ev is not None:
+                ev.nbytes = nbytes
 
-            # Load locally
-            return self._load_local(str(tmpdir))
+    def _load_staged(
+        self,
+        tmpdir: Path,
+        staging: Optional[StagingDirs] = None,
+        meta: Optional[FolderFormatMetadata] = None,
+        member_base: Optional[Callable[[KedroDatasetSpec], Tuple[str, bool]]] = None,
+    ) -> BaseModel:
+        """Load from a local staging directory, then remove or keep it.
+
+        The directory is removed right away if all members were loaded eagerly.
+        Otherwise, it is kept in `staging` (by default, this dataset's) until released,
+        or evicted (see `set_cache_quota`), or, if all lazy members are memory-mapped,
+        until these are garbage-collected. See `_load_local` for the other arguments.
+        """
+        lazy_members: List[Tuple[Any, bool]] = []
+        try:
+            res = self._load_local(
+                str(tmpdir), lazy_members=lazy_members, meta=meta, member_base=member_base
+            )
+        except BaseException:
+            release_staging_dir(tmpdir)
+            raise
+        if not lazy_members:
+            release_staging_dir(tmpdir)
+        elif all(mapped for _, mapped in lazy_members):
+            # Memory maps don't need the files once mapped, so the directory can go with them
+            (staging or self._staging).keep(tmpdir, [obj for obj, _ in lazy_members])
+        else:
+            (staging or self._staging).keep(tmpdir)
+        return res
+
+    def _release(self) -> None:
+        """Remove the staging directories that were kept for lazily-loaded members."""
+        super()._release()
+        self._staging.release()
+
+    async def _load_async(self) -> BaseModel:
+        fs, path = await get_async_fs(self._filepath)
+        if isinstance(fs, LocalFileSystem):
+            return await asyncio.to_thread(self._load_local, self._filepath)
+        if self._direct_load:
+            return await asyncio.to_thread(self._load_direct)
+        tmpdir = make_staging_dir()
+        try:
+            await self._stage_async(fs, path, tmpdir)
+        except BaseException:
+            release_staging_dir(tmpdir)
+            raise
+        return await asyncio.to_thread(self._load_staged, tmpdir)
+
+    async def _stage_async(self, fs: AbstractFileSystem, path: str, tmpdir: Path) -> None:
+        remote_paths = await find(fs, path)
+        if self._fields is not None:
+            # Only fetch the members that we need
+            meta_key = _metadata_key(p[len(path) :] for p in remote_paths)
+            meta = _parse_metadata(await cat_file(fs, f"{path}/{meta_key}"))
+            keep = member_filter(select_catalog(meta, self._fields))
+            remote_paths = [p for p in remote_paths if keep(p[len(path) :])]
+
+        # Download the files to the local staging directory, a few at a time
+        with record_step(STEP_STAGE_COPY, self._filepath) as ev:
+            files: Dict[str, str] = {}
+            for remote_path in remote_paths:
+                local_path = tmpdir / remote_path[len(path) :].lstrip("/")
+                local_path.parent.mkdir(parents=True, exist_ok=True)
+                files[remote_path] = str(local_path)
+            await get_files(fs, files)
+            if ev is not None:
+                ev.nbytes = sum(Path(p).stat().st_size for p in files.values())
+
+    async def _save_async(self, data: BaseModel) -> None:
+        fs, path = await get_async_fs(self._filepath)
+        if isinstance(fs, LocalFileSystem):
+            await asyncio.to_thread(self._save_local, data, self._filepath)
+            return
+        from tempfile import TemporaryDirectory
+
+        if self._direct_save:
+            await asyncio.to_thread(self._save, data)
+            return
 
-    def _load_local(self, filepath: str) -> BaseModel:
+        with TemporaryDirectory(prefix="pyd_kedro_") as tmpdir:
+            await asyncio.to_thread(self._save_local, data, tmpdir)
+            # Upload the files a few at a time, then the metadata last
+            with record_step(STEP_STAGE_COPY, self._filepath) as ev:
+                local_files = {
+                    p.relative_to(tmpdir).as_posix(): p for p in Path(tmpdir).rglob("*") if p.is_file()
+                }
+                for other in META_FILES:  # drop stale metadata in other formats
+                    if other not in local_files:
+                        await rm_file(fs, f"{path}/{other}")
+                for is_meta in (False, True):
+                    await put_files(
+                        fs,
+                        {
+                            str(p): f"{path}/{k}"
+                            for k, p in local_files.items()
+                            if (k in META_FILES) == is_meta
+                        },
+                    )
+                if ev is not None:
+                    ev.nbytes = sum(p.stat().st_size for p in local_files.values())
+
+    def _load_local(
+        self,
+        filepath: str,
+        lazy_members: Optional[List[Tuple[Any, bool]]] = None,
+        meta: Optional[FolderFormatMetadata] = None,
+        member_base: Optional[Callable[[KedroDatasetSpec], Tuple[str, bool]]] = None,
+    ) -> BaseModel:
         """Load Pydantic model from the local filepath.
 
+        If `lazy_members` is given, the object of each lazily-loaded member, and whether
+        it is memory-mapped (see `is_memory_mapped_dataset`), are appended to it.
+        If `meta` is given, it is used instead of reading the metadata from `filepath`.
+        If `member_base` is given, it maps members to their base path and whether to keep
+        its protocol (see `KedroDatasetSpec.to_dataset`), instead of using `filepath`.
+
         Returns
         -------
         Pydantic model.
         """
-        with fsspec.open(f"{filepath}/meta.json") as f:
-            meta = FolderFormatMetadata.parse_raw(f.read())  # type: ignore
+        if meta is None:
+            meta = _read_metadata(filepath)
 
         # Ensure model type is importable
         model_cls = import_string(meta.model_class)
@@ -248,36 +912,85 @@ class PydanticFolderDataset(AbstractDataset[BaseModel, BaseModel]):
 
         # Load data objects and mutate in-place
         model_data: Union[Dict[str, Any], List[Any]] = deepcopy(meta.model_info)
-        for jsp_str, ds_spec in meta.catalog.items():
-            jsp = jsp_str.split(".")[1:]
-            ds_i = ds_spec.to_dataset(base_path=filepath)
-            obj_i = ds_i.load()
-            mutate_jsp(model_data, jsp, obj_i)
+        catalog = select_catalog(meta, self._fields)
+        inline = select_inline(meta, self._fields)
+        if self._fields is not None:
+            assert isinstance(model_data, dict), "Only dict root is supported for partial loading."
+            model_data = select_fields(model_data, self._fields)
+            for jsp_str in (meta.catalog.keys() - catalog.keys()) | (meta.inline.keys() - inline.keys()):
+                drop_jsp(model_data, jsp_str.split(".")[1:])
+        for jsp_str, item in inline.items():
+            mutate_jsp(model_data, jsp_str.split(".")[1:], item.decode())
+        # Members loaded by worker processes: (JSON path, member path, spec, future)
+        pending: List[Tuple[List[str], str, KedroDatasetSpec, Future]] = []
+        try:
+            for jsp_str, ds_spec in catalog.items():
+                jsp = jsp_str.split(".")[1:]
+                base_path, keep_protocol = (
+                    (filepath, False) if member_base is None else member_base(ds_spec)
+                )
+                ds_i = ds_spec.to_dataset(base_path=base_path, keep_protocol=keep_protocol)
+                member_path = f"{base_path}/{ds_spec.relative_path}"
+                lazy = is_lazy_dataset(ds_i)
+                if self._processes > 0 and not lazy and not is_process_local(member_path):
+                    future = submit(self._processes, load_task, ds_spec, base_path, keep_protocol)
+                    pending.append((jsp, member_path, ds_spec, future))
+                    continue
+                with record_step(STEP_LOAD_MEMBER, member_path, ds_spec.type_, nbytes_path=member_path):
+                    obj_i = ds_i.load()
+                if lazy and lazy_members is not None:
+                    lazy_members.append((obj_i, is_memory_mapped_dataset(ds_i)))
+                mutate_jsp(model_data, jsp, obj_i)
+            for i, (jsp, member_path, ds_spec, future) in enumerate(pending):
+                # The step only measures the wait for the worker
+                with record_step(STEP_LOAD_MEMBER, member_path, ds_spec.type_, nbytes_path=member_path):
+                    obj_i = unpack(future.result(), unlink=True)
+                mutate_jsp(model_data, jsp, obj_i)
+        except BaseException:
+            discard([p[3] for p in pending], cleanup=free_refs)
+            raise
 
-        res = dict_to_model(model_data)
+        with record_step(STEP_DICT_TO_MODEL, filepath):
+            res = dict_to_model(
+                model_data,
+                partial=self._fields is not None,
+                trusted=self._trusted,
+                validate_sample=self._validate_sample,
+            )
+        if self._fields is not None:
+            return partial_result(res, self._fields, self._partial)  # type: ignore
         return res
 
-    def _save_local(self, data: BaseModel, filepath: str) -> None:
+    def _save_local(self, data: BaseModel, filepath: str, direct_base: Optional[str] = None) -> None:
+        """Save Pydantic model to the local filepath.
+
+        If `direct_base` is given, members that can write remote paths (see `register_remote_dataset`)
+        are saved directly under `direct_base` instead, and only the rest under `filepath`.
+        """
         # Prepare fields for final metadata
         kls = type(data)
         model_class_str = get_import_name(kls)
         model_info: Union[Dict[str, Any], List[Any]] = {}
         catalog: Dict[JsonPath, KedroDatasetSpec] = {}
+        inline: Dict[JsonPath, InlineObject] = {}
 
         # These are used to make datasets for various types
         # See the `kls.Config` class - this is inherited
-        kedro_map: Dict[Type, Callable[[str], AbstractDataset]] = get_kedro_map(kls)
-        kedro_default: Callable[[str], AbstractDataset] = get_kedro_default(kls)
-
-        def make_ds_for(obj: Any, path: str) -> AbstractDataset:
-            for k, v in kedro_map.items():
-                if isinstance(obj, k):
-                    return v(path)
-            warnings.warn(
-                f"No dataset defined for {get_import_name(type(obj))} in `Config.kedro_map`;"
-                f" using `Config.kedro_default`: {kedro_default}"
-            )
-            return kedro_default(path)
+        dispatch = get_kedro_dispatch(kls)
+        kedro_default: Callable[[str], AbstractDataset] = dispatch.kedro_default
+        warned: Set[Type] = set()
+
+        def ds_factory_for(obj: Any) -> Callable[[str], AbstractDataset]:
+            factory = dispatch.dispatch(type(obj))
+            if factory is not None:
+                return factory
+            if type(obj) not in warned:  # warn once per type
+                warned.add(type(obj))
+                warnings.warn(
+                    f"No dataset defined for {get_import_name(type(obj))} in `Config.kedro_map`;"
+                    f" using `Config.kedro_default`: {kedro_default}"
+                )
+            return kedro_default
 
         # We need to create `model_info` and `catalog`
         starter = str(uuid4()).replace("-", "")
@@ -297,6 +1010,83 @@ class PydanticFolderDataset(AbstractDataset[BaseModel, BaseModel]):
             rt = json.loads(data.json(encoder=fake_encoder))
 
         # This will map the data to a dataset and actually save it
+        pack_collections: bool = get_config_value(kls, "kedro_pack_collections", False)
+        inline_max_bytes: int = get_config_value(kls, "kedro_inline_max_bytes", 0)
+
+        def inline_member(
+            data: Any, jsp: str, base_path: str, make_ds: Callable[[str], AbstractDataset]
+        ) -> bool:
+            """Add the data to `inline` if it's small enough and its dataset allows it."""
+            spec = KedroDatasetSpec.from_dataset(make_ds(f"{base_path}/{jsp}"), jsp)
+            encoding = inline_encoding(spec)
+            if encoding is None:
+                return False
+            item = InlineObject.encode(data, encoding, inline_max_bytes)
+            if item is None:
+                return False
+            inline[jsp] = item
+            return True
+
+        # Members being saved by worker processes: (member path, spec, future, shared memory)
+        # At most `2 * processes` are in flight, to bound the shared memory in use
+        pending: Deque[Tuple[str, KedroDatasetSpec, Future, List["SharedMemory"]]] = deque()
+
+        def wait_oldest() -> None:
+            """Wait for the oldest pending member to be saved, then free its shared memory."""
+            full_path, dss, future, blocks = pending[0]
+            try:
+                # The step only measures the wait for the worker
+                with record_step(STEP_SAVE_MEMBER, full_path, dss.type_, nbytes_path=full_path):
+                    future.result()
+            finally:
+                pending.popleft()
+                free(blocks)
+
+        def save_member(
+            data: Any, jsp: str, base_path: str, make_ds: Callable[[str], AbstractDataset]
+        ) -> None:
+            """Make a dataset for the data, add it to `catalog` and actually save it."""
+            full_path = f"{base_path}/{jsp}"
+            ds = make_ds(full_path)
+            keep_protocol = False
+            if direct_base is not None and is_remote_dataset(get_import_name(type(ds))):
+                # Save it directly to the remote path instead
+                base_path, keep_protocol = direct_base.rstrip("/"), True
+                full_path = f"{base_path}/{jsp}"
+                ds = make_ds(full_path)
+            # Get the spec (or fail because of non-JSON-able types...)
+            dss = KedroDatasetSpec.from_dataset(ds, jsp)
+            dss.json()  # to fail early
+            catalog[jsp] = dss  # add to catalog
+            if self._processes > 0 and not is_process_local(full_path):
+                while len(pending) >= 2 * self._processes:
+                    wait_oldest()
+                packed, blocks = pack(data)
+                try:
+                    future = submit(self._processes, save_task, dss, base_path, keep_protocol, packed)
+                except BaseException:
+                    free(blocks)
+                    raise
+                pending.append((full_path, dss, future, blocks))
+                return
+            # Save the data
+            with record_step(STEP_SAVE_MEMBER, full_path, dss.type_, nbytes_path=full_path):
+                ds.save(data)
+
+        def packer_for(items: List[Any]) -> Optional[Callable[[str], AbstractDataset]]:
+            """Get a dataset factory to save these items as a single member, if they can be packed."""
+            if not pack_collections or len(items) < 2:
+                return None
+            if not all(isinstance(x, str) and x in data_map for x in items):
+                return None
+            if any(dispatch.is_user_mapped(type(data_map[x])) for x in items):
+                return None  # explicit mappings take precedence
+            from .packed import PackedCollectionDataset, packed_codec
+
+            codec = packed_codec([data_map[x] for x in items])
+            if codec is None:
+                return None
+            return lambda path: PackedCollectionDataset(path, codec=codec)
 
         def visit3(obj: Any, jsp: str, base_path: str) -> Any:
             """Map the data to a dataset in `catalog` and actually saves it."""
@@ -304,34 +1094,55 @@ class PydanticFolderDataset(AbstractDataset[BaseModel, BaseModel]):
                 if obj in data_map:
                     # We got a data point
                     data = data_map[obj]
-                    # Make a dataset for it
-                    full_path = f"{base_path}/{jsp}"
-                    ds = make_ds_for(data, full_path)
-                    # Get the spec (or fail because of non-JSON-able types...)
-                    dss = KedroDatasetSpec.from_dataset(ds, jsp)
-                    dss.json()  # to fail early
-                    catalog[jsp] = dss  # add to catalog
-                    # Save the data
-                    ds.save(data)
-                    # Return the spec in dict form
+                    make_ds = ds_factory_for(data)
+                    if inline_max_bytes <= 0 or not inline_member(data, jsp, base_path, make_ds):
+                        save_member(data, jsp, base_path, make_ds)
                     return DATA_PLACEHOLDER
             elif isinstance(obj, list):
+                packer = packer_for(obj)
+                if packer is not None:
+                    save_member([data_map[x] for x in obj], jsp, base_path, packer)
+                    return DATA_PLACEHOLDER
                 return [visit3(sub, f"{jsp}.{i}", base_path) for i, sub in enumerate(obj)]
             elif isinstance(obj, dict):
+                packer = packer_for(list(obj.values()))
+                if packer is not None:
+                    save_member({k: data_map[v] for k, v in obj.items()}, jsp, base_path, packer)
+                    return DATA_PLACEHOLDER
                 return {k: visit3(v, f"{jsp}.{k}", base_path) for k, v in obj.items()}
             return obj
 
         # Ensure directory exists
         Path(filepath).mkdir(parents=True, exist_ok=True)
 
-        model_info = visit3(rt, "", base_path=filepath)
+        try:
+            model_info = visit3(rt, "", base_path=filepath)
+            while pending:
+                wait_oldest()
+        except BaseException:
+            discard(p[2] for p in pending)
+            raise
+        finally:
+            for _, _, _, blocks in pending:  # only those that weren't waited for
+                free(blocks)
         if not isinstance(model_info, dict):
             raise NotImplementedError("Only dict root is supported for now.")
 
         # Create and write metadata
-        meta = FolderFormatMetadata(model_class=model_class_str, model_info=model_info, catalog=catalog)
-        with fsspec.open(f"{filepath}/meta.json", mode="w") as f:
-            f.write(meta.json())  # type: ignore
+        meta = FolderFormatMetadata(
+            model_class=model_class_str, model_info=model_info, catalog=catalog, inline=inline
+        )
+        _write_metadata(meta, filepath, self._metadata_format)
 
     def _describe(self) -> Dict[str, Any]:
-        return dict(filepath=self.filepath)
+        return dict(
+            filepath=self.filepath,
+            fields=self._fields,
+            partial=self._partial,
+            direct_load=self._direct_load,
+            direct_save=self._direct_save,
+            metadata_format=self._metadata_format,
+            trusted=self._trusted,
+            validate_sample=self._validate_sample,
+            processes=self._processes,
+        )
@@ -1,19 +1,44 @@
 """JSON dataset definition for Pydantic."""
 
+import asyncio
 import json
 import warnings
 from pathlib import PurePosixPath
-from typing import Any, Dict, no_type_check
+from typing import Any, Dict, List, Literal, Optional, no_type_check
 
 import fsspec
 from fsspec import AbstractFileSystem
 from kedro.io.core import AbstractDataset, get_filepath_str, get_protocol_and_path
 
-from pydantic_kedro._dict_io import PatchPydanticIter, dict_to_model
+from pydantic_kedro._async_io import (
+    AsyncDatasetMixin,
+    cat_file,
+    get_async_fs,
+    makedirs,
+    pipe_file,
+    to_uri,
+)
+from pydantic_kedro._compression import (
+    check_compression,
+    compress_bytes,
+    decompress_bytes,
+    resolve_compression,
+)
+from pydantic_kedro._dict_io import (
+    PatchPydanticIter,
+    check_partial,
+    check_validate_sample,
+    dict_to_model,
+    events_to_model,
+    partial_result,
+    select_fields,
+)
+from pydantic_kedro._prefetch import claim_prefetched
 from pydantic_kedro._pydantic import BaseModel
+from pydantic_kedro.instrumentation import STEP_DICT_TO_MODEL, record_step
 
 
-class PydanticJsonDataset(AbstractDataset[BaseModel, BaseModel]):
+class PydanticJsonDataset(AsyncDatasetMixin, AbstractDataset[BaseModel, BaseModel]):
     """Dataset for saving/loading Pydantic models, based on JSON.
 
     Please note that the Pydantic model must be JSON-serializable.
@@ -32,13 +57,40 @@ class PydanticJsonDataset(AbstractDataset[BaseModel, BaseModel]):
     ```
     """
 
-    def __init__(self, filepath: str) -> None:
+    def __init__(
+        self,
+        filepath: str,
+        fields: Optional[List[str]] = None,
+        partial: Literal["model", "dict"] = "model",
+        trusted: bool = False,
+        validate_sample: float = 0.0,
+        streaming: bool = False,
+        compression: Optional[str] = None,
+    ) -> None:
         """Create a new instance of PydanticJsonDataset to load/save Pydantic models for given filepath.
 
         Args:
         ----
         filepath : The location of the JSON file.
+        fields : If set, only load these (`.`-separated) field paths, e.g. `["x", "nested.y"]`.
+        partial : Whether a partial load returns a (partially-validated) "model" or a "dict"
+            of the selected top-level fields. Ignored if `fields` is not set.
+        trusted : Whether the stored data is known to be good, so models are created without
+            validation (only fields that need conversion, e.g. datetimes, are validated).
+        validate_sample : Fraction of the models that are validated anyway, for trusted loads.
+        streaming : Whether to parse the file incrementally (needs `ijson`), creating nested
+            models while reading, so that large files need much less memory to load.
+        compression : Compression of the file ("gzip", "bz2", "xz", "zstd", ...), or "infer"
+            to infer it from the file extension (e.g. ".json.gz"). See `fsspec.available_compressions()`.
         """
+        check_validate_sample(validate_sample)
+        check_compression(compression)
+        self._fields = check_partial(fields, partial)
+        self._partial: Literal["model", "dict"] = partial
+        self._trusted = trusted
+        self._validate_sample = validate_sample
+        self._streaming = streaming
+        self._compression = compression
         # parse the path and protocol (e.g. file, http, s3, etc.)
         protocol, path = get_protocol_and_path(filepath)
         self._protocol = protocol
@@ -57,14 +109,57 @@ class PydanticJsonDataset(AbstractDataset[BaseModel, BaseModel]):
         -------
         Pydantic model.
         """
+        prefetched = claim_prefetched(self)  # see `PrefetchHooks`
+        if prefetched is not None:
+            return prefetched
         # using get_filepath_str ensures that the protocol and path
         # are appended correctly for different filesystems
         load_path = get_filepath_str(self._filepath, self._protocol)
-        with self._fs.open(load_path, mode="r") as f:
+        if self._streaming:
+            return self._load_streaming(load_path)
+        with self._fs.open(load_path, mode="r", compression=self._compression) as f:
             dct = json.load(f)
+        return self._to_model(dct, load_path)
+
+    def _load_streaming(self, load_path: str) -> BaseModel:
+        import ijson
+
+        with self._fs.open(load_path, mode="rb", compression=self._compression) as f:
+            with record_step(STEP_DICT_TO_MODEL, load_path):
+                res = events_to_model(
+                    ijson.basic_parse(f, use_float=True),
+                    fields=self._fields,
+                    partial=self._fields is not None,
+                    trusted=self._trusted,
+                    validate_sample=self._validate_sample,
+                )
+        if self._fields is not None:
+            return partial_result(res, self._fields, self._partial)  # type: ignore
+        return res
+
+    async def _load_async(self) -> BaseModel:
+        if self._streaming:  # reads the file in chunks
+            return await asyncio.to_thread(self._load)
+        load_path = get_filepath_str(self._filepath, self._protocol)
+        fs, path = await get_async_fs(to_uri(self._protocol, load_path))
+        raw = decompress_bytes(await cat_file(fs, path), resolve_compression(path, self._compression))
+        dct = json.loads(raw)
+        return self._to_model(dct, load_path)
+
+    def _to_model(self, dct: Any, load_path: str) -> BaseModel:
         assert isinstance(dct, dict), "JSON root must be a mapping."
-        res = dict_to_model(dct)
-        return res  # type: ignore
+        if self._fields is not None:
+            dct = select_fields(dct, self._fields)
+        with record_step(STEP_DICT_TO_MODEL, load_path):
+            res = dict_to_model(
+                dct,
+                partial=self._fields is not None,
+                trusted=self._trusted,
+                validate_sample=self._validate_sample,
+            )
+        if self._fields is not None:
+            return partial_result(res, self._fields, self._partial)  # type: ignore
+        return res
 
     @no_type_check
     def _save(self, data: BaseModel) -> None:
@@ -81,9 +176,31 @@ class PydanticJsonDataset(AbstractDataset[BaseModel, BaseModel]):
             warnings.warn(f"Failed to create parent path for {save_path}")
 
         with PatchPydanticIter():
-            with self._fs.open(save_path, mode="w") as f:
+            with self._fs.open(save_path, mode="w", compression=self._compression) as f:
                 f.write(data.json())
 
+    async def _save_async(self, data: BaseModel) -> None:
+        save_path = get_filepath_str(self._filepath, self._protocol)
+        fs, path = await get_async_fs(to_uri(self._protocol, save_path))
+        try:
+            if "/" in path:
+                await makedirs(fs, path.rsplit("/", maxsplit=1)[0])
+        except Exception:
+            warnings.warn(f"Failed to create parent path for {save_path}")
+        with PatchPydanticIter():
+            raw = data.json()
+        compression = resolve_compression(path, self._compression)
+        await pipe_file(fs, path, compress_bytes(raw.encode("utf-8"), compression))
+
     def _describe(self) -> Dict[str, Any]:
         """Return a dict that describes the attributes of the dataset."""
-        return dict(filepath=self.filepath, protocol=self._protocol)
+        return dict(
+            filepath=self.filepath,
+            protocol=self._protocol,
+            fields=self._fields,
+            partial=self._partial,
+            trusted=self._trusted,
+            validate_sample=self._validate_sample,
+            streaming=self._streaming,
+            compression=self._compression,
+        )
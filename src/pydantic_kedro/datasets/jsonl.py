@@ -0,0 +1,164 @@
+"""JSON Lines dataset definition for streaming collections of Pydantic models."""
+
+import json
+import warnings
+from pathlib import PurePosixPath
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+import fsspec
+from fsspec import AbstractFileSystem
+from kedro.io.core import AbstractDataset, get_filepath_str, get_protocol_and_path
+
+from pydantic_kedro._dict_io import PatchPydanticIter, check_validate_sample, dict_to_model
+from pydantic_kedro._pydantic import BaseModel
+
+__all__ = ["PydanticJsonLinesDataset"]
+
+ModelStream = Union[Iterator[BaseModel], Iterator[List[BaseModel]]]
+
+
+class PydanticJsonLinesDataset(
+    AbstractDataset[Iterable[Union[BaseModel, Iterable[BaseModel]]], ModelStream]
+):
+    """Dataset for streaming many Pydantic models, based on JSON Lines.
+
+    Each model is saved as a self-describing JSON document on its own line.
+    Saving consumes any iterable of models (or of batches of models) one line at a time,
+    and loading returns a generator, so collections of any size are streamed through
+    in constant memory.
+
+    Please note that the Pydantic models must be JSON-serializable,
+    see [PydanticJsonDataset][pydantic_kedro.PydanticJsonDataset].
+
+    Example:
+    -------
+    ```python
+    class MyModel(BaseModel):
+        x: int
+
+    ds = PydanticJsonLinesDataset('memory://path/to/models.jsonl')  # using memory to avoid tempfile
+    ds.save(MyModel(x=i) for i in range(1_000_000))
+    for model in ds.load():  # generator
+        ...
+
+    batched = PydanticJsonLinesDataset('memory://path/to/models.jsonl', batch_size=1000)
+    for batch in batched.load():  # generator of lists
+        ...
+    ```
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        batch_size: Optional[int] = None,
+        trusted: bool = False,
+        validate_sample: float = 0.0,
+    ) -> None:
+        """Create a new instance of PydanticJsonLinesDataset for the given filepath.
+
+        Args:
+        ----
+        filepath : The location of the JSON Lines file.
+        batch_size : If set, loading yields lists of (up to) this many models instead of single models.
+        trusted : Whether the stored data is known to be good, so models are created without
+            validation, see [PydanticJsonDataset][pydantic_kedro.PydanticJsonDataset].
+        validate_sample : Fraction of the models that are validated anyway, for trusted loads.
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"The `batch_size` must be positive, but got {batch_size!r}")
+        check_validate_sample(validate_sample)
+        protocol, path = get_protocol_and_path(filepath)
+        self._protocol = protocol
+        self._filepath = PurePosixPath(path)
+        self._fs: AbstractFileSystem = fsspec.filesystem(self._protocol)
+        self._batch_size = batch_size
+        self._trusted = trusted
+        self._validate_sample = validate_sample
+
+    @property
+    def filepath(self) -> str:
+        """File path name."""
+        return str(self._filepath)
+
+    @property
+    def batch_size(self) -> Optional[int]:
+        """Number of models per loaded batch, or `None` to load single models."""
+        return self._batch_size
+
+    def _load(self) -> ModelStream:
+        """Load Pydantic models lazily from the filepath.
+
+        Returns
+        -------
+        Generator of Pydantic models, or of lists of models if `batch_size` is set.
+        """
+        models = self._iter_models()
+        if self._batch_size is None:
+            return models
+        return self._iter_batches(models, self._batch_size)
+
+    def _iter_models(self) -> Iterator[BaseModel]:
+        load_path = get_filepath_str(self._filepath, self._protocol)
+        with self._fs.open(load_path, mode="r") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                dct = json.loads(line)
+                assert isinstance(dct, dict), "Each JSON line must be a mapping."
+                yield dict_to_model(dct, trusted=self._trusted, validate_sample=self._validate_sample)
+
+    @staticmethod
+    def _iter_batches(models: Iterator[BaseModel], batch_size: int) -> Iterator[List[BaseModel]]:
+        batch: List[BaseModel] = []
+        for model in models:
+            batch.append(model)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _save(self, data: Iterable[Union[BaseModel, Iterable[BaseModel]]]) -> None:
+        """Save Pydantic models to the filepath, one line at a time.
+
+        Items may also be lists (batches) of models.
+        """
+        if isinstance(data, BaseModel):
+            raise TypeError("Expected an iterable of Pydantic models, but got a single model.")
+        save_path = get_filepath_str(self._filepath, self._protocol)
+
+        # Ensure parent directory exists
+        try:
+            if "/" in save_path:
+                parent_path, *_ = save_path.rsplit("/", maxsplit=1)
+                self._fs.makedirs(parent_path, exist_ok=True)
+        except Exception:
+            warnings.warn(f"Failed to create parent path for {save_path}")
+
+        with self._fs.open(save_path, mode="w") as f:
+            for item in data:
+                if isinstance(item, BaseModel):
+                    self._write_model(f, item)
+                else:
+                    for model in item:
+                        self._write_model(f, model)
+
+    @staticmethod
+    def _write_model(f: Any, model: BaseModel) -> None:
+        if not isinstance(model, BaseModel):
+            raise TypeError(f"Expected Pydantic model, but got {model!r}")
+        # NOTE: We only patch while dumping, since `data` may be a generator running user code
+        with PatchPydanticIter():
+            line = model.json()
+        f.write(line)
+        f.write("\n")
+
+    def _describe(self) -> Dict[str, Any]:
+        """Return a dict that describes the attributes of the dataset."""
+        return dict(
+            filepath=self.filepath,
+            protocol=self._protocol,
+            batch_size=self._batch_size,
+            trusted=self._trusted,
+            validate_sample=self._validate_sample,
+        )
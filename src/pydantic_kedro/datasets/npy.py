@@ -0,0 +1,92 @@
+"""NumPy `.npy` dataset, with support for memory-mapped loading."""
+
+from pathlib import PurePosixPath
+from typing import Any, Dict, Literal, Optional
+
+import fsspec
+import numpy as np
+from fsspec import AbstractFileSystem
+from kedro.io.core import AbstractDataset, get_filepath_str, get_protocol_and_path
+
+__all__ = ["NpyDataset"]
+
+MmapMode = Literal["r", "r+", "c"]
+
+
+class NpyDataset(AbstractDataset[np.ndarray, np.ndarray]):
+    """Dataset for saving/loading NumPy arrays in the `.npy` format.
+
+    If `mmap_mode` is set and the file is local, the array is memory-mapped on load
+    (see `numpy.load`). This means loading is nearly instant, data is paged in on demand,
+    and the pages are shared between processes that map the same file.
+    Remote files are always read fully into memory.
+
+    Example:
+    -------
+    ```python
+    ds = NpyDataset("path/to/array.npy", mmap_mode="r")
+    ds.save(np.arange(10))
+    arr = ds.load()  # np.memmap
+    ```
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        mmap_mode: Optional[MmapMode] = None,
+        allow_pickle: bool = False,
+    ) -> None:
+        """Create a new instance of NpyDataset for the given filepath.
+
+        Args:
+        ----
+        filepath : The location of the `.npy` file.
+        mmap_mode : Memory-map mode to use when loading local files, or `None` to read into memory.
+        allow_pickle : Whether to allow object arrays, which are saved via Pickle.
+        """
+        protocol, path = get_protocol_and_path(filepath)
+        self._protocol = protocol
+        self._filepath = PurePosixPath(path)
+        self._fs: AbstractFileSystem = fsspec.filesystem(self._protocol)
+        self._mmap_mode: Optional[MmapMode] = mmap_mode
+        self._allow_pickle = allow_pickle
+
+    @property
+    def filepath(self) -> str:
+        """File path name."""
+        return str(self._filepath)
+
+    @property
+    def mmap_mode(self) -> Optional[MmapMode]:
+        """Memory-map mode used when loading local files."""
+        return self._mmap_mode
+
+    @property
+    def memory_mapped(self) -> bool:
+        """Whether loaded arrays only read the file through a memory map (the same as `lazy`)."""
+        return self.lazy
+
+    @property
+    def lazy(self) -> bool:
+        """Whether loaded arrays are memory-mapped, so they keep reading from the file."""
+        return self._mmap_mode is not None and self._protocol == "file"
+
+    def _load(self) -> np.ndarray:
+        load_path = get_filepath_str(self._filepath, self._protocol)
+        if self._mmap_mode is not None and self._protocol == "file":
+            return np.load(load_path, mmap_mode=self._mmap_mode, allow_pickle=self._allow_pickle)
+        with self._fs.open(load_path, mode="rb") as f:
+            return np.load(f, allow_pickle=self._allow_pickle)
+
+    def _save(self, data: np.ndarray) -> None:
+        save_path = get_filepath_str(self._filepath, self._protocol)
+        with self._fs.open(save_path, mode="wb") as f:
+            np.save(f, np.asanyarray(data), allow_pickle=self._allow_pickle)
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(
+            filepath=self.filepath,
+            protocol=self._protocol,
+            mmap_mode=self._mmap_mode,
+            allow_pickle=self._allow_pickle,
+        )
@@ -0,0 +1,317 @@
+"""Single-file "pack" dataset for Pydantic models with arbitrary types.
+
+The pack format is a random-access container of the folder format's files:
+
+```text
+MAGIC (8 bytes)
+member payloads (raw, or compressed in independent blocks)
+footer index (JSON)
+footer length (8 bytes, little-endian) + MAGIC (8 bytes)
+```
+
+The footer index has the offsets and sizes of every block of every file,
+along with the contents of `meta.json`. So reading a model's metadata takes one ranged read
+(two, if the footer is large), and each member takes one more per block.
+"""
+
+import asyncio
+import bz2
+import lzma
+import struct
+import warnings
+import zlib
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
+
+from fsspec import AbstractFileSystem
+from fsspec.core import url_to_fs
+from kedro.io.core import AbstractDataset
+
+from pydantic_kedro._async_io import AsyncDatasetMixin
+from pydantic_kedro._dict_io import check_partial, check_validate_sample
+from pydantic_kedro._local_caching import StagingDirs, make_staging_dir, release_staging_dir
+from pydantic_kedro._prefetch import claim_prefetched
+from pydantic_kedro._process_pool import check_processes
+from pydantic_kedro._pydantic import BaseModel
+from pydantic_kedro.instrumentation import STEP_READ_METADATA, STEP_STAGE_COPY, record_step
+
+from .folder import (
+    META_FILES,
+    FolderFormatInspection,
+    FolderFormatMetadata,
+    PydanticFolderDataset,
+    _read_metadata,
+    member_filter,
+    select_catalog,
+)
+
+__all__ = ["PydanticPackDataset"]
+
+MAGIC = b"PYDKPACK"
+FORMAT_VERSION = 1
+_TAIL = struct.Struct("<Q8s")  # footer length, magic
+# Read this much from the end at once, which usually includes the whole footer
+_TAIL_READ_SIZE = 2**16
+# Uncompressed members are copied in chunks of at most this size
+_COPY_CHUNK_SIZE = 2**22
+
+Compression = Literal["zlib", "bz2", "lzma"]
+_COMPRESSORS: Dict[str, Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    "zlib": (zlib.compress, zlib.decompress),
+    "bz2": (bz2.compress, bz2.decompress),
+    "lzma": (lzma.compress, lzma.decompress),
+}
+
+Block = Tuple[int, int, int]  # offset, stored length, raw length
+
+
+class PackFileEntry(BaseModel):
+    """Index entry for a single file in the pack."""
+
+    size: int
+    compression: Optional[Compression] = None
+    blocks: List[Block] = []
+
+
+class PackIndex(BaseModel):
+    """Footer index of the pack."""
+
+    version: int = FORMAT_VERSION
+    files: Dict[str, PackFileEntry] = {}
+    meta: FolderFormatMetadata
+
+
+def is_pack(head: bytes) -> bool:
+    """Check whether the first bytes of a file are the pack magic."""
+    return head[: len(MAGIC)] == MAGIC
+
+
+class PydanticPackDataset(AsyncDatasetMixin, AbstractDataset[BaseModel, BaseModel]):
+    """Dataset for saving/loading Pydantic models as a single random-access file.
+
+    This allows fields with arbitrary types, like the
+    [PydanticZipDataset][pydantic_kedro.PydanticZipDataset], but has an index footer
+    with the byte ranges of every member. So each member is read with ranged reads,
+    and only the members you need are read at all (see `fields`).
+
+    Members are stored as-is, or compressed in independent blocks of `block_size` bytes.
+
+    Example:
+    -------
+    ```python
+    class MyModel(BaseModel):
+        x: str
+
+    ds = PydanticPackDataset('memory://path/to/model.pack')  # using memory to avoid tempfile
+    ds.save(MyModel(x="example"))
+    assert ds.load().x == "example"
+    ```
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        fields: Optional[List[str]] = None,
+        partial: Literal["model", "dict"] = "model",
+        compression: Optional[Compression] = None,
+        block_size: int = 2**22,
+        trusted: bool = False,
+        validate_sample: float = 0.0,
+        processes: int = 0,
+    ) -> None:
+        """Create a new instance of PydanticPackDataset to load/save Pydantic models for given filepath.
+
+        Args:
+        ----
+        filepath : The location of the pack file.
+        fields : If set, only load these (`.`-separated) field paths, e.g. `["df", "nested.arr"]`.
+        partial : Whether a partial load returns a (partially-validated) "model" or a "dict"
+            of the selected top-level fields. Ignored if `fields` is not set.
+        compression : Compression for member blocks when saving ("zlib", "bz2" or "lzma"), if any.
+        block_size : Size of the (uncompressed) blocks that are compressed independently.
+        trusted : Whether the stored data is known to be good, so models are created without
+            validation, see [PydanticFolderDataset][pydantic_kedro.PydanticFolderDataset].
+        validate_sample : Fraction of the models that are validated anyway, for trusted loads.
+        processes : Number of worker processes that save and load the members, see
+            [PydanticFolderDataset][pydantic_kedro.PydanticFolderDataset].
+        """
+        if compression is not None and compression not in _COMPRESSORS:
+            raise ValueError(f"Unknown compression: {compression!r}")
+        if block_size < 1:
+            raise ValueError(f"The `block_size` must be positive, but got {block_size!r}")
+        check_validate_sample(validate_sample)
+        check_processes(processes)
+        self._filepath = filepath
+        self._fields = check_partial(fields, partial)
+        self._partial: Literal["model", "dict"] = partial
+        self._compression: Optional[Compression] = compression
+        self._block_size = block_size
+        self._trusted = trusted
+        self._validate_sample = validate_sample
+        self._processes = processes
+        self._staging = StagingDirs()
+
+    @property
+    def filepath(self) -> str:
+        """File path name."""
+        return str(self._filepath)
+
+    def inspect(self) -> FolderFormatInspection:
+        """Read the model metadata and member sizes, from the footer only."""
+        fs, path = url_to_fs(self._filepath)
+        index = self._read_index(fs, path)
+        file_sizes = {k: v.size for k, v in index.files.items()}
+        return FolderFormatInspection.from_metadata(index.meta, file_sizes)
+
+    def _read_index(self, fs: AbstractFileSystem, path: str) -> PackIndex:
+        with record_step(STEP_READ_METADATA, self._filepath) as ev:
+            file_size = fs.size(path)
+            if file_size < len(MAGIC) + _TAIL.size:
+                raise ValueError(f"File is too small to be a pack: {self._filepath!r}")
+            tail_start = max(0, file_size - _TAIL_READ_SIZE)
+            tail = fs.cat_file(path, start=tail_start, end=file_size)
+            footer_len, magic = _TAIL.unpack(tail[-_TAIL.size :])
+            if magic != MAGIC:
+                raise ValueError(f"Not a pack file (bad magic): {self._filepath!r}")
+            footer_start = file_size - _TAIL.size - footer_len
+            if footer_start >= tail_start:
+                raw = tail[footer_start - tail_start : -_TAIL.size]
+            else:
+                raw = fs.cat_file(path, start=footer_start, end=file_size - _TAIL.size)
+            if ev is not None:
+                ev.nbytes = len(raw)
+            index = PackIndex.parse_raw(raw)
+        if index.version > FORMAT_VERSION:
+            raise ValueError(f"Unsupported pack format version: {index.version}")
+        return index
+
+    def _load(self) -> BaseModel:
+        """Load Pydantic model from the filepath.
+
+        Returns
+        -------
+        Pydantic model.
+        """
+        prefetched = claim_prefetched(self)  # see `PrefetchHooks`
+        if prefetched is not None:
+            return prefetched
+        fs, path = url_to_fs(self._filepath)
+        index = self._read_index(fs, path)
+        keep: Callable[[str], bool] = lambda k: True  # noqa: E731
+        if self._fields is not None:
+            keep = member_filter(select_catalog(index.meta, self._fields))
+
+        # Making a temp directory in the current cache dir location
+        tmpdir = make_staging_dir()
+        try:
+            # Copy each member block by block (the metadata is already in the index)
+            with record_step(STEP_STAGE_COPY, self._filepath) as ev:
+                nbytes = 0
+                for key, entry in index.files.items():
+                    if not keep(key):
+                        continue
+                    local_path = tmpdir / key
+                    local_path.parent.mkdir(parents=True, exist_ok=True)
+                    nbytes += self._extract_file(fs, path, entry, local_path)
+                if ev is not None:
+                    ev.nbytes = nbytes
+        except BaseException:
+            release_staging_dir(tmpdir)
+            raise
+
+        pfds = PydanticFolderDataset(
+            str(tmpdir),
+            fields=self._fields,
+            partial=self._partial,
+            trusted=self._trusted,
+            validate_sample=self._validate_sample,
+            processes=self._processes,
+        )
+        return pfds._load_staged(tmpdir, staging=self._staging, meta=index.meta)
+
+    def _release(self) -> None:
+        """Remove the staging directories that were kept for lazily-loaded members."""
+        super()._release()
+        self._staging.release()
+
+    @staticmethod
+    def _extract_file(fs: AbstractFileSystem, path: str, entry: PackFileEntry, local_path: Path) -> int:
+        """Extract a single file of the pack block by block, returning the number of bytes read."""
+        decompress = None if entry.compression is None else _COMPRESSORS[entry.compression][1]
+        nbytes = 0
+        with local_path.open("wb") as f:
+            for offset, stored_len, _ in entry.blocks:
+                end = offset + stored_len
+                if decompress is not None:
+                    f.write(decompress(fs.cat_file(path, start=offset, end=end)))
+                else:
+                    # Uncompressed blocks can be as big as the file, so copy them in bounded chunks
+                    for start in range(offset, end, _COPY_CHUNK_SIZE):
+                        f.write(fs.cat_file(path, start=start, end=min(start + _COPY_CHUNK_SIZE, end)))
+                nbytes += stored_len
+        return nbytes
+
+    def _save(self, data: BaseModel) -> None:
+        """Save Pydantic model to the filepath."""
+        fs, path = url_to_fs(self._filepath)
+        # Ensure parent directory exists
+        try:
+            if "/" in path:
+                fs.makedirs(path.rsplit("/", maxsplit=1)[0], exist_ok=True)
+        except Exception:
+            warnings.warn(f"Failed to create parent path for {self._filepath}")
+
+        with TemporaryDirectory(prefix="pyd_kedro_") as tmpdir:
+            PydanticFolderDataset(tmpdir, processes=self._processes).save(data)
+            with fs.open(path, mode="wb") as f:
+                self._write_pack(Path(tmpdir), f)
+
+    def _write_pack(self, folder: Path, f: Any) -> None:
+        """Write the local folder into the opened (writable) file."""
+        meta = _read_metadata(str(folder))
+        files: Dict[str, PackFileEntry] = {}
+        with record_step(STEP_STAGE_COPY, self._filepath) as ev:
+            f.write(MAGIC)
+            offset = len(MAGIC)
+            for p in sorted(folder.rglob("*")):
+                key = p.relative_to(folder).as_posix()
+                if not p.is_file() or key in META_FILES:
+                    continue
+                entry = PackFileEntry(size=p.stat().st_size, compression=self._compression)
+                with p.open("rb") as src:
+                    while True:
+                        chunk = src.read(self._block_size)
+                        if not chunk:
+                            break
+                        stored = chunk
+                        if self._compression is not None:
+                            compress, _ = _COMPRESSORS[self._compression]
+                            stored = compress(chunk)
+                        f.write(stored)
+                        entry.blocks.append((offset, len(stored), len(chunk)))
+                        offset += len(stored)
+                files[key] = entry
+            footer = PackIndex(files=files, meta=meta).json().encode("utf-8")
+            f.write(footer)
+            f.write(_TAIL.pack(len(footer), MAGIC))
+            if ev is not None:
+                ev.nbytes = offset + len(footer) + _TAIL.size
+
+    async def _load_async(self) -> BaseModel:
+        return await asyncio.to_thread(self._load)
+
+    async def _save_async(self, data: BaseModel) -> None:
+        await asyncio.to_thread(self._save, data)
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(
+            filepath=self.filepath,
+            fields=self._fields,
+            partial=self._partial,
+            compression=self._compression,
+            block_size=self._block_size,
+            trusted=self._trusted,
+            validate_sample=self._validate_sample,
+            processes=self._processes,
+        )
@@ -0,0 +1,167 @@
+"""Dataset for homogeneous collections of arrays or dataframes, packed into a single file.
+
+The file is laid out as:
+
+```text
+MAGIC (8 bytes)
+index length (8 bytes, little-endian)
+index (JSON)
+item payloads, concatenated
+```
+
+The index has the codec, the keys (for dicts) and the offset and length of every item,
+relative to the start of the payloads. The whole file is read with a single request.
+"""
+
+import io
+import struct
+from pathlib import PurePosixPath
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, Union
+
+import fsspec
+import numpy as np
+from fsspec import AbstractFileSystem
+from kedro.io.core import AbstractDataset, get_filepath_str, get_protocol_and_path
+
+from pydantic_kedro._pydantic import BaseModel
+
+__all__ = ["PackedCollectionDataset", "packed_codec"]
+
+MAGIC = b"PYDKCOLL"
+FORMAT_VERSION = 1
+_HEAD = struct.Struct("<8sQ")  # magic, index length
+
+Codec = Literal["npy", "arrow"]
+Collection = Union[List[Any], Dict[str, Any]]
+
+
+class PackedCollectionIndex(BaseModel):
+    """Index of the packed items."""
+
+    version: int = FORMAT_VERSION
+    codec: Codec
+    keys: Optional[List[str]] = None
+    items: List[Tuple[int, int]] = []  # offset, length
+
+
+def packed_codec(objs: Sequence[Any]) -> Optional[Codec]:
+    """Get the codec to pack these objects with, or `None` if they can't be packed together.
+
+    Only plain (non-object) NumPy arrays and Pandas dataframes with string column names
+    are packed, so that every item roundtrips exactly and without Pickle.
+    """
+    if not objs:
+        return None
+    if all(type(x) in (np.ndarray, np.memmap) and not x.dtype.hasobject for x in objs):
+        return "npy"
+    try:
+        import pandas as pd
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return None
+    if all(type(x) is pd.DataFrame and all(isinstance(c, str) for c in x.columns) for x in objs):
+        return "arrow"
+    return None
+
+
+def _encode(obj: Any, codec: Codec) -> bytes:
+    buf = io.BytesIO()
+    if codec == "npy":
+        np.save(buf, np.asarray(obj), allow_pickle=False)
+    else:
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(obj)
+        with pa.ipc.new_file(buf, table.schema) as writer:
+            writer.write_table(table)
+    return buf.getvalue()
+
+
+def _decode(raw: memoryview, codec: Codec) -> Any:
+    if codec == "npy":
+        return np.load(io.BytesIO(raw), allow_pickle=False)
+    import pyarrow as pa
+
+    return pa.ipc.open_file(pa.py_buffer(raw)).read_all().to_pandas()
+
+
+class PackedCollectionDataset(AbstractDataset[Collection, Collection]):
+    """Dataset for saving/loading a list or dict of arrays (or dataframes) as a single file.
+
+    This is used by the folder format for `kedro_pack_collections`, so that a collection of
+    many small objects is one file, rather than one file per item.
+
+    Arrays are stored in the `.npy` format (codec "npy") and dataframes in the Arrow IPC format
+    (codec "arrow"), each with an offset index, so no Pickle is involved.
+
+    Example:
+    -------
+    ```python
+    ds = PackedCollectionDataset("path/to/arrays.bin", codec="npy")
+    ds.save([np.arange(3), np.zeros((2, 2))])
+    arrs = ds.load()  # list of arrays
+    ```
+    """
+
+    lazy = False
+
+    def __init__(self, filepath: str, codec: Codec = "npy") -> None:
+        """Create a new instance of PackedCollectionDataset for the given filepath.
+
+        Args:
+        ----
+        filepath : The location of the packed file.
+        codec : How items are encoded when saving, "npy" for arrays or "arrow" for dataframes.
+        """
+        if codec not in ("npy", "arrow"):
+            raise ValueError(f"Unknown codec: {codec!r}")
+        protocol, path = get_protocol_and_path(filepath)
+        self._protocol = protocol
+        self._filepath = PurePosixPath(path)
+        self._fs: AbstractFileSystem = fsspec.filesystem(self._protocol)
+        self._codec: Codec = codec
+
+    @property
+    def filepath(self) -> str:
+        """File path name."""
+        return str(self._filepath)
+
+    def _load(self) -> Collection:
+        load_path = get_filepath_str(self._filepath, self._protocol)
+        raw = memoryview(self._fs.cat_file(load_path))
+        magic, index_len = _HEAD.unpack(raw[: _HEAD.size])
+        if magic != MAGIC:
+            raise ValueError(f"Not a packed collection (bad magic): {load_path!r}")
+        index = PackedCollectionIndex.parse_raw(bytes(raw[_HEAD.size : _HEAD.size + index_len]))
+        if index.version > FORMAT_VERSION:
+            raise ValueError(f"Unsupported packed collection version: {index.version}")
+        start = _HEAD.size + index_len
+        items = [_decode(raw[start + off : start + off + n], index.codec) for off, n in index.items]
+        if index.keys is None:
+            return items
+        return dict(zip(index.keys, items))
+
+    def _save(self, data: Collection) -> None:
+        keys: Optional[List[str]] = None
+        if isinstance(data, dict):
+            keys = [str(k) for k in data.keys()]
+            values = list(data.values())
+        else:
+            values = list(data)
+        payloads = [_encode(v, self._codec) for v in values]
+        offsets: List[Tuple[int, int]] = []
+        pos = 0
+        for p in payloads:
+            offsets.append((pos, len(p)))
+            pos += len(p)
+        index = PackedCollectionIndex(codec=self._codec, keys=keys, items=offsets).json().encode("utf-8")
+
+        save_path = get_filepath_str(self._filepath, self._protocol)
+        with self._fs.open(save_path, mode="wb") as f:
+            f.write(_HEAD.pack(MAGIC, len(index)))
+            f.write(index)
+            for p in payloads:
+                f.write(p)
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(filepath=self.filepath, protocol=self._protocol, codec=self._codec)
@@ -1,20 +1,138 @@
 """YAML dataset definition for Pydantic."""
 
+import asyncio
+import json
 import warnings
 from pathlib import PurePosixPath
-from typing import Any, Dict, no_type_check
+from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple, no_type_check
 
 import fsspec
-import ruamel.yaml as yaml
 from fsspec import AbstractFileSystem
 from kedro.io.core import AbstractDataset, get_filepath_str, get_protocol_and_path
-from pydantic_yaml import to_yaml_file
 
-from pydantic_kedro._dict_io import PatchPydanticIter, dict_to_model
+from pydantic_kedro._async_io import (
+    AsyncDatasetMixin,
+    cat_file,
+    get_async_fs,
+    makedirs,
+    pipe_file,
+    to_uri,
+)
+from pydantic_kedro._compression import (
+    check_compression,
+    compress_bytes,
+    decompress_bytes,
+    resolve_compression,
+)
+from pydantic_kedro._dict_io import (
+    PatchPydanticIter,
+    check_partial,
+    check_validate_sample,
+    dict_to_model,
+    partial_result,
+    select_fields,
+)
+from pydantic_kedro._prefetch import claim_prefetched
 from pydantic_kedro._pydantic import BaseModel
+from pydantic_kedro.instrumentation import STEP_DICT_TO_MODEL, record_step
 
 
-class PydanticYamlDataset(AbstractDataset[BaseModel, BaseModel]):
+def _safe_load(stream: Any) -> Any:
+    # ruamel.yaml is slow to import, so it's only imported when needed
+    import ruamel.yaml as yaml
+
+    return yaml.safe_load(stream)
+
+
+def _json_key(key: Any) -> str:
+    """Convert a dict key to a string, like `json.dumps` does."""
+    if isinstance(key, str):
+        return str.__str__(key)
+    if key is None or isinstance(key, (bool, int, float)):
+        return json.dumps(key)
+    raise TypeError(f"Keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+def emit_yaml(model: BaseModel, stream: Any) -> None:
+    """Write the model (with class markers) as YAML, while walking it.
+
+    This writes the same document as `pydantic_yaml.to_yaml_file` under `PatchPydanticIter`,
+    which converts the model to JSON and back first, so it keeps several copies
+    of the whole model in memory. Instead, YAML events are emitted for each value
+    as it's visited, so memory use only grows with the nesting depth of the model.
+    Values are converted like in `model.json()`, using the `json_encoders` of `model`.
+    """
+    from ruamel.yaml import YAML
+    from ruamel.yaml.events import (
+        DocumentEndEvent,
+        DocumentStartEvent,
+        MappingEndEvent,
+        MappingStartEvent,
+        SequenceEndEvent,
+        SequenceStartEvent,
+    )
+
+    writer = YAML(typ="safe", pure=True)
+    writer.default_flow_style = False
+    serializer, representer, emitter = writer.get_serializer_representer_emitter(stream, None)
+    sort_keys = getattr(representer, "sort_base_mapping_type_on_output", True)
+    encoder = type(model).__json_encoder__
+
+    def scalar(value: Any) -> None:
+        # The serializer decides on the tag and quoting of scalars
+        node = representer.represent_data(value)
+        serializer.anchors[node] = None
+        serializer.serialize_node(node, None, None)
+        del serializer.anchors[node], serializer.serialized_nodes[node]
+
+    def mapping(items: Iterable[Tuple[str, Any]]) -> None:
+        emitter.emit(MappingStartEvent(None, None, True, flow_style=False))
+        for key, value in sorted(items, key=lambda kv: kv[0]) if sort_keys else items:
+            scalar(key)
+            visit(value)
+        emitter.emit(MappingEndEvent())
+
+    def visit(value: Any) -> None:
+        # Same order of checks as `json.dumps`
+        if isinstance(value, BaseModel):
+            fields = dict(value._iter(to_dict=False))
+            if value.__custom_root_type__:
+                visit(fields["__root__"])
+            else:
+                mapping(fields.items())
+        elif isinstance(value, str):
+            scalar(str.__str__(value))
+        elif value is None or isinstance(value, bool):
+            scalar(value)
+        elif isinstance(value, int):
+            scalar(int.__int__(value))
+        elif isinstance(value, float):
+            scalar(float.__float__(value))
+        elif isinstance(value, (list, tuple)):
+            emitter.emit(SequenceStartEvent(None, None, True, flow_style=False))
+            for item in value:
+                visit(item)
+            emitter.emit(SequenceEndEvent())
+        elif isinstance(value, dict):
+            mapping([(_json_key(k), v) for k, v in value.items()])
+        else:
+            visit(encoder(value))
+
+    serializer.open()
+    emitter.emit(
+        DocumentStartEvent(
+            explicit=serializer.use_explicit_start,
+            version=serializer.use_version,
+            tags=serializer.use_tags,
+        )
+    )
+    with PatchPydanticIter():
+        visit(model)
+    emitter.emit(DocumentEndEvent(explicit=serializer.use_explicit_end))
+    serializer.close()
+
+
+class PydanticYamlDataset(AsyncDatasetMixin, AbstractDataset[BaseModel, BaseModel]):
     """Dataset for saving/loading Pydantic models, based on YAML.
 
     Please note that the Pydantic model must be JSON-serializable.
@@ -33,13 +151,40 @@ class PydanticYamlDataset(AbstractDataset[BaseModel, BaseModel]):
     ```
     """
 
-    def __init__(self, filepath: str) -> None:
+    def __init__(
+        self,
+        filepath: str,
+        fields: Optional[List[str]] = None,
+        partial: Literal["model", "dict"] = "model",
+        trusted: bool = False,
+        validate_sample: float = 0.0,
+        streaming: bool = False,
+        compression: Optional[str] = None,
+    ) -> None:
         """Create a new instance of PydanticYamlDataset to load/save Pydantic models for given filepath.
 
         Args:
         ----
         filepath : The location of the YAML file.
+        fields : If set, only load these (`.`-separated) field paths, e.g. `["x", "nested.y"]`.
+        partial : Whether a partial load returns a (partially-validated) "model" or a "dict"
+            of the selected top-level fields. Ignored if `fields` is not set.
+        trusted : Whether the stored data is known to be good, so models are created without
+            validation (only fields that need conversion, e.g. datetimes, are validated).
+        validate_sample : Fraction of the models that are validated anyway, for trusted loads.
+        streaming : Whether to write the YAML while walking the model (see `emit_yaml`),
+            instead of creating the whole document in memory first. The output is the same.
+        compression : Compression of the file ("gzip", "bz2", "xz", "zstd", ...), or "infer"
+            to infer it from the file extension (e.g. ".yaml.gz"). See `fsspec.available_compressions()`.
         """
+        check_validate_sample(validate_sample)
+        check_compression(compression)
+        self._fields = check_partial(fields, partial)
+        self._partial: Literal["model", "dict"] = partial
+        self._trusted = trusted
+        self._validate_sample = validate_sample
+        self._streaming = streaming
+        self._compression = compression
         # TODO: Update to just save the path and open it with `fsspec` directly
         # parse the path and protocol (e.g. file, http, s3, etc.)
         protocol, path = get_protocol_and_path(filepath)
@@ -59,15 +204,37 @@ class PydanticYamlDataset(AbstractDataset[BaseModel, BaseModel]):
         -------
         Pydantic model.
         """
+        prefetched = claim_prefetched(self)  # see `PrefetchHooks`
+        if prefetched is not None:
+            return prefetched
         # using get_filepath_str ensures that the protocol and path
         # are appended correctly for different filesystems
         load_path = get_filepath_str(self._filepath, self._protocol)
-        with self._fs.open(load_path, mode="r") as f:
-            dct = yaml.safe_load(f)
+        with self._fs.open(load_path, mode="r", compression=self._compression) as f:
+            dct = _safe_load(f)
+        return self._to_model(dct, load_path)
+
+    async def _load_async(self) -> BaseModel:
+        load_path = get_filepath_str(self._filepath, self._protocol)
+        fs, path = await get_async_fs(to_uri(self._protocol, load_path))
+        raw = decompress_bytes(await cat_file(fs, path), resolve_compression(path, self._compression))
+        dct = _safe_load(raw.decode("utf-8"))
+        return self._to_model(dct, load_path)
 
+    def _to_model(self, dct: Any, load_path: str) -> BaseModel:
         assert isinstance(dct, dict), "YAML root must be a mapping."
-        res = dict_to_model(dct)
-        return res  # type: ignore
+        if self._fields is not None:
+            dct = select_fields(dct, self._fields)
+        with record_step(STEP_DICT_TO_MODEL, load_path):
+            res = dict_to_model(
+                dct,
+                partial=self._fields is not None,
+                trusted=self._trusted,
+                validate_sample=self._validate_sample,
+            )
+        if self._fields is not None:
+            return partial_result(res, self._fields, self._partial)  # type: ignore
+        return res
 
     @no_type_check
     def _save(self, data: BaseModel) -> None:
@@ -83,10 +250,43 @@ class PydanticYamlDataset(AbstractDataset[BaseModel, BaseModel]):
         except Exception:
             warnings.warn(f"Failed to create parent path for {save_path}")
 
+        if self._streaming:
+            with self._fs.open(save_path, mode="w", compression=self._compression) as f:
+                emit_yaml(data, f)
+            return
+
+        from pydantic_yaml import to_yaml_file
+
         with PatchPydanticIter():
-            with self._fs.open(save_path, mode="w") as f:
+            with self._fs.open(save_path, mode="w", compression=self._compression) as f:
                 to_yaml_file(f, data)
 
+    async def _save_async(self, data: BaseModel) -> None:
+        if self._streaming:  # writes the file as it goes
+            return await asyncio.to_thread(self._save, data)
+        save_path = get_filepath_str(self._filepath, self._protocol)
+        fs, path = await get_async_fs(to_uri(self._protocol, save_path))
+        try:
+            if "/" in path:
+                await makedirs(fs, path.rsplit("/", maxsplit=1)[0])
+        except Exception:
+            warnings.warn(f"Failed to create parent path for {save_path}")
+        from pydantic_yaml import to_yaml_str
+
+        with PatchPydanticIter():
+            raw = to_yaml_str(data)  # type: ignore
+        compression = resolve_compression(path, self._compression)
+        await pipe_file(fs, path, compress_bytes(raw.encode("utf-8"), compression))
+
     def _describe(self) -> Dict[str, Any]:
         """Return a dict that describes the attributes of the dataset."""
-        return dict(filepath=self.filepath, protocol=self._protocol)
+        return dict(
+            filepath=self.filepath,
+            protocol=self._protocol,
+            fields=self._fields,
+            partial=self._partial,
+            trusted=self._trusted,
+            validate_sample=self._validate_sample,
+            streaming=self._streaming,
+            compression=self._compression,
+        )
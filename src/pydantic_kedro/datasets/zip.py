@@ -1,21 +1,42 @@
 """Zip-file dataset for Pydantic models with arbitrary types."""
 
+import asyncio
 import warnings
+import zipfile
+from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Any, Dict
-from uuid import uuid4
+from typing import Any, Callable, Dict, List, Literal, Optional
 
 import fsspec
-from fsspec.implementations.zip import ZipFileSystem
+from fsspec.core import url_to_fs
+from fsspec.implementations.local import LocalFileSystem
 from kedro.io.core import AbstractDataset
 
-from pydantic_kedro._local_caching import get_cache_dir
+from pydantic_kedro._async_io import AsyncDatasetMixin, get_async_fs, get_file, makedirs, put_file
+from pydantic_kedro._dict_io import check_partial, check_validate_sample
+from pydantic_kedro._local_caching import StagingDirs, make_staging_dir, release_staging_dir
+from pydantic_kedro._prefetch import claim_prefetched
+from pydantic_kedro._process_pool import check_processes
 from pydantic_kedro._pydantic import BaseModel
+from pydantic_kedro.instrumentation import STEP_READ_METADATA, STEP_STAGE_COPY, record_step
 
-from .folder import PydanticFolderDataset
+from .folder import (
+    METADATA_FILES,
+    FolderFormatInspection,
+    MetadataFormat,
+    PydanticFolderDataset,
+    _metadata_key,
+    _parse_metadata,
+    member_filter,
+    select_catalog,
+)
 
+# Block size for ranged reads of remote zip files when inspecting:
+# the central directory and the metadata are usually small, so we don't want to read ahead much.
+INSPECT_BLOCK_SIZE = 2**16
 
-class PydanticZipDataset(AbstractDataset[BaseModel, BaseModel]):
+
+class PydanticZipDataset(AsyncDatasetMixin, AbstractDataset[BaseModel, BaseModel]):
     """Dataset for saving/loading Pydantic models, based on saving sub-datasets in a ZIP file.
 
     This allows fields with arbitrary types.
@@ -30,22 +51,75 @@ class PydanticZipDataset(AbstractDataset[BaseModel, BaseModel]):
     ds.save(MyModel(x="example"))
     assert ds.load().x == "example"
     ```
+
+    As with [PydanticFolderDataset][pydantic_kedro.PydanticFolderDataset], passing `fields`
+    only loads (and extracts) the members required for these fields.
     """
 
-    def __init__(self, filepath: str) -> None:
+    def __init__(
+        self,
+        filepath: str,
+        fields: Optional[List[str]] = None,
+        partial: Literal["model", "dict"] = "model",
+        metadata_format: MetadataFormat = "json",
+        trusted: bool = False,
+        validate_sample: float = 0.0,
+        processes: int = 0,
+    ) -> None:
         """Create a new instance of PydanticZipDataset to load/save Pydantic models for given filepath.
 
         Args:
         ----
         filepath : The location of the Zip file.
+        fields : If set, only load these (`.`-separated) field paths, e.g. `["df", "nested.arr"]`.
+        partial : Whether a partial load returns a (partially-validated) "model" or a "dict"
+            of the selected top-level fields. Ignored if `fields` is not set.
+        metadata_format : Format of the metadata when saving, see
+            [PydanticFolderDataset][pydantic_kedro.PydanticFolderDataset].
+        trusted : Whether the stored data is known to be good, so models are created without
+            validation, see [PydanticFolderDataset][pydantic_kedro.PydanticFolderDataset].
+        validate_sample : Fraction of the models that are validated anyway, for trusted loads.
+        processes : Number of worker processes that save and load the members, see
+            [PydanticFolderDataset][pydantic_kedro.PydanticFolderDataset].
         """
+        if metadata_format not in METADATA_FILES:
+            raise ValueError(f"Unknown metadata format: {metadata_format!r}")
+        check_validate_sample(validate_sample)
+        check_processes(processes)
         self._filepath = filepath  # NOTE: This is not checked when created.
+        self._fields = check_partial(fields, partial)
+        self._partial: Literal["model", "dict"] = partial
+        self._metadata_format: MetadataFormat = metadata_format
+        self._trusted = trusted
+        self._validate_sample = validate_sample
+        self._processes = processes
+        self._staging = StagingDirs()
 
     @property
     def filepath(self) -> str:
         """File path name."""
         return str(self._filepath)
 
+    def inspect(self) -> FolderFormatInspection:
+        """Read the model metadata and member sizes, without extracting the archive.
+
+        Only the zip central directory and the metadata are read. Remote files are read with
+        small ranged (block-cached) reads, so the large members are never downloaded.
+        """
+        fs, path = url_to_fs(self._filepath)
+        opts: Dict[str, Any] = {}
+        if not isinstance(fs, LocalFileSystem):
+            opts = dict(block_size=INSPECT_BLOCK_SIZE, cache_type="blockcache")
+        with record_step(STEP_READ_METADATA, self._filepath) as ev:
+            with fs.open(path, mode="rb", **opts) as f:
+                with zipfile.ZipFile(f) as zf:
+                    infos = zf.infolist()
+                    raw_meta = zf.read(_metadata_key(zf.namelist()))
+            if ev is not None:
+                ev.nbytes = len(raw_meta)
+        file_sizes = {info.filename: info.file_size for info in infos if not info.is_dir()}
+        return FolderFormatInspection.from_metadata(_parse_metadata(raw_meta), file_sizes)
+
     def _load(self) -> BaseModel:
         """Load Pydantic model from the filepath.
 
@@ -53,22 +127,77 @@ class PydanticZipDataset(AbstractDataset[BaseModel, BaseModel]):
         -------
         Pydantic model.
         """
-        filepath = self._filepath
+        prefetched = claim_prefetched(self)  # see `PrefetchHooks`
+        if prefetched is not None:
+            return prefetched
+        with fsspec.open(self._filepath) as zip_file:
+            tmpdir = self._extract(zip_file)
+        # Load folder dataset
+        return self._load_staged(tmpdir)
+
+    async def _load_async(self) -> BaseModel:
+        fs, path = await get_async_fs(self._filepath)
+        # Download the archive to a local file, rather than into memory
+        with TemporaryDirectory(prefix="pyd_kedro_") as tmp:
+            await get_file(fs, path, f"{tmp}/model.zip")
+            tmpdir = await asyncio.to_thread(self._extract_file, f"{tmp}/model.zip")
+        return await asyncio.to_thread(self._load_staged, tmpdir)
+
+    def _extract_file(self, local_path: str) -> Path:
+        """Extract the local zip file to a new local staging directory."""
+        with open(local_path, mode="rb") as zip_file:
+            return self._extract(zip_file)
+
+    def _load_staged(self, tmpdir: Path) -> BaseModel:
+        pfds = PydanticFolderDataset(
+            str(tmpdir),
+            fields=self._fields,
+            partial=self._partial,
+            trusted=self._trusted,
+            validate_sample=self._validate_sample,
+            processes=self._processes,
+        )
+        return pfds._load_staged(tmpdir, staging=self._staging)
+
+    def _release(self) -> None:
+        """Remove the staging directories that were kept for lazily-loaded members."""
+        super()._release()
+        self._staging.release()
+
+    def _extract(self, zip_file: Any) -> Path:
+        """Extract the opened zip file to a new local staging directory."""
         # Making a temp directory in the current cache dir location
-        tmpdir = get_cache_dir() / str(uuid4()).replace("-", "")
-        tmpdir.mkdir(exist_ok=False, parents=True)
+        tmpdir = make_staging_dir()
+        try:
+            self._extract_to(zip_file, tmpdir)
+        except BaseException:
+            release_staging_dir(tmpdir)
+            raise
+        return tmpdir
+
+    def _extract_to(self, zip_file: Any, tmpdir: Path) -> None:
+        from fsspec.implementations.zip import ZipFileSystem
+
         m_local = fsspec.get_mapper(str(tmpdir))
         # Unzip via copying to folder
-        with fsspec.open(filepath) as zip_file:
+        with record_step(STEP_STAGE_COPY, self._filepath) as ev:
             zip_fs = ZipFileSystem(fo=zip_file)  # type: ignore
             m_zip = zip_fs.get_mapper()
-            for k, v in m_zip.items():
+            keep: Callable[[str], bool] = lambda k: True  # noqa: E731
+            if self._fields is not None:
+                # Only extract the members that we need
+                meta = _parse_metadata(m_zip[_metadata_key(m_zip.keys())])
+                keep = member_filter(select_catalog(meta, self._fields))
+            nbytes = 0
+            for k in m_zip.keys():
+                if not keep(k):
+                    continue
+                v = m_zip[k]
                 m_local[k] = v
+                nbytes += len(v)
             zip_fs.close()
-        # Load folder dataset
-        pfds = PydanticFolderDataset(str(tmpdir))
-        res = pfds.load()
-        return res
+            if ev is not None:
+                ev.nbytes = nbytes
 
     def _save(self, data: BaseModel) -> None:
         """Save Pydantic model to the filepath."""
@@ -84,16 +213,57 @@ class PydanticZipDataset(AbstractDataset[BaseModel, BaseModel]):
 
         with TemporaryDirectory(prefix="pyd_kedro_") as tmpdir:
             # Save folder dataset
-            pfds = PydanticFolderDataset(tmpdir)
+            pfds = PydanticFolderDataset(
+                tmpdir, metadata_format=self._metadata_format, processes=self._processes
+            )
             pfds.save(data)
-            # Zip via copying to folder
-            m_local = fsspec.get_mapper(tmpdir)
             with fsspec.open(filepath, mode="wb") as zip_file:
-                zip_fs = ZipFileSystem(fo=zip_file, mode="w")  # type: ignore
-                m_zip = zip_fs.get_mapper()
-                for k, v in m_local.items():
-                    m_zip[k] = v
-                zip_fs.close()
+                self._compress(tmpdir, zip_file)
+
+    async def _save_async(self, data: BaseModel) -> None:
+        fs, path = await get_async_fs(self._filepath)
+        try:
+            if "/" in path:
+                await makedirs(fs, path.rsplit("/", maxsplit=1)[0])
+        except Exception:
+            warnings.warn(f"Failed to create parent path for {self._filepath}")
+
+        def _build(tmpdir: str) -> None:
+            folder = f"{tmpdir}/folder"
+            PydanticFolderDataset(
+                folder, metadata_format=self._metadata_format, processes=self._processes
+            ).save(data)
+            with open(f"{tmpdir}/model.zip", mode="wb") as zip_file:
+                self._compress(folder, zip_file)
+
+        with TemporaryDirectory(prefix="pyd_kedro_") as tmpdir:
+            await asyncio.to_thread(_build, tmpdir)
+            await put_file(fs, f"{tmpdir}/model.zip", path)
+
+    def _compress(self, tmpdir: str, zip_file: Any) -> None:
+        """Zip the local folder into the opened (writable) file."""
+        from fsspec.implementations.zip import ZipFileSystem
+
+        # Zip via copying to folder
+        m_local = fsspec.get_mapper(tmpdir)
+        with record_step(STEP_STAGE_COPY, self._filepath) as ev:
+            zip_fs = ZipFileSystem(fo=zip_file, mode="w")  # type: ignore
+            m_zip = zip_fs.get_mapper()
+            nbytes = 0
+            for k, v in m_local.items():
+                m_zip[k] = v
+                nbytes += len(v)
+            zip_fs.close()
+            if ev is not None:
+                ev.nbytes = nbytes
 
     def _describe(self) -> Dict[str, Any]:
-        return dict(filepath=self.filepath)
+        return dict(
+            filepath=self.filepath,
+            fields=self._fields,
+            partial=self._partial,
+            metadata_format=self._metadata_format,
+            trusted=self._trusted,
+            validate_sample=self._validate_sample,
+            processes=self._processes,
+        )
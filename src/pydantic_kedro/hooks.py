@@ -0,0 +1,281 @@
+"""Kedro hooks for `pydantic-kedro`.
+
+Register these in your project's `settings.py`:
+
+```python
+from pydantic_kedro.hooks import InstrumentationHooks, PrefetchHooks
+
+HOOKS = (InstrumentationHooks(), PrefetchHooks())
+```
+"""
+
+import logging
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from fsspec.core import url_to_fs
+from kedro.framework.hooks import hook_impl
+from kedro.io.core import AbstractDataset
+
+from ._prefetch import discard_prefetched, prefetch
+from .datasets.auto import PydanticAutoDataset
+from .datasets.folder import PydanticFolderDataset
+from .datasets.json import PydanticJsonDataset
+from .datasets.pack import PydanticPackDataset
+from .datasets.yaml import PydanticYamlDataset
+from .datasets.zip import PydanticZipDataset
+from .instrumentation import Instrument, InstrumentEvent, add_instrument, remove_instrument
+
+__all__ = ["InstrumentationHooks", "PrefetchHooks"]
+
+logger = logging.getLogger(__name__)
+
+
+class InstrumentationHooks(Instrument):
+    """Kedro hooks that profile pydantic-kedro datasets during a pipeline run.
+
+    Every instrumented step is attributed to the catalog dataset that is being loaded
+    or saved at the time. At the end of the run, a per-dataset summary is logged,
+    including the slowest members.
+
+    Parameters
+    ----------
+    level : int
+        Logging level of the summary.
+    top_members : int
+        How many of the slowest member loads/saves to report per dataset.
+    """
+
+    def __init__(self, level: int = logging.INFO, top_members: int = 5) -> None:
+        self.level = level
+        self.top_members = top_members
+        self.events: List[Tuple[Optional[str], InstrumentEvent]] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def on_event(self, event: InstrumentEvent) -> None:
+        """Record the event, tagged with the current dataset name."""
+        name: Optional[str] = getattr(self._local, "dataset_name", None)
+        with self._lock:
+            self.events.append((name, event))
+
+    def _set_current(self, dataset_name: Optional[str]) -> None:
+        self._local.dataset_name = dataset_name
+
+    @hook_impl
+    def before_pipeline_run(self, run_params: Dict[str, Any], pipeline: Any, catalog: Any) -> None:
+        """Start recording."""
+        self.events = []
+        add_instrument(self)
+
+    @hook_impl
+    def before_dataset_loaded(self, dataset_name: str, node: Any) -> None:
+        """Attribute the following steps to `dataset_name`."""
+        self._set_current(dataset_name)
+
+    @hook_impl
+    def after_dataset_loaded(self, dataset_name: str, data: Any, node: Any) -> None:
+        """Stop attributing steps to `dataset_name`."""
+        self._set_current(None)
+
+    @hook_impl
+    def before_dataset_saved(self, dataset_name: str, data: Any, node: Any) -> None:
+        """Attribute the following steps to `dataset_name`."""
+        self._set_current(dataset_name)
+
+    @hook_impl
+    def after_dataset_saved(self, dataset_name: str, data: Any, node: Any) -> None:
+        """Stop attributing steps to `dataset_name`."""
+        self._set_current(None)
+
+    @hook_impl
+    def after_pipeline_run(
+        self, run_params: Dict[str, Any], run_result: Dict[str, Any], pipeline: Any, catalog: Any
+    ) -> None:
+        """Stop recording and log the summary."""
+        remove_instrument(self)
+        self.log_summary()
+
+    @hook_impl
+    def on_pipeline_error(
+        self, error: Exception, run_params: Dict[str, Any], pipeline: Any, catalog: Any
+    ) -> None:
+        """Stop recording and log the summary."""
+        remove_instrument(self)
+        self.log_summary()
+
+    def summary(self) -> Dict[Optional[str], Dict[str, Tuple[int, float, int]]]:
+        """Summarize recorded events as `{dataset_name: {step: (count, seconds, bytes)}}`."""
+        res: Dict[Optional[str], Dict[str, Tuple[int, float, int]]] = defaultdict(dict)
+        for name, ev in self.events:
+            count, secs, nbytes = res[name].get(ev.step, (0, 0.0, 0))
+            res[name][ev.step] = (count + 1, secs + ev.duration, nbytes + (ev.nbytes or 0))
+        return dict(res)
+
+    def log_summary(self) -> None:
+        """Log the summary of the recorded events."""
+        for name, steps in self.summary().items():
+            for step, (count, secs, nbytes) in steps.items():
+                logger.log(
+                    self.level,
+                    "pydantic-kedro [%s] %s: %d calls, %.3fs, %d bytes",
+                    name or "<no dataset>",
+                    step,
+                    count,
+                    secs,
+                    nbytes,
+                )
+            members = [ev for nm, ev in self.events if nm == name and ev.dataset_type is not None]
+            members.sort(key=lambda ev: ev.duration, reverse=True)
+            for ev in members[: self.top_members]:
+                logger.log(
+                    self.level,
+                    "pydantic-kedro [%s] slow member %s (%s): %.3fs, %s bytes",
+                    name or "<no dataset>",
+                    ev.path,
+                    ev.dataset_type,
+                    ev.duration,
+                    "?" if ev.nbytes is None else ev.nbytes,
+                )
+
+
+# Datasets that claim prefetched results when loading
+PREFETCH_DATASETS = (
+    PydanticAutoDataset,
+    PydanticFolderDataset,
+    PydanticJsonDataset,
+    PydanticPackDataset,
+    PydanticYamlDataset,
+    PydanticZipDataset,
+)
+
+
+def _stored_size(ds: AbstractDataset) -> Optional[int]:
+    """Get the stored size of the dataset's file or folder, or `None` if unknown."""
+    try:
+        uri = str(ds.filepath)  # type: ignore
+        protocol = getattr(ds, "_protocol", None)
+        if "://" not in uri and protocol not in (None, "file"):
+            uri = f"{protocol}://{uri}"
+        fs, path = url_to_fs(uri)
+        return int(fs.du(path))
+    except Exception:
+        return None
+
+
+class PrefetchHooks:
+    """Kedro hooks that load pydantic-kedro inputs of a pipeline ahead of time, in background threads.
+
+    When the pipeline starts, the pipeline inputs (that aren't produced by any node)
+    are loaded in the order the nodes need them, as long as they fit in the budget.
+    When a node loads one of them, it gets the prefetched model right away (or waits
+    for the prefetch to finish), and the budget is freed for the next inputs.
+    If a prefetch fails, the dataset is simply loaded again.
+
+    Only the pydantic-kedro model datasets are prefetched. Local staging copies are
+    limited separately, see [set_cache_quota][pydantic_kedro.set_cache_quota].
+
+    Parameters
+    ----------
+    max_bytes : int
+        Budget for the stored size of datasets that are prefetched, but not used yet.
+        Datasets that are bigger than the whole budget are never prefetched.
+    max_workers : int
+        Number of background threads.
+    """
+
+    def __init__(self, max_bytes: int = 2**30, max_workers: int = 2) -> None:
+        if max_workers < 1:
+            raise ValueError(f"The `max_workers` must be positive, but got {max_workers!r}")
+        self.max_bytes = max_bytes
+        self.max_workers = max_workers
+        self.prefetched: List[str] = []
+        self._queue: Deque[Tuple[str, AbstractDataset, int]] = deque()
+        self._started: List[AbstractDataset] = []
+        self._reserved = 0
+        self._running = False
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.RLock()
+
+    def plan(self, pipeline: Any, catalog: Any) -> List[Tuple[str, AbstractDataset, int]]:
+        """Get the `(name, dataset, size)` of the inputs to prefetch, in the order they are needed."""
+        free_inputs = pipeline.inputs()
+        seen = set()
+        res: List[Tuple[str, AbstractDataset, int]] = []
+        for nd in pipeline.nodes:  # topologically sorted
+            for name in nd.inputs:
+                if name in seen or name not in free_inputs:
+                    continue
+                seen.add(name)
+                try:
+                    ds = catalog._get_dataset(name)
+                except Exception:
+                    continue
+                if not isinstance(ds, PREFETCH_DATASETS):
+                    continue
+                size = _stored_size(ds)
+                if size is None or size > self.max_bytes:
+                    logger.debug("Not prefetching %r (size: %s)", name, size)
+                    continue
+                res.append((name, ds, size))
+        return res
+
+    def _fill(self) -> None:
+        """Start prefetching the next datasets that fit in the budget."""
+        with self._lock:
+            while self._running and self._queue:
+                name, ds, size = self._queue[0]
+                if self._reserved + size > self.max_bytes:
+                    break
+                self._queue.popleft()
+                self._reserved += size
+                self.prefetched.append(name)
+                self._started.append(ds)
+                assert self._executor is not None
+                prefetch(ds, self._executor, on_release=partial(self._on_release, size))
+
+    def _on_release(self, size: int) -> None:
+        with self._lock:
+            self._reserved -= size
+        self._fill()
+
+    @hook_impl
+    def before_pipeline_run(self, run_params: Dict[str, Any], pipeline: Any, catalog: Any) -> None:
+        """Start prefetching the pipeline inputs."""
+        with self._lock:
+            self.prefetched = []
+            self._started = []
+            self._reserved = 0
+            self._queue = deque(self.plan(pipeline, catalog))
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="pydantic-kedro-prefetch"
+            )
+            self._running = True
+        self._fill()
+
+    def _stop(self) -> None:
+        with self._lock:
+            self._running = False
+            self._queue.clear()
+            started, self._started = self._started, []
+            executor, self._executor = self._executor, None
+        discard_prefetched(started)
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @hook_impl
+    def after_pipeline_run(
+        self, run_params: Dict[str, Any], run_result: Dict[str, Any], pipeline: Any, catalog: Any
+    ) -> None:
+        """Stop prefetching and forget unused results."""
+        self._stop()
+
+    @hook_impl
+    def on_pipeline_error(
+        self, error: Exception, run_params: Dict[str, Any], pipeline: Any, catalog: Any
+    ) -> None:
+        """Stop prefetching and forget unused results."""
+        self._stop()
@@ -0,0 +1,185 @@
+"""Instrumentation of loading and saving steps.
+
+Instruments receive an [InstrumentEvent][pydantic_kedro.instrumentation.InstrumentEvent]
+for every step of a load or save: metadata parsing, each sub-dataset load/save,
+remote staging copies and model reconstruction (`dict_to_model`).
+
+Example
+-------
+```python
+import logging
+from pydantic_kedro.instrumentation import LoggingInstrument, instrumented
+
+logging.basicConfig(level=logging.INFO)
+with instrumented(LoggingInstrument(level=logging.INFO)):
+    model = load_model("s3://bucket/path/to/model.zip")
+```
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Optional, Tuple
+
+__all__ = [
+    "Instrument",
+    "InstrumentEvent",
+    "LoggingInstrument",
+    "add_instrument",
+    "get_instruments",
+    "instrumented",
+    "record_step",
+    "remove_instrument",
+]
+
+logger = logging.getLogger(__name__)
+
+STEP_READ_METADATA = "read_metadata"
+STEP_WRITE_METADATA = "write_metadata"
+STEP_LOAD_MEMBER = "load_member"
+STEP_SAVE_MEMBER = "save_member"
+STEP_STAGE_COPY = "stage_copy"
+STEP_DICT_TO_MODEL = "dict_to_model"
+
+
+@dataclass
+class InstrumentEvent:
+    """Information about a single instrumented step.
+
+    Attributes
+    ----------
+    step : str
+        Name of the step, e.g. "load_member" or "stage_copy".
+    path : str
+        Path (or URI) the step operated on.
+    dataset_type : str, optional
+        Import path of the sub-dataset type, for member loads/saves.
+    nbytes : int, optional
+        Number of bytes moved, if known.
+    duration : float
+        Wall time of the step, in seconds.
+    error : BaseException, optional
+        The exception raised by the step, if it failed.
+    """
+
+    step: str
+    path: str
+    dataset_type: Optional[str] = None
+    nbytes: Optional[int] = None
+    duration: float = 0.0
+    error: Optional[BaseException] = None
+
+
+class Instrument:
+    """Base class for instruments. Override `on_event` to receive events."""
+
+    def on_event(self, event: InstrumentEvent) -> None:
+        """Handle a finished step."""
+
+
+class LoggingInstrument(Instrument):
+    """Instrument that logs every step."""
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.DEBUG) -> None:
+        self.logger = logger if logger is not None else logging.getLogger("pydantic_kedro")
+        self.level = level
+
+    def on_event(self, event: InstrumentEvent) -> None:
+        """Log the event."""
+        self.logger.log(
+            self.level,
+            "%s %s [%s]: %.4fs, %s bytes%s",
+            event.step,
+            event.path,
+            event.dataset_type or "-",
+            event.duration,
+            "?" if event.nbytes is None else event.nbytes,
+            "" if event.error is None else f" (failed: {event.error!r})",
+        )
+
+
+_INSTRUMENTS: Tuple[Instrument, ...] = ()
+"""Currently active instruments. This is replaced, not mutated, for thread safety."""
+_INSTRUMENTS_LOCK = threading.Lock()
+
+
+def get_instruments() -> Tuple[Instrument, ...]:
+    """Get the currently active instruments."""
+    return _INSTRUMENTS
+
+
+def add_instrument(instrument: Instrument) -> None:
+    """Activate an instrument globally."""
+    global _INSTRUMENTS
+
+    if not isinstance(instrument, Instrument):
+        raise TypeError(f"Expected an Instrument, but got {instrument!r}")
+    with _INSTRUMENTS_LOCK:
+        if instrument not in _INSTRUMENTS:
+            _INSTRUMENTS = _INSTRUMENTS + (instrument,)
+
+
+def remove_instrument(instrument: Instrument) -> None:
+    """Deactivate an instrument. Does nothing if it isn't active."""
+    global _INSTRUMENTS
+
+    with _INSTRUMENTS_LOCK:
+        _INSTRUMENTS = tuple(x for x in _INSTRUMENTS if x is not instrument)
+
+
+@contextmanager
+def instrumented(*instruments: Instrument) -> Iterator[None]:
+    """Activate instruments within a context."""
+    for inst in instruments:
+        add_instrument(inst)
+    try:
+        yield
+    finally:
+        for inst in instruments:
+            remove_instrument(inst)
+
+
+@contextmanager
+def record_step(
+    step: str, path: str, dataset_type: Optional[str] = None, nbytes_path: Optional[str] = None
+) -> Iterator[Optional[InstrumentEvent]]:
+    """Time a step and send it to all active instruments.
+
+    This yields `None` if no instruments are active, so callers can skip
+    computing extra information (such as byte counts) when nobody listens.
+    If `nbytes_path` is given, the size of that file or directory is used as the number
+    of bytes, and measured after the step, so it doesn't count towards its duration.
+    """
+    instruments = _INSTRUMENTS
+    if not instruments:
+        yield None
+        return
+    event = InstrumentEvent(step=step, path=str(path), dataset_type=dataset_type)
+    t0 = time.perf_counter()
+    try:
+        yield event
+    except BaseException as exc:
+        event.error = exc
+        raise
+    finally:
+        event.duration = time.perf_counter() - t0
+        if nbytes_path is not None and event.error is None:
+            event.nbytes = path_size(nbytes_path)
+        for inst in instruments:
+            try:
+                inst.on_event(event)
+            except Exception:
+                logger.exception("Instrument %r failed to handle event %r", inst, event)
+
+
+def path_size(path: str) -> Optional[int]:
+    """Get the total size of a file or directory, or `None` if it can't be determined."""
+    import fsspec
+
+    try:
+        fs = fsspec.open(path).fs
+        return int(fs.du(path, total=True))
+    except Exception:
+        return None
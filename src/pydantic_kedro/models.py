@@ -1,15 +1,16 @@
 """Models to use as base classes."""
 
-from typing import Callable, Dict, Type
+from typing import Callable, Dict, Literal, Type, Union
 
 from kedro.io import AbstractDataset
-from kedro_datasets.pickle.pickle_dataset import PickleDataset
 
 from pydantic_kedro._pydantic import BaseConfig, BaseModel
 
 
-def _kedro_default(x: str) -> PickleDataset:
+def _kedro_default(x: str) -> AbstractDataset:
     """Definition of default dataset."""
+    from kedro_datasets.pickle.pickle_dataset import PickleDataset
+
     return PickleDataset(filepath=x)
 
 
@@ -20,6 +21,12 @@ class ArbConfig(BaseConfig):
 
     kedro_map: Dict[Type, Callable[[str], AbstractDataset]] = {}
     kedro_default: Callable[[str], AbstractDataset] = _kedro_default
+    kedro_npy: bool = False
+    kedro_npy_mmap_mode: Union[Literal["r", "r+", "c"], Literal[False]] = "r"
+    kedro_arrow: bool = False
+    kedro_arrow_memory_map: bool = True
+    kedro_pack_collections: bool = False
+    kedro_inline_max_bytes: int = 0
 
 
 class ArbModel(BaseModel):
@@ -30,6 +37,19 @@ class ArbModel(BaseModel):
     - `kedro_map`, which maps a type to a dataset constructor to use.
     - `kedro_default`, which specifies the default dataset type to use
       ([kedro_datasets.pickle.PickleDataset][])
+    - `kedro_npy`, which maps `numpy.ndarray` to the built-in
+      [NpyDataset][pydantic_kedro.datasets.npy.NpyDataset] (unless set in `kedro_map`).
+    - `kedro_npy_mmap_mode`, the memory-map mode for loading arrays with `kedro_npy`
+      (`"r"` by default, `False` to read arrays into memory).
+    - `kedro_arrow`, which maps `pandas.DataFrame` and `pyarrow.Table` to the built-in
+      [ArrowDataset][pydantic_kedro.datasets.arrow.ArrowDataset] (unless set in `kedro_map`).
+    - `kedro_arrow_memory_map`, whether to memory-map Arrow files when loading (`True` by default).
+    - `kedro_pack_collections`, whether to save lists and dicts of arrays (or of dataframes) as a single
+      [PackedCollectionDataset][pydantic_kedro.datasets.packed.PackedCollectionDataset] file,
+      rather than one file per item (`False` by default).
+    - `kedro_inline_max_bytes`, the size below which objects saved with the default Pickle dataset
+      or with `kedro_npy` are stored inside the metadata, rather than as separate files
+      (`0` by default, which disables this).
 
     These are pseudo-inherited, see [config-inheritence][].
     You do not actually need to inherit from `ArbModel` for this to work, however it can help with
@@ -1,22 +1,65 @@
 """Utilities for reading/writing objects."""
 
-from typing import Literal, Type, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, List, Literal, Optional, Sequence, Type, TypeVar, Union
 
-from kedro.io.core import AbstractDataset
+import fsspec
+from kedro.io.core import get_protocol_and_path
 
 from pydantic_kedro._pydantic import BaseModel
 from pydantic_kedro.datasets.auto import PydanticAutoDataset
-from pydantic_kedro.datasets.folder import PydanticFolderDataset
-from pydantic_kedro.datasets.json import PydanticJsonDataset
-from pydantic_kedro.datasets.yaml import PydanticYamlDataset
-from pydantic_kedro.datasets.zip import PydanticZipDataset
 
-__all__ = ["load_model", "save_model"]
+if TYPE_CHECKING:
+    from pydantic_kedro.datasets.folder import FolderFormatInspection, PydanticFolderDataset
+    from pydantic_kedro.datasets.json import PydanticJsonDataset
+    from pydantic_kedro.datasets.pack import PydanticPackDataset
+    from pydantic_kedro.datasets.yaml import PydanticYamlDataset
+    from pydantic_kedro.datasets.zip import PydanticZipDataset
+
+__all__ = [
+    "BatchError",
+    "inspect_model",
+    "load_model",
+    "load_model_async",
+    "load_models",
+    "save_model",
+    "save_model_async",
+    "save_models",
+]
 
 T = TypeVar("T", bound=BaseModel)
+R = TypeVar("R")
+
+
+class BatchError(Exception):
+    """Some items of a batch operation failed.
 
+    Attributes
+    ----------
+    results : list
+        Results in the order of the inputs; `None` for items that failed.
+    errors : dict
+        Mapping of the input index to the exception raised for it.
+    """
 
-def load_model(uri: str, supercls: Type[T] = BaseModel) -> T:  # type: ignore
+    def __init__(self, results: List[Optional[object]], errors: Dict[int, BaseException]) -> None:
+        self.results = results
+        self.errors = errors
+        lines = [f"  [{i}] {type(e).__name__}: {e}" for i, e in sorted(errors.items())]
+        super().__init__(f"{len(errors)} of {len(results)} items failed:\n" + "\n".join(lines))
+
+
+def load_model(
+    uri: str,
+    supercls: Type[T] = BaseModel,  # type: ignore
+    *,
+    fields: Optional[List[str]] = None,
+    partial: Literal["model", "dict"] = "model",
+    cache: bool = False,
+    cache_copy: bool = False,
+    trusted: bool = False,
+    validate_sample: float = 0.0,
+) -> T:
     """Load a Pydantic model from a given URI.
 
     Parameters
@@ -26,19 +69,82 @@ def load_model(uri: str, supercls: Type[T] = BaseModel) -> T:  # type: ignore
     supercls : type
         Ensure that the loaded model is of this type.
         By default, this is just BaseModel.
+    fields : list of str, optional
+        If set, only load these (`.`-separated) field paths, e.g. `["df", "nested.arr"]`.
+        The remaining fields get their defaults, or are left unset.
+    partial : {"model", "dict"}
+        Whether a partial load returns a (partially-validated) "model" or a "dict"
+        of the selected top-level fields. Ignored if `fields` is not set.
+        The `supercls` is not checked for "dict" results.
+    cache : bool
+        Whether to use the process-level model cache, see
+        [PydanticAutoDataset][pydantic_kedro.PydanticAutoDataset].
+    cache_copy : bool
+        Whether a cached model is returned as a deep copy. Ignored if `cache` is not set.
+    trusted : bool
+        Whether the stored data is known to be good, so models are created without validation.
+        Only fields that need conversion (e.g. datetimes, enums or tuples) are validated.
+    validate_sample : float
+        Fraction of the models that are validated anyway, for trusted loads.
     """
-    ds = PydanticAutoDataset(filepath=uri)
+    ds = PydanticAutoDataset(
+        filepath=uri,
+        fields=fields,
+        partial=partial,
+        cache=cache,
+        cache_copy=cache_copy,
+        trusted=trusted,
+        validate_sample=validate_sample,
+    )
     model = ds.load()
+    if fields is not None and partial == "dict":
+        return model  # type: ignore
     if not isinstance(model, supercls):
         raise TypeError(f"Expected {supercls}, but got {type(model)}.")
     return model  # type: ignore
 
 
+def inspect_model(uri: str) -> "FolderFormatInspection":
+    """Read the class, pure fields and member catalog of a saved model, without loading it.
+
+    This supports the folder, zip and pack formats. For remote zip files, only the central directory
+    and `meta.json` are fetched (via ranged reads); for pack files, only the footer.
+
+    Parameters
+    ----------
+    uri : str
+        The path or URI of the saved model.
+
+    Returns
+    -------
+    FolderFormatInspection
+        The model metadata (`model_class`, `model_info`, `catalog`) and `member_sizes`.
+    """
+    from pydantic_kedro.datasets.folder import PydanticFolderDataset
+    from pydantic_kedro.datasets.pack import PydanticPackDataset, is_pack
+    from pydantic_kedro.datasets.zip import INSPECT_BLOCK_SIZE, PydanticZipDataset
+
+    fs, path = fsspec.core.url_to_fs(uri)
+    if fs.isdir(path):
+        return PydanticFolderDataset(uri).inspect()
+    # A small block, so remote files aren't read past the magic bytes
+    with fs.open(path, mode="rb", block_size=INSPECT_BLOCK_SIZE) as f:
+        head = f.read(8)
+    if is_pack(head):
+        return PydanticPackDataset(uri).inspect()
+    try:
+        return PydanticZipDataset(uri).inspect()
+    except Exception as exc:
+        raise RuntimeError(
+            f"Failed to inspect {uri!r}: only folder, zip and pack models are supported."
+        ) from exc
+
+
 def save_model(
     model: BaseModel,
     uri: str,
     *,
-    format: Literal["auto", "zip", "folder", "yaml", "json"] = "auto",
+    format: Literal["auto", "zip", "folder", "yaml", "json", "pack"] = "auto",
 ) -> None:
     """Save a Pydantic model to a given URI.
 
@@ -48,26 +154,204 @@ def save_model(
         Pydantic model to save. This can be 'pure' (JSON-safe) or 'arbitrary'.
     uri : str
         The path or URI to save the model to.
-    format : {"auto", "zip", "folder", "yaml", "json"}
+    format : {"auto", "zip", "folder", "yaml", "json", "pack"}
         The dataset format to use.
         "auto" will use [PydanticAutoDataset][pydantic_kedro.PydanticAutoDataset].
     """
     if not isinstance(model, BaseModel):
         raise TypeError(f"Expected Pydantic model, but got {model!r}")
-    ds: AbstractDataset
+    _get_dataset(uri, format).save(model)
+
+
+def _get_dataset(uri: str, format: Literal["auto", "zip", "folder", "yaml", "json", "pack"]) -> Union[
+    PydanticAutoDataset,
+    "PydanticZipDataset",
+    "PydanticFolderDataset",
+    "PydanticYamlDataset",
+    "PydanticJsonDataset",
+    "PydanticPackDataset",
+]:
+    """Create the dataset for the given format."""
     if format == "auto":
-        ds = PydanticAutoDataset(uri)
-    elif format == "zip":
-        ds = PydanticZipDataset(uri)
-    elif format == "folder":
-        ds = PydanticFolderDataset(uri)
-    elif format == "yaml":
-        ds = PydanticYamlDataset(uri)
-    elif format == "json":
-        ds = PydanticJsonDataset(uri)
-    else:
-        raise ValueError(
-            f"Unknown dataset format {format}, "
-            'expected one of: ["auto", "zip", "folder", "yaml", "json"]'
+        return PydanticAutoDataset(uri)
+    elif format in ("zip", "folder", "yaml", "json", "pack"):
+        return PydanticAutoDataset(uri)._get_ds(format)
+    raise ValueError(
+        f"Unknown dataset format {format}, "
+        'expected one of: ["auto", "zip", "folder", "yaml", "json", "pack"]'
+    )
+
+
+async def load_model_async(
+    uri: str,
+    supercls: Type[T] = BaseModel,  # type: ignore
+    *,
+    fields: Optional[List[str]] = None,
+    partial: Literal["model", "dict"] = "model",
+    cache: bool = False,
+    cache_copy: bool = False,
+    trusted: bool = False,
+    validate_sample: float = 0.0,
+) -> T:
+    """Load a Pydantic model from a given URI, without blocking the event loop.
+
+    Remote reads use the async implementation of the `fsspec` filesystem, if it has one
+    (except for cached loads, which run in a worker thread).
+    See [load_model][pydantic_kedro.load_model] for the parameters.
+    """
+    ds = PydanticAutoDataset(
+        filepath=uri,
+        fields=fields,
+        partial=partial,
+        cache=cache,
+        cache_copy=cache_copy,
+        trusted=trusted,
+        validate_sample=validate_sample,
+    )
+    model = await ds.load_async()
+    if fields is not None and partial == "dict":
+        return model  # type: ignore
+    if not isinstance(model, supercls):
+        raise TypeError(f"Expected {supercls}, but got {type(model)}.")
+    return model  # type: ignore
+
+
+async def save_model_async(
+    model: BaseModel,
+    uri: str,
+    *,
+    format: Literal["auto", "zip", "folder", "yaml", "json", "pack"] = "auto",
+) -> None:
+    """Save a Pydantic model to a given URI, without blocking the event loop.
+
+    Remote writes use the async implementation of the `fsspec` filesystem, if it has one.
+    See [save_model][pydantic_kedro.save_model] for the parameters.
+    """
+    if not isinstance(model, BaseModel):
+        raise TypeError(f"Expected Pydantic model, but got {model!r}")
+    await _get_dataset(uri, format).save_async(model)
+
+
+def _warm_filesystems(uris: Sequence[str]) -> None:
+    """Create the filesystem instances up front, so the workers share them.
+
+    `fsspec` caches filesystem instances, so this avoids every worker thread
+    racing to create (and authenticate) its own instance.
+    """
+    for protocol in {get_protocol_and_path(uri)[0] for uri in uris}:
+        try:
+            fsspec.filesystem(protocol)
+        except Exception:  # the actual load/save will raise a proper error
+            pass
+
+
+def _run_batch(fn: Callable[[int], R], n: int, max_workers: Optional[int]) -> List[R]:
+    """Run `fn(i)` for `i in range(n)` concurrently, keeping the order and collecting errors."""
+    results: List[Optional[R]] = [None] * n
+    errors: Dict[int, BaseException] = {}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pydantic_kedro") as pool:
+        futures = [pool.submit(fn, i) for i in range(n)]
+        for i, fut in enumerate(futures):
+            try:
+                results[i] = fut.result()
+            except Exception as exc:
+                errors[i] = exc
+    if errors:
+        raise BatchError(list(results), errors)
+    return results  # type: ignore
+
+
+def load_models(
+    uris: Sequence[str],
+    supercls: Type[T] = BaseModel,  # type: ignore
+    *,
+    max_workers: Optional[int] = None,
+    fields: Optional[List[str]] = None,
+    partial: Literal["model", "dict"] = "model",
+    cache: bool = False,
+    cache_copy: bool = False,
+    trusted: bool = False,
+    validate_sample: float = 0.0,
+) -> List[T]:
+    """Load many Pydantic models concurrently.
+
+    Parameters
+    ----------
+    uris : list of str
+        The paths or URIs to load the models from.
+    supercls : type
+        Ensure that the loaded models are of this type.
+    max_workers : int, optional
+        Maximum number of concurrent loads. See `concurrent.futures.ThreadPoolExecutor`.
+    fields : list of str, optional
+        If set, only load these (`.`-separated) field paths, see [load_model][pydantic_kedro.load_model].
+    partial : {"model", "dict"}
+        Whether partial loads return (partially-validated) models or dicts.
+    cache : bool
+        Whether to use the process-level model cache.
+    cache_copy : bool
+        Whether cached models are returned as deep copies.
+    trusted : bool
+        Whether the stored data is known to be good, see [load_model][pydantic_kedro.load_model].
+    validate_sample : float
+        Fraction of the models that are validated anyway, for trusted loads.
+
+    Returns
+    -------
+    list
+        The models, in the same order as `uris`.
+
+    Raises
+    ------
+    BatchError
+        If any of the loads failed. This contains the successful results and per-item errors.
+    """
+    uris = list(uris)
+    _warm_filesystems(uris)
+
+    def _load(i: int) -> T:
+        return load_model(
+            uris[i],
+            supercls,
+            fields=fields,
+            partial=partial,
+            cache=cache,
+            cache_copy=cache_copy,
+            trusted=trusted,
+            validate_sample=validate_sample,
         )
-    ds.save(model)
+
+    return _run_batch(_load, len(uris), max_workers)
+
+
+def save_models(
+    models: Sequence[BaseModel],
+    uris: Sequence[str],
+    *,
+    format: Literal["auto", "zip", "folder", "yaml", "json", "pack"] = "auto",
+    max_workers: Optional[int] = None,
+) -> None:
+    """Save many Pydantic models concurrently.
+
+    Parameters
+    ----------
+    models : list of BaseModel
+        Pydantic models to save.
+    uris : list of str
+        The paths or URIs to save the models to, matching `models`.
+    format : {"auto", "zip", "folder", "yaml", "json", "pack"}
+        The dataset format to use, see [save_model][pydantic_kedro.save_model].
+    max_workers : int, optional
+        Maximum number of concurrent saves. See `concurrent.futures.ThreadPoolExecutor`.
+
+    Raises
+    ------
+    BatchError
+        If any of the saves failed. This contains the per-item errors.
+    """
+    models = list(models)
+    uris = list(uris)
+    if len(models) != len(uris):
+        raise ValueError(f"Got {len(models)} models, but {len(uris)} URIs.")
+    _warm_filesystems(uris)
+    _run_batch(lambda i: save_model(models[i], uris[i], format=format), len(uris), max_workers)
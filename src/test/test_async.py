@@ -0,0 +1,217 @@
+"""Tests for the asyncio API."""
+
+import asyncio
+from pathlib import Path
+from typing import Any, Dict, List, Literal
+
+import fsspec
+import pytest
+from fsspec.implementations.asyn_wrapper import AsyncFileSystemWrapper
+from fsspec.implementations.memory import MemoryFileSystem
+
+from pydantic_kedro import (
+    ArbModel,
+    PydanticFolderDataset,
+    PydanticZipDataset,
+    load_model,
+    load_model_async,
+    save_model_async,
+)
+from pydantic_kedro._async_io import AsyncDatasetMixin, get_async_fs, get_files, is_async
+from pydantic_kedro._dict_io import model_to_dict
+from pydantic_kedro._pydantic import BaseModel
+
+
+class AsyncMemoryFileSystem(AsyncFileSystemWrapper):
+    """In-memory filesystem with an async implementation, for testing."""
+
+    protocol = "asyncmemory"
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        """Wrap the memory filesystem."""
+        super().__init__(MemoryFileSystem(), *args, **kwargs)
+
+    @classmethod
+    def _strip_protocol(cls, path):
+        return MemoryFileSystem._strip_protocol(path.replace("asyncmemory://", "memory://"))
+
+
+fsspec.register_implementation("asyncmemory", AsyncMemoryFileSystem, clobber=True)
+
+
+class Inner(BaseModel):
+    """Nested model."""
+
+    y: List[int] = [1, 2]
+
+
+class PureModel(BaseModel):
+    """Pure model."""
+
+    x: str
+    inner: Inner = Inner()
+
+
+class Blob:
+    """Arbitrary (non-JSON-able) object."""
+
+    def __init__(self, v: int):
+        """Initialize."""
+        self.v = v
+
+
+class ArbitraryModel(ArbModel):
+    """Model with arbitrary members."""
+
+    x: int = 1
+    blobs: Dict[str, Blob] = {}
+
+
+Fmt = Literal["auto", "zip", "folder", "yaml", "json"]
+
+
+@pytest.mark.parametrize("prefix", ["", "memory://", "asyncmemory://"])
+@pytest.mark.parametrize("format", ["auto", "zip", "folder", "yaml", "json"])
+def test_async_rt_pure(prefix: str, format: Fmt, tmpdir):
+    """Round-trip a pure model with the async API."""
+    mdl = PureModel(x="foo")
+    uri = f"{prefix}{tmpdir}/new_folder/model"
+
+    async def main() -> BaseModel:
+        await save_model_async(mdl, uri, format=format)
+        return await load_model_async(uri, PureModel)
+
+    assert asyncio.run(main()) == mdl
+
+
+@pytest.mark.filterwarnings("ignore:No dataset defined")
+@pytest.mark.parametrize("prefix", ["", "memory://", "asyncmemory://"])
+@pytest.mark.parametrize("kls", [PydanticFolderDataset, PydanticZipDataset])
+def test_async_rt_arbitrary(prefix: str, kls, tmpdir):
+    """Round-trip an arbitrary model with the async dataset methods."""
+    mdl = ArbitraryModel(blobs={"a": Blob(1), "b": Blob(2)})
+    ds = kls(f"{prefix}{tmpdir}/model")
+
+    async def main() -> ArbitraryModel:
+        await ds.save_async(mdl)
+        return await ds.load_async()
+
+    res = asyncio.run(main())
+    assert isinstance(res, ArbitraryModel)
+    assert {k: v.v for k, v in res.blobs.items()} == {"a": 1, "b": 2}
+
+
+def test_async_native_fs():
+    """Ensure filesystems with an async implementation are used natively."""
+
+    async def main() -> bool:
+        fs, _ = await get_async_fs("asyncmemory://foo/bar")
+        return is_async(fs)
+
+    assert asyncio.run(main())
+
+
+def test_async_concurrent(tmpdir):
+    """Many concurrent saves and loads must not interfere with each other."""
+    models = [PureModel(x=str(i)) for i in range(20)]
+
+    async def main() -> List[BaseModel]:
+        await asyncio.gather(
+            *[
+                save_model_async(m, f"asyncmemory://{tmpdir}/m{i}", format="json")
+                for i, m in enumerate(models)
+            ]
+        )
+        return await asyncio.gather(
+            *[load_model_async(f"asyncmemory://{tmpdir}/m{i}") for i in range(len(models))]
+        )
+
+    assert asyncio.run(main()) == models
+    # The class marker is only added within `PatchPydanticIter`
+    assert "class" not in models[0].dict()
+    assert "class" in model_to_dict(models[0])
+
+
+@pytest.mark.filterwarnings("ignore:No dataset defined")
+@pytest.mark.parametrize("kls", [PydanticFolderDataset, PydanticZipDataset])
+def test_async_streamed(kls, tmpdir, monkeypatch):
+    """Members and archives are transferred through local files, not read into memory."""
+    read: List[str] = []
+    cat_file = MemoryFileSystem.cat_file
+
+    def cat_file_logged(self, path, *args, **kwargs):
+        read.append(path)
+        return cat_file(self, path, *args, **kwargs)
+
+    def no_pipe(self, path, *args, **kwargs):
+        raise AssertionError(f"Wrote the whole of {path} from memory")
+
+    monkeypatch.setattr(MemoryFileSystem, "cat_file", cat_file_logged)
+    monkeypatch.setattr(MemoryFileSystem, "pipe_file", no_pipe)
+    mdl = ArbitraryModel(blobs={str(i): Blob(i) for i in range(5)})
+    ds = kls(f"asyncmemory://{tmpdir}/model")
+
+    async def main() -> ArbitraryModel:
+        await ds.save_async(mdl)
+        return await ds.load_async()
+
+    res = asyncio.run(main())
+    assert {k: v.v for k, v in res.blobs.items()} == {str(i): i for i in range(5)}
+    # Only the metadata of folders is read as a whole
+    assert all(p.rsplit("/", 1)[-1].startswith("meta.") for p in read)
+
+
+def test_async_batches(monkeypatch):
+    """Only a few files are transferred at once."""
+    active: List[int] = [0]
+    most: List[int] = [0]
+
+    async def get_file(fs, rpath: str, lpath: str) -> None:
+        active[0] += 1
+        most[0] = max(most[0], active[0])
+        await asyncio.sleep(0.01)
+        active[0] -= 1
+
+    monkeypatch.setattr("pydantic_kedro._async_io.get_file", get_file)
+    files = {f"remote/{i}": f"local/{i}" for i in range(10)}
+    asyncio.run(get_files(MemoryFileSystem(), files, batch_size=3))
+    assert most[0] == 3
+
+
+def test_async_abstract():
+    """Datasets must implement both async methods."""
+
+    class LoadOnly(AsyncDatasetMixin):
+        async def _load_async(self) -> Any:
+            return 1
+
+    with pytest.raises(TypeError):
+        LoadOnly()  # type: ignore
+
+
+def test_async_load_options(tmpdir):
+    """Async loads take the same options as `load_model`."""
+    uri = f"{tmpdir}/model"
+
+    async def main() -> List[Any]:
+        await save_model_async(PureModel(x="foo"), uri, format="json")
+        return [
+            await load_model_async(uri, fields=["x"], partial="dict"),
+            await load_model_async(uri, PureModel, cache=True),
+            await load_model_async(uri, PureModel, cache=True),
+            await load_model_async(uri, PureModel, trusted=True),
+        ]
+
+    partial, cached, again, trusted = asyncio.run(main())
+    assert partial == {"x": "foo"}
+    assert cached == trusted == PureModel(x="foo")
+    assert again is cached
+
+
+@pytest.mark.parametrize("format", ["yaml", "json"])
+def test_async_keeps_protocol(format: Fmt, tmpdir):
+    """Async saves go to the filesystem of the URI, not to the local path with the same name."""
+    uri = f"memory://{tmpdir}/sub/model"
+    asyncio.run(save_model_async(PureModel(x="foo"), uri, format=format))
+    assert not Path(f"{tmpdir}/sub").exists()
+    assert load_model(uri, PureModel) == PureModel(x="foo")
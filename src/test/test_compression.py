@@ -0,0 +1,89 @@
+"""Test compression of JSON and YAML files."""
+
+import asyncio
+import gzip
+from typing import Dict, List
+
+import pytest
+
+from pydantic_kedro import PydanticAutoDataset, PydanticJsonDataset, PydanticYamlDataset, load_model
+from pydantic_kedro._compression import compress_bytes, decompress_bytes, detect_compression
+from pydantic_kedro._pydantic import BaseModel
+
+
+class Model(BaseModel):
+    """Pure model with repetitive data."""
+
+    names: List[str] = [f"name-{i}" for i in range(200)]
+    counts: Dict[str, int] = {f"key-{i}": i for i in range(200)}
+
+
+@pytest.mark.parametrize("kls", [PydanticJsonDataset, PydanticYamlDataset])
+@pytest.mark.parametrize("compression", ["gzip", "bz2", "xz", "zstd"])
+def test_roundtrip(kls, compression, tmpdir):
+    """Compressed files are smaller, and load the same models."""
+    pytest.importorskip("zstandard" if compression == "zstd" else compression.replace("xz", "lzma"))
+    plain, packed = f"{tmpdir}/plain", f"{tmpdir}/packed"
+    kls(plain).save(Model())
+    kls(packed, compression=compression).save(Model())
+    with open(packed, "rb") as f:
+        raw = f.read()
+    assert detect_compression(raw) == compression
+    assert len(raw) * 2 < len(open(plain, "rb").read())
+    assert kls(packed, compression=compression).load() == Model()
+
+
+@pytest.mark.parametrize("kls", [PydanticJsonDataset, PydanticYamlDataset])
+def test_async(kls, tmpdir):
+    """Async saves and loads compress the whole file."""
+    path = f"{tmpdir}/model.gz"
+    asyncio.run(kls(path, compression="gzip").save_async(Model()))
+    with gzip.open(path) as f:
+        assert b"name-199" in f.read()
+    assert asyncio.run(kls(path, compression="gzip").load_async()) == Model()
+    assert kls(path, compression="gzip").load() == Model()
+
+
+def test_infer(tmpdir):
+    """The compression is inferred from the file extension."""
+    path = f"{tmpdir}/model.json.gz"
+    PydanticJsonDataset(path, compression="infer").save(Model())
+    with gzip.open(path) as f:
+        assert f.read().startswith(b"{")
+    assert PydanticJsonDataset(path, compression="infer").load() == Model()
+    assert PydanticJsonDataset(path, streaming=True, compression="infer").load() == Model()
+
+
+@pytest.mark.parametrize("fmt", ["json", "yaml"])
+def test_auto(fmt, tmpdir):
+    """The auto dataset saves compressed files, and detects them when loading."""
+    path = f"{tmpdir}/model"
+    PydanticAutoDataset(path, default_format_pure=fmt, compression="gzip").save(Model())
+    with open(path, "rb") as f:
+        assert detect_compression(f.read()) == "gzip"
+    assert PydanticAutoDataset(path).load() == Model()
+    assert asyncio.run(PydanticAutoDataset(path).load_async()) == Model()
+    assert load_model(path, Model) == Model()
+
+
+def test_auto_async_host_uri():
+    """Async loads detect compression in the same file as the JSON dataset, also for host-style URIs."""
+    uri = "memory://x.json.gz"
+    ds = PydanticAutoDataset(uri, default_format_pure="json", compression="gzip")
+    asyncio.run(ds.save_async(Model()))
+    assert asyncio.run(PydanticAutoDataset(uri).load_async()) == Model()
+
+
+def test_bytes():
+    """Whole-file helpers are the inverse of each other."""
+    assert decompress_bytes(compress_bytes(b"abc", "bz2"), "bz2") == b"abc"
+    assert compress_bytes(b"abc", None) == b"abc"
+
+
+@pytest.mark.parametrize("compression", ["zip", "rar"])
+def test_invalid(compression):
+    """Unknown compressions and zip (use `PydanticZipDataset`) are refused."""
+    with pytest.raises(ValueError):
+        PydanticJsonDataset("memory://model.json", compression=compression)
+    with pytest.raises(ValueError):
+        PydanticAutoDataset("memory://model", compression=compression)
@@ -0,0 +1,120 @@
+"""Test direct remote loading and saving of members."""
+
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pandas as pd
+import pytest
+from fsspec.implementations.memory import MemoryFileSystem
+from kedro.io.core import AbstractDataset
+
+from pydantic_kedro import ArbConfig, ArbModel, PydanticFolderDataset
+from pydantic_kedro._local_caching import get_cache_dir
+from pydantic_kedro.instrumentation import (
+    STEP_LOAD_MEMBER,
+    STEP_SAVE_MEMBER,
+    Instrument,
+    InstrumentEvent,
+    instrumented,
+)
+
+
+class Note:
+    """Arbitrary object, saved as local text only."""
+
+    def __init__(self, text: str):
+        """Initialize."""
+        self.text = text
+
+
+class LocalNoteDataset(AbstractDataset[Note, Note]):
+    """Dataset that only works with local paths."""
+
+    def __init__(self, filepath: str):
+        """Initialize."""
+        self._filepath = filepath
+
+    def _load(self) -> Note:
+        return Note(Path(self._filepath).read_text())
+
+    def _save(self, data: Note) -> None:
+        Path(self._filepath).write_text(data.text)
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(filepath=self._filepath)
+
+
+class DirectModel(ArbModel):
+    """Model with both remote-capable and local-only members."""
+
+    class Config(ArbConfig):
+        """Save notes with a local-only dataset."""
+
+        kedro_map = {Note: LocalNoteDataset}
+
+    df: pd.DataFrame
+    note: Note
+
+
+class MemberPaths(Instrument):
+    """Collects the paths of loaded (or saved) members."""
+
+    def __init__(self, step: str = STEP_LOAD_MEMBER):
+        """Initialize."""
+        self.step = step
+        self.paths: List[str] = []
+
+    def on_event(self, event: InstrumentEvent) -> None:
+        """Collect member paths."""
+        if event.step == self.step:
+            self.paths.append(event.path)
+
+
+@pytest.mark.filterwarnings("ignore:No dataset defined")
+def test_direct_load(tmpdir):
+    """Remote-capable members are read in place, the rest are staged."""
+    path = f"memory://{tmpdir}/model"
+    df = pd.DataFrame({"x": [1, 2]})
+    PydanticFolderDataset(path).save(DirectModel(df=df, note=Note("hi")))
+
+    col = MemberPaths()
+    with instrumented(col):
+        res = PydanticFolderDataset(path, direct_load=True).load()
+    pd.testing.assert_frame_equal(res.df, df)
+    assert res.note.text == "hi"
+    assert f"{path}/.df" in col.paths
+    assert any(p.startswith(str(get_cache_dir())) and p.endswith("/.note") for p in col.paths)
+
+
+@pytest.mark.filterwarnings("ignore:No dataset defined")
+def test_direct_load_no_staging(tmpdir):
+    """If all members can read remote paths, nothing is staged."""
+    path = f"memory://{tmpdir}/model"
+    PydanticFolderDataset(path).save(DirectModel(df=pd.DataFrame({"x": [1]}), note=Note("hi")))
+    before = list(get_cache_dir().iterdir())
+
+    col = MemberPaths()
+    with instrumented(col):
+        res = PydanticFolderDataset(path, direct_load=True, fields=["df"]).load()
+    assert res.df["x"].tolist() == [1]
+    assert col.paths == [f"{path}/.df"]
+    assert list(get_cache_dir().iterdir()) == before
+
+
+@pytest.mark.parametrize("direct_save", [False, True])
+def test_direct_save(direct_save: bool, tmpdir):
+    """Remote-capable members are written in place, and the metadata is always written last."""
+    path = f"memory://{tmpdir}/model"
+    mdl = DirectModel(df=pd.DataFrame({"x": [1, 2]}), note=Note("hi"))
+
+    col = MemberPaths(STEP_SAVE_MEMBER)
+    with instrumented(col):
+        PydanticFolderDataset(path, direct_save=direct_save).save(mdl)
+    assert (f"{path}/.df" in col.paths) == direct_save
+    assert not any(p.startswith("memory://") and p.endswith("/.note") for p in col.paths)
+
+    keys = [k for k in MemoryFileSystem.store if k.startswith(f"{tmpdir}/model/")]
+    assert keys[-1] == f"{tmpdir}/model/meta.json"
+    res = PydanticFolderDataset(path).load()
+    pd.testing.assert_frame_equal(res.df, mdl.df)
+    assert res.note.text == "hi"
@@ -0,0 +1,121 @@
+"""Test the cached type-to-dataset dispatch."""
+
+import warnings
+from abc import ABC
+from typing import List
+
+import numpy as np
+import pytest
+from kedro_datasets.pickle.pickle_dataset import PickleDataset
+
+from pydantic_kedro import ArbConfig, ArbModel, PydanticFolderDataset, clear_dispatch_cache
+from pydantic_kedro._internals import get_kedro_dispatch
+
+
+class Base:
+    """Arbitrary base class."""
+
+
+class Child(Base):
+    """Arbitrary child class."""
+
+
+class Virtual(ABC):
+    """Abstract base class with a virtual subclass."""
+
+
+class Registered:
+    """Virtual subclass of `Virtual`."""
+
+
+Virtual.register(Registered)
+
+
+def base_ds(path: str) -> PickleDataset:
+    """Dataset for `Base`."""
+    return PickleDataset(filepath=path)
+
+
+def child_ds(path: str) -> PickleDataset:
+    """Dataset for `Child`."""
+    return PickleDataset(filepath=path)
+
+
+def virtual_ds(path: str) -> PickleDataset:
+    """Dataset for `Virtual`."""
+    return PickleDataset(filepath=path)
+
+
+class DispatchModel(ArbModel):
+    """Model with a few mapped types."""
+
+    class Config(ArbConfig):
+        """Map the types."""
+
+        kedro_map = {Base: base_ds, Child: child_ds, Virtual: virtual_ds}
+
+    items: List[object] = []
+
+
+def test_dispatch_resolution():
+    """The most specific type wins, virtual subclasses are found, and results are cached."""
+    dispatch = get_kedro_dispatch(DispatchModel)
+    assert get_kedro_dispatch(DispatchModel) is dispatch
+    assert dispatch.dispatch(Child) is child_ds
+    assert dispatch.dispatch(Base) is base_ds
+    assert dispatch.dispatch(Registered) is virtual_ds
+    assert dispatch.dispatch(int) is None
+
+
+class NpyDispatchModel(ArbModel):
+    """Model with built-in `numpy` datasets, and a user entry for a base class of `np.ndarray`."""
+
+    class Config(ArbConfig):
+        """Map `object` (a base of `np.ndarray`) to a pickle dataset."""
+
+        kedro_npy = True
+        kedro_map = {object: base_ds}
+
+    arr: np.ndarray
+
+
+def test_dispatch_user_base_over_builtin():
+    """User entries for a base class take precedence over an exact built-in entry."""
+    dispatch = get_kedro_dispatch(NpyDispatchModel)
+    assert np.ndarray in dispatch.builtin_kedro_map
+    assert dispatch.dispatch(np.ndarray) is base_ds
+    assert dispatch.is_user_mapped(np.ndarray)
+
+
+def test_dispatch_warn_once(tmpdir):
+    """Unmapped types only warn once per save."""
+    mdl = DispatchModel(items=[1j, 2j, 3j, Child()])
+    with warnings.catch_warnings(record=True) as rec:
+        warnings.simplefilter("always")
+        PydanticFolderDataset(f"{tmpdir}/model").save(mdl)
+    assert len([w for w in rec if "No dataset defined" in str(w.message)]) == 1
+
+
+def test_dispatch_cache_clear():
+    """Config changes are picked up after clearing the cache."""
+    dispatch = get_kedro_dispatch(DispatchModel)
+    cfg = DispatchModel.__config__
+    old = cfg.kedro_map
+    try:
+        cfg.kedro_map = {Base: base_ds}  # type: ignore
+        assert get_kedro_dispatch(DispatchModel).dispatch(Child) is child_ds  # still cached
+        clear_dispatch_cache()
+        assert get_kedro_dispatch(DispatchModel) is not dispatch
+        assert get_kedro_dispatch(DispatchModel).dispatch(Child) is base_ds
+    finally:
+        cfg.kedro_map = old  # type: ignore
+        clear_dispatch_cache()
+
+
+@pytest.mark.filterwarnings("ignore:No dataset defined")
+def test_dispatch_rt(tmpdir):
+    """Round-trip still works."""
+    ds = PydanticFolderDataset(f"{tmpdir}/model")
+    ds.save(DispatchModel(items=[Child(), Registered(), 1j]))
+    res = ds.load()
+    assert [type(x) for x in res.items] == [Child, Registered, complex]
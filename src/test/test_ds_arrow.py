@@ -0,0 +1,73 @@
+"""Test the built-in Arrow dataset and the `kedro_arrow` switch."""
+
+import warnings
+from pathlib import Path
+from typing import Dict, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather
+import pytest
+
+from pydantic_kedro import (
+    ArbConfig,
+    ArbModel,
+    PydanticAutoDataset,
+    PydanticFolderDataset,
+    PydanticZipDataset,
+)
+from pydantic_kedro.datasets.arrow import ArrowDataset
+
+Kls = Union[PydanticAutoDataset, PydanticFolderDataset, PydanticZipDataset]
+
+dfx = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]}, index=pd.Index([10, 20, 30], name="idx"))
+
+
+class ArrowModel(ArbModel):
+    """Model that saves dataframes and tables as Arrow IPC files."""
+
+    class Config(ArbConfig):
+        """Use the Arrow built-in datasets."""
+
+        kedro_arrow = True
+
+    df: pd.DataFrame = dfx
+    table: pa.Table = pa.table({"c": [1.0, 2.0]})
+    df_map: Dict[str, pd.DataFrame] = {"one": dfx}
+
+
+@pytest.mark.parametrize("kls", [PydanticAutoDataset, PydanticFolderDataset, PydanticZipDataset])
+def test_arrow_rt(kls: Kls, tmpdir):
+    """Dataframes and tables survive round-tripping, with no fallback to Pickle."""
+    mdl = ArrowModel()
+    paths = [f"{tmpdir}/model_on_disk", f"memory://{tmpdir}/model_in_memory"]
+    for path in paths:
+        ds: Kls = kls(path)  # type: ignore
+        with warnings.catch_warnings():
+            warnings.filterwarnings("error", message="No dataset defined")
+            ds.save(mdl)
+        m2 = ds.load()
+        assert isinstance(m2, ArrowModel)
+        pd.testing.assert_frame_equal(m2.df, mdl.df)
+        pd.testing.assert_frame_equal(m2.df_map["one"], mdl.df_map["one"])
+        assert isinstance(m2.table, pa.Table)
+        assert m2.table.equals(mdl.table)
+
+
+def test_arrow_feather_compatible(tmpdir):
+    """The member files are readable as Feather files."""
+    path = Path(f"{tmpdir}/model")
+    PydanticFolderDataset(str(path)).save(ArrowModel())
+    tbl = pyarrow.feather.read_table(str(path / ".table"))
+    assert tbl.equals(ArrowModel().table)
+
+
+@pytest.mark.parametrize("memory_map", [True, False])
+def test_arrow_dataset(memory_map: bool, tmpdir):
+    """Test the dataset directly."""
+    ds = ArrowDataset(f"{tmpdir}/df.arrow", output="pandas", memory_map=memory_map)
+    ds.save(dfx)
+    pd.testing.assert_frame_equal(ds.load(), dfx)
+
+    ds_tbl = ArrowDataset(f"{tmpdir}/df.arrow", output="arrow", memory_map=memory_map)
+    assert isinstance(ds_tbl.load(), pa.Table)
@@ -0,0 +1,58 @@
+"""Tests for the JSON Lines dataset."""
+
+import types
+from typing import Iterator, List
+
+import pytest
+from kedro.io import DatasetError
+
+from pydantic_kedro import PydanticJsonLinesDataset
+from pydantic_kedro._pydantic import BaseModel
+
+
+class Item(BaseModel):
+    """Base item."""
+
+    i: int
+
+
+class SpecialItem(Item):
+    """Subclass of the item, to check that the class is kept per line."""
+
+    tags: List[str] = ["special"]
+
+
+def _gen(n: int) -> Iterator[Item]:
+    for i in range(n):
+        yield SpecialItem(i=i) if i % 10 == 0 else Item(i=i)
+
+
+@pytest.mark.parametrize("prefix", ["", "memory://"])
+def test_jsonl_stream(prefix: str, tmpdir):
+    """Save a generator and load a generator."""
+    ds = PydanticJsonLinesDataset(f"{prefix}{tmpdir}/sub/items.jsonl")
+    ds.save(_gen(1000))
+    res = ds.load()
+    assert isinstance(res, types.GeneratorType)
+    items = list(res)
+    assert items == list(_gen(1000))
+    assert isinstance(items[10], SpecialItem)
+
+
+def test_jsonl_batches(tmpdir):
+    """Load in batches, and save batches."""
+    path = f"{tmpdir}/items.jsonl"
+    PydanticJsonLinesDataset(path).save(_gen(25))
+
+    batches = list(PydanticJsonLinesDataset(path, batch_size=10).load())
+    assert [len(b) for b in batches] == [10, 10, 5]
+
+    # Saving batches writes the models in order
+    PydanticJsonLinesDataset(f"{tmpdir}/copy.jsonl").save(batches)
+    assert list(PydanticJsonLinesDataset(f"{tmpdir}/copy.jsonl").load()) == list(_gen(25))
+
+
+def test_jsonl_bad_input(tmpdir):
+    """A single model is not a collection."""
+    with pytest.raises(DatasetError):
+        PydanticJsonLinesDataset(f"{tmpdir}/items.jsonl").save(Item(i=1))  # type: ignore
@@ -0,0 +1,88 @@
+"""Test the built-in NumPy dataset and the `kedro_npy` switch."""
+
+from pathlib import Path
+from typing import Dict, List, Union
+
+import numpy as np
+import pytest
+
+from pydantic_kedro import (
+    ArbConfig,
+    ArbModel,
+    PydanticAutoDataset,
+    PydanticFolderDataset,
+    PydanticZipDataset,
+)
+from pydantic_kedro.datasets.npy import NpyDataset
+
+Kls = Union[PydanticAutoDataset, PydanticFolderDataset, PydanticZipDataset]
+
+
+class NumpyModel(ArbModel):
+    """Model that saves arrays as (memory-mapped) `.npy` files."""
+
+    class Config(ArbConfig):
+        """Use `.npy` with memory-mapping."""
+
+        kedro_npy = True
+
+    arr: np.ndarray
+    arr_list: List[np.ndarray] = []
+    arr_map: Dict[str, np.ndarray] = {}
+
+
+class NumpyInMemoryModel(NumpyModel):
+    """Model that saves arrays as `.npy` files, but reads them into memory."""
+
+    class Config(ArbConfig):
+        """Use `.npy` without memory-mapping."""
+
+        kedro_npy = True
+        kedro_npy_mmap_mode = False
+
+
+def _make(kls=NumpyModel) -> NumpyModel:
+    return kls(
+        arr=np.arange(12, dtype="float32").reshape(3, 4),
+        arr_list=[np.zeros(3), np.ones((2, 2), dtype="int8")],
+        arr_map={"a": np.array([1, 2, 3])},
+    )
+
+
+@pytest.mark.parametrize("kls", [PydanticAutoDataset, PydanticFolderDataset, PydanticZipDataset])
+def test_numpy_mmap_rt(kls: Kls, tmpdir):
+    """Arrays are saved as `.npy` and loaded as memory maps, both locally and from remote."""
+    mdl = _make()
+    paths = [f"{tmpdir}/model_on_disk", f"memory://{tmpdir}/model_in_memory"]
+    for path in paths:
+        ds: Kls = kls(path)  # type: ignore
+        ds.save(mdl)
+        m2 = ds.load()
+        assert isinstance(m2, NumpyModel)
+        assert isinstance(m2.arr, np.memmap)
+        np.testing.assert_array_equal(m2.arr, mdl.arr)
+        assert m2.arr.dtype == mdl.arr.dtype
+        for a, b in zip(m2.arr_list, mdl.arr_list):
+            np.testing.assert_array_equal(a, b)
+        np.testing.assert_array_equal(m2.arr_map["a"], mdl.arr_map["a"])
+
+
+def test_numpy_no_mmap(tmpdir):
+    """Arrays are saved as `.npy` files, readable by NumPy, and loaded into memory."""
+    mdl = _make(NumpyInMemoryModel)
+    path = Path(f"{tmpdir}/model")
+    PydanticFolderDataset(str(path)).save(mdl)
+    np.testing.assert_array_equal(np.load(path / ".arr"), mdl.arr)
+
+    m2 = PydanticFolderDataset(str(path)).load()
+    assert not isinstance(m2.arr, np.memmap)
+    np.testing.assert_array_equal(m2.arr, mdl.arr)
+
+
+def test_npy_dataset(tmpdir):
+    """Test the dataset directly."""
+    ds = NpyDataset(f"{tmpdir}/arr.npy", mmap_mode="r")
+    ds.save(np.arange(5))
+    res = ds.load()
+    assert isinstance(res, np.memmap)
+    np.testing.assert_array_equal(res, np.arange(5))
@@ -0,0 +1,135 @@
+"""Test the single-file pack dataset."""
+
+from typing import Dict, List, Optional
+
+import pandas as pd
+import pytest
+from fsspec.implementations.memory import MemoryFileSystem
+
+from pydantic_kedro import (
+    ArbModel,
+    PydanticAutoDataset,
+    PydanticPackDataset,
+    inspect_model,
+    load_model,
+    save_model,
+)
+from pydantic_kedro.datasets import folder, pack
+from pydantic_kedro.datasets.pack import MAGIC
+
+
+class Inner(ArbModel):
+    """Nested model."""
+
+    z: int = 0
+    df: pd.DataFrame = pd.DataFrame()
+
+
+class PackModel(ArbModel):
+    """Model with a few dataframes."""
+
+    x: int
+    df: pd.DataFrame
+    dfm: Dict[str, pd.DataFrame] = {}
+    nested: Inner = Inner()
+    tags: List[str] = []
+
+
+def _make() -> PackModel:
+    return PackModel(
+        x=1,
+        df=pd.DataFrame({"a": list(range(1000))}),
+        dfm={"k": pd.DataFrame({"b": ["x", "y"]})},
+        nested=Inner(z=3, df=pd.DataFrame({"c": [1.5]})),
+        tags=["t"],
+    )
+
+
+def _check(res: PackModel, mdl: PackModel) -> None:
+    assert isinstance(res, PackModel)
+    assert res.x == mdl.x
+    assert res.tags == mdl.tags
+    pd.testing.assert_frame_equal(res.df, mdl.df)
+    pd.testing.assert_frame_equal(res.dfm["k"], mdl.dfm["k"])
+    pd.testing.assert_frame_equal(res.nested.df, mdl.nested.df)
+
+
+@pytest.mark.filterwarnings("ignore:No dataset defined")
+@pytest.mark.parametrize("compression", [None, "zlib", "bz2", "lzma"])
+@pytest.mark.parametrize("prefix", ["", "memory://"])
+def test_pack_rt(prefix: str, compression: Optional[str], tmpdir):
+    """Round-trip, with and without compression (and with many blocks)."""
+    mdl = _make()
+    path = f"{prefix}{tmpdir}/model.pack"
+    PydanticPackDataset(path, compression=compression, block_size=1000).save(mdl)  # type: ignore
+    _check(PydanticPackDataset(path).load(), mdl)
+
+
+@pytest.mark.filterwarnings("ignore:No dataset defined")
+def test_pack_format(tmpdir):
+    """The pack is a single file, detected automatically, and can be inspected."""
+    mdl = _make()
+    path = f"{tmpdir}/model"
+    save_model(mdl, path, format="pack")
+    with open(path, "rb") as f:
+        assert f.read(len(MAGIC)) == MAGIC
+
+    _check(load_model(path), mdl)
+    info = inspect_model(path)
+    assert info.model_info["x"] == 1
+    assert set(info.member_sizes) == {".df", ".dfm.k", ".nested.df"}
+    assert all(v > 0 for v in info.member_sizes.values())
+
+
+@pytest.mark.filterwarnings("ignore:No dataset defined")
+def test_pack_partial(tmpdir):
+    """Partial loads only read the needed members."""
+    path = f"memory://{tmpdir}/model.pack"
+    PydanticAutoDataset(path, default_format_arbitrary="pack").save(_make())
+    res = PydanticPackDataset(path, fields=["nested.df"]).load()
+    assert res.nested.df["c"].tolist() == [1.5]
+    assert "df" not in res.__fields_set__
+
+
+@pytest.mark.filterwarnings("ignore:No dataset defined")
+def test_pack_meta_from_index(tmpdir, monkeypatch):
+    """The metadata is taken from the index, rather than written to and read from staging."""
+    path = f"{tmpdir}/model.pack"
+    PydanticPackDataset(path).save(_make())
+
+    def no_read(filepath: str) -> None:
+        raise AssertionError(f"Read the metadata from {filepath}")
+
+    monkeypatch.setattr(folder, "_read_metadata", no_read)
+    _check(PydanticPackDataset(path).load(), _make())
+
+
+@pytest.mark.filterwarnings("ignore:No dataset defined")
+@pytest.mark.parametrize("compression", [None, "zlib"])
+def test_pack_bounded_reads(compression: Optional[str], tmpdir, monkeypatch):
+    """Members are read a block (or, if uncompressed, a bounded chunk) at a time."""
+    path = f"memory://{tmpdir}/model.pack"
+    PydanticPackDataset(path, compression=compression, block_size=1000).save(_make())  # type: ignore
+    size = MemoryFileSystem().size(path)
+    reads: List[int] = []
+    cat_file = MemoryFileSystem.cat_file
+
+    def cat_file_logged(self, path, start=None, end=None, **kwargs):
+        if end != size:  # not the footer
+            reads.append(end - start)
+        return cat_file(self, path, start=start, end=end, **kwargs)
+
+    monkeypatch.setattr(MemoryFileSystem, "cat_file", cat_file_logged)
+    monkeypatch.setattr(pack, "_COPY_CHUNK_SIZE", 300)
+    _check(PydanticPackDataset(path).load(), _make())
+    assert len(reads) > 3
+    assert max(reads) <= (300 if compression is None else 1100)
+
+
+def test_pack_bad_file(tmpdir):
+    """Other files are rejected."""
+    path = f"{tmpdir}/not_a_pack"
+    with open(path, "wb") as f:
+        f.write(b"x" * 100)
+    with pytest.raises(Exception, match="bad magic"):
+        PydanticPackDataset(path).load()
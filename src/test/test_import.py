@@ -1,5 +1,10 @@
 """Basic tests for importability."""
 
+import os
+import subprocess
+import sys
+from pathlib import Path
+
 
 def test_import_pk():
     """Ensures importability."""
@@ -7,3 +12,51 @@ def test_import_pk():
 
     assert isinstance(__version__, str)
     assert __version__ != "0.0.0", "Version selection failed."
+
+
+_LOAD_JSON = """
+import sys
+from pydantic_kedro import load_model
+
+load_model(sys.argv[1])
+heavy = ["ruamel.yaml", "pydantic_yaml", "kedro_datasets", "fsspec.implementations.zip"]
+print(",".join(m for m in heavy if m in sys.modules))
+"""
+
+
+def test_lazy_imports(tmpdir):
+    """Loading a JSON model doesn't import the dependencies of the other formats."""
+    Path(f"{tmpdir}/lazy_models.py").write_text(
+        "from pydantic_kedro._pydantic import BaseModel\n\nclass Model(BaseModel):\n    x: int = 1\n"
+    )
+    sys.path.insert(0, str(tmpdir))
+    try:
+        from lazy_models import Model  # type: ignore
+
+        from pydantic_kedro import PydanticJsonDataset
+
+        PydanticJsonDataset(f"{tmpdir}/model.json").save(Model(x=2))
+    finally:
+        sys.path.remove(str(tmpdir))
+        sys.modules.pop("lazy_models", None)
+
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(tmpdir), *sys.path])}
+    out = subprocess.run(
+        [sys.executable, "-c", _LOAD_JSON, f"{tmpdir}/model.json"],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    assert out.stdout.strip() == ""
+
+
+def test_lazy_names():
+    """The public names are the same objects as in their modules."""
+    import pydantic_kedro
+    from pydantic_kedro.datasets.zip import PydanticZipDataset
+
+    assert pydantic_kedro.PydanticZipDataSet is PydanticZipDataset
+    assert set(pydantic_kedro.__all__) <= set(dir(pydantic_kedro))
+    for name in pydantic_kedro.__all__:
+        assert getattr(pydantic_kedro, name) is not None
@@ -0,0 +1,110 @@
+"""Test inlining small objects into the metadata with `kedro_inline_max_bytes`."""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Union
+
+import numpy as np
+import pytest
+
+from pydantic_kedro import (
+    ArbConfig,
+    ArbModel,
+    PydanticFolderDataset,
+    PydanticPackDataset,
+    PydanticZipDataset,
+    inspect_model,
+)
+from pydantic_kedro.datasets.folder import InlineObject
+
+Kls = Union[PydanticFolderDataset, PydanticZipDataset, PydanticPackDataset]
+
+
+class Color:
+    """Small custom type."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __eq__(self, other: Any) -> bool:  # noqa: D105
+        return isinstance(other, Color) and other.name == self.name
+
+
+class InlineModel(ArbModel):
+    """Model with small and big arbitrary values."""
+
+    class Config(ArbConfig):
+        """Inline objects under 1 KiB, saving arrays as `.npy`."""
+
+        kedro_npy = True
+        kedro_inline_max_bytes = 1024
+
+    small: np.ndarray
+    big: np.ndarray
+    colors: List[Color] = []
+    by_name: Dict[str, Color] = {}
+
+
+def _make() -> InlineModel:
+    return InlineModel(
+        small=np.arange(3),
+        big=np.zeros(1000),
+        colors=[Color("red"), Color("blue")],
+        by_name={"g": Color("green")},
+    )
+
+
+def _check(m2: InlineModel, mdl: InlineModel) -> None:
+    np.testing.assert_array_equal(m2.small, mdl.small)
+    np.testing.assert_array_equal(m2.big, mdl.big)
+    assert m2.colors == mdl.colors
+    assert m2.by_name == mdl.by_name
+
+
+def test_inline_files(tmpdir):
+    """Small objects are stored in the metadata, big ones as files."""
+    mdl = _make()
+    path = Path(f"{tmpdir}/model")
+    with pytest.warns(UserWarning):  # `Color` uses the default dataset
+        PydanticFolderDataset(str(path)).save(mdl)
+    assert sorted(p.name for p in path.iterdir()) == [".big", "meta.json"]
+    meta = json.loads((path / "meta.json").read_text())
+    assert sorted(meta["inline"]) == [".by_name.g", ".colors.0", ".colors.1", ".small"]
+    assert meta["inline"][".small"]["encoding"] == "npy"
+    assert meta["inline"][".colors.0"]["encoding"] == "pickle"
+    m2 = PydanticFolderDataset(str(path)).load()
+    _check(m2, mdl)
+    assert isinstance(m2.big, np.memmap)
+    assert not isinstance(m2.small, np.memmap)
+    assert sorted(inspect_model(str(path)).inline) == sorted(meta["inline"])
+
+
+@pytest.mark.parametrize("kls", [PydanticFolderDataset, PydanticZipDataset, PydanticPackDataset])
+def test_inline_rt(kls: Kls, tmpdir):
+    """Inlined objects roundtrip, both locally and from remote."""
+    mdl = _make()
+    for path in [f"{tmpdir}/model_on_disk", f"memory://{tmpdir}/model_in_memory"]:
+        ds: Kls = kls(path)  # type: ignore
+        with pytest.warns(UserWarning):
+            ds.save(mdl)
+        _check(ds.load(), mdl)
+
+
+def test_inline_partial(tmpdir):
+    """Partial loads only decode the selected inline objects."""
+    mdl = _make()
+    path = f"{tmpdir}/model"
+    with pytest.warns(UserWarning):
+        PydanticFolderDataset(path).save(mdl)
+    res = PydanticFolderDataset(path, fields=["small", "by_name"], partial="dict").load()
+    assert sorted(res) == ["by_name", "small"]
+    np.testing.assert_array_equal(res["small"], mdl.small)
+    assert res["by_name"] == mdl.by_name
+
+
+def test_inline_object_size_cap():
+    """Encoding stops as soon as the object is too big."""
+    assert InlineObject.encode(list(range(1000)), "pickle", 100) is None
+    assert InlineObject.encode(np.zeros(100), "npy", 100) is None
+    item = InlineObject.encode([1, 2], "pickle", 100)
+    assert item is not None and item.decode() == [1, 2]
@@ -0,0 +1,110 @@
+"""Test metadata-only inspection of saved models."""
+
+from typing import Any, Dict
+
+import fsspec
+import numpy as np
+import pandas as pd
+import pytest
+from fsspec.spec import AbstractBufferedFile, AbstractFileSystem
+
+from pydantic_kedro import (
+    ArbModel,
+    PydanticFolderDataset,
+    PydanticZipDataset,
+    inspect_model,
+    save_model,
+)
+from pydantic_kedro.datasets.folder import FolderFormatInspection
+
+
+class _RangeFile(AbstractBufferedFile):
+    """Read-only file that records the bytes fetched via ranged reads."""
+
+    def _fetch_range(self, start: int, end: int) -> bytes:
+        self.fs.fetched += end - start
+        return self.fs.blobs[self.path][start:end]
+
+
+class RangeFileSystem(AbstractFileSystem):
+    """In-memory read-only filesystem with ranged reads, like object stores."""
+
+    protocol = "rangetest"
+    blobs: Dict[str, bytes] = {}
+    fetched = 0
+
+    def info(self, path: str, **kwargs: Any) -> Dict[str, Any]:
+        """Get info about the blob."""
+        path = self._strip_protocol(path)
+        if path not in self.blobs:
+            raise FileNotFoundError(path)
+        return {"name": path, "size": len(self.blobs[path]), "type": "file"}
+
+    def ls(self, path: str, detail: bool = True, **kwargs: Any) -> Any:
+        """List the single blob."""
+        return [self.info(path) if detail else path]
+
+    def _open(self, path: str, mode: str = "rb", block_size: Any = None, **kwargs: Any) -> Any:
+        return _RangeFile(self, self._strip_protocol(path), mode, block_size=block_size, **kwargs)
+
+
+fsspec.register_implementation("rangetest", RangeFileSystem, clobber=True)
+
+
+class BigModel(ArbModel):
+    """Model with a large member."""
+
+    name: str
+    big: np.ndarray
+    df: pd.DataFrame
+
+
+def _make() -> BigModel:
+    rng = np.random.default_rng(42)
+    return BigModel(name="foo", big=rng.random(500_000), df=pd.DataFrame({"x": [1, 2]}))
+
+
+@pytest.mark.filterwarnings("ignore:No dataset defined")
+@pytest.mark.parametrize("format", ["folder", "zip"])
+@pytest.mark.parametrize("prefix", ["", "memory://"])
+def test_inspect(format, prefix: str, tmpdir, monkeypatch):
+    """Inspection returns the metadata and member sizes, without loading members."""
+    uri = f"{prefix}{tmpdir}/model"
+    save_model(_make(), uri, format=format)
+    monkeypatch.setattr(PydanticZipDataset, "_extract", None)  # would fail if called
+
+    res = inspect_model(uri)
+    assert isinstance(res, FolderFormatInspection)
+    assert res.model_class.endswith("BigModel")
+    assert res.model_info["name"] == "foo"
+    assert set(res.catalog) == {".big", ".df"}
+    assert set(res.member_sizes) == {".big", ".df"}
+    assert res.member_sizes[".big"] > 8 * 500_000 > res.member_sizes[".df"] > 0
+
+
+@pytest.mark.filterwarnings("ignore:No dataset defined")
+def test_inspect_zip_ranged(tmpdir):
+    """Only a small part of a remote zip file is read."""
+    save_model(_make(), f"{tmpdir}/model.zip", format="zip")
+    with open(f"{tmpdir}/model.zip", "rb") as f:
+        raw = f.read()
+    fs = fsspec.filesystem("rangetest")
+    fs.blobs["/model.zip"] = raw
+    fs.fetched = 0
+
+    res = PydanticZipDataset("rangetest:///model.zip").inspect()
+    assert res.model_info["name"] == "foo"
+    assert 0 < fs.fetched < len(raw) / 10
+
+    fs.fetched = 0
+    res = inspect_model("rangetest:///model.zip")
+    assert res.model_info["name"] == "foo"
+    assert 0 < fs.fetched < len(raw) / 10
+
+
+@pytest.mark.filterwarnings("ignore:No dataset defined")
+def test_inspect_folder_dataset(tmpdir):
+    """The folder dataset supports inspection directly."""
+    ds = PydanticFolderDataset(f"{tmpdir}/model")
+    ds.save(_make())
+    assert ds.inspect().member_sizes[".big"] > 0
@@ -0,0 +1,170 @@
+"""Tests for instrumentation of loading and saving."""
+
+import logging
+import sys
+import threading
+import time
+from typing import List, Optional
+
+import pytest
+from kedro.framework.hooks.manager import _create_hook_manager
+from kedro.io import DataCatalog
+from kedro.pipeline import node, pipeline
+from kedro.runner import SequentialRunner
+
+from pydantic_kedro import ArbModel, PydanticFolderDataset, PydanticZipDataset
+from pydantic_kedro.hooks import InstrumentationHooks
+from pydantic_kedro.instrumentation import (
+    Instrument,
+    InstrumentEvent,
+    LoggingInstrument,
+    add_instrument,
+    get_instruments,
+    instrumented,
+    remove_instrument,
+)
+
+
+class Blob:
+    """Arbitrary (non-JSON-able) object."""
+
+    def __init__(self, v: int):
+        """Initialize."""
+        self.v = v
+
+
+class BlobModel(ArbModel):
+    """Model with arbitrary members."""
+
+    x: int = 1
+    blobs: List[Blob] = []
+
+
+class Collector(Instrument):
+    """Collects all events."""
+
+    def __init__(self):
+        """Initialize."""
+        self.events: List[InstrumentEvent] = []
+
+    def on_event(self, event: InstrumentEvent) -> None:
+        """Collect the event."""
+        self.events.append(event)
+
+
+@pytest.mark.filterwarnings("ignore:No dataset defined")
+@pytest.mark.parametrize("kls", [PydanticFolderDataset, PydanticZipDataset])
+def test_instrument_events(kls, tmpdir):
+    """Check that members, metadata, staging and model creation are all reported."""
+    col = Collector()
+    mdl = BlobModel(blobs=[Blob(1), Blob(2)])
+    ds = kls(f"memory://{tmpdir}/model")
+    with instrumented(col):
+        ds.save(mdl)
+        ds.load()
+    assert get_instruments() == ()
+
+    steps = [ev.step for ev in col.events]
+    assert steps.count("save_member") == 2
+    assert steps.count("load_member") == 2
+    assert steps.count("write_metadata") == 1
+    assert steps.count("read_metadata") == 1
+    assert steps.count("stage_copy") == 2
+    assert steps.count("dict_to_model") == 1
+    for ev in col.events:
+        assert ev.duration >= 0
+        assert ev.error is None
+        if ev.step in ("save_member", "load_member"):
+            assert ev.dataset_type is not None and ev.dataset_type.endswith("PickleDataset")
+            assert ev.nbytes is not None and ev.nbytes > 0
+
+
+@pytest.mark.filterwarnings("ignore:No dataset defined")
+def test_nbytes_not_timed(tmpdir, monkeypatch):
+    """Member sizes are measured after the step, so they don't count towards its duration."""
+
+    def slow_size(path: str) -> Optional[int]:
+        time.sleep(0.2)
+        return 42
+
+    monkeypatch.setattr("pydantic_kedro.instrumentation.path_size", slow_size)
+    col = Collector()
+    ds = PydanticFolderDataset(f"{tmpdir}/model")
+    with instrumented(col):
+        ds.save(BlobModel(blobs=[Blob(1)]))
+        ds.load()
+    members = [ev for ev in col.events if ev.step in ("save_member", "load_member")]
+    assert len(members) == 2
+    assert all(ev.nbytes == 42 and ev.duration < 0.2 for ev in members)
+
+
+def test_concurrent_add_remove():
+    """Instruments added and removed from many threads at once are not lost."""
+    instruments = [Collector() for _ in range(16)]
+    barrier = threading.Barrier(len(instruments))
+
+    def add(inst: Instrument) -> None:
+        barrier.wait()
+        for _ in range(200):
+            add_instrument(inst)
+            remove_instrument(inst)
+        add_instrument(inst)
+
+    threads = [threading.Thread(target=add, args=(inst,)) for inst in instruments]
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # switch threads as often as possible
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(interval)
+    try:
+        assert set(map(id, get_instruments())) == set(map(id, instruments))
+    finally:
+        for inst in instruments:
+            remove_instrument(inst)
+
+
+def test_logging_instrument(tmpdir, caplog):
+    """Check the logging adapter."""
+    with caplog.at_level(logging.INFO), instrumented(LoggingInstrument(level=logging.INFO)):
+        PydanticFolderDataset(f"{tmpdir}/model").save(BlobModel())
+    assert "write_metadata" in caplog.text
+
+
+def _make_model() -> BlobModel:
+    return BlobModel(blobs=[Blob(3)])
+
+
+def _read_model(mdl: BlobModel) -> int:
+    return mdl.blobs[0].v
+
+
+@pytest.mark.filterwarnings("ignore:No dataset defined")
+def test_kedro_hooks(tmpdir, caplog):
+    """Check the Kedro hooks adapter within a pipeline run."""
+    hooks = InstrumentationHooks()
+    hook_manager = _create_hook_manager()
+    hook_manager.register(hooks)
+    catalog = DataCatalog({"mdl": PydanticZipDataset(f"{tmpdir}/mdl.zip")})
+    pipe = pipeline(
+        [
+            node(_make_model, inputs=None, outputs="mdl"),
+            node(_read_model, inputs="mdl", outputs="v"),
+        ]
+    )
+    # The pipeline hooks are normally called by the Kedro session
+    with caplog.at_level(logging.INFO):
+        hook_manager.hook.before_pipeline_run(run_params={}, pipeline=pipe, catalog=catalog)
+        res = SequentialRunner().run(pipe, catalog, hook_manager)
+        hook_manager.hook.after_pipeline_run(
+            run_params={}, run_result=res, pipeline=pipe, catalog=catalog
+        )
+    assert hooks not in get_instruments()
+
+    summary = hooks.summary()
+    assert summary["mdl"]["save_member"][0] == 1
+    assert summary["mdl"]["load_member"][0] == 1
+    assert "pydantic-kedro [mdl]" in caplog.text
@@ -0,0 +1,127 @@
+"""Test the lifetime of local staging directories."""
+
+import gc
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pytest
+
+from pydantic_kedro import (
+    ArbConfig,
+    ArbModel,
+    PydanticAutoDataset,
+    PydanticFolderDataset,
+    PydanticZipDataset,
+    get_cache_usage,
+    load_model,
+    save_model,
+    set_cache_quota,
+)
+from pydantic_kedro._local_caching import get_cache_dir
+
+
+class EagerModel(ArbModel):
+    """Model with a pickled member, which is loaded eagerly."""
+
+    arr: np.ndarray
+
+
+class LazyModel(ArbModel):
+    """Model with a memory-mapped member."""
+
+    class Config(ArbConfig):
+        """Use memory-mapped `.npy` files."""
+
+        kedro_npy = True
+
+    arr: np.ndarray
+
+
+def _staging_dirs() -> List[Path]:
+    return [p for p in get_cache_dir().iterdir() if p.is_dir()]
+
+
+@pytest.fixture
+def no_quota():
+    """Reset the cache quota after the test."""
+    yield
+    set_cache_quota(None)
+
+
+@pytest.mark.filterwarnings("ignore:No dataset defined")
+@pytest.mark.parametrize("kls", [PydanticFolderDataset, PydanticZipDataset])
+def test_eager_removed(kls, tmpdir):
+    """Staging directories are removed right away if all members were loaded eagerly."""
+    ds = kls(f"memory://{tmpdir}/model")
+    ds.save(EagerModel(arr=np.arange(10)))
+    before = _staging_dirs()
+    res = ds.load()
+    np.testing.assert_array_equal(res.arr, np.arange(10))
+    assert _staging_dirs() == before
+
+
+@pytest.mark.parametrize("kls", [PydanticFolderDataset, PydanticZipDataset])
+def test_lazy_kept_until_release(kls, tmpdir):
+    """Staging directories with lazily-loaded members are kept until the dataset is released."""
+    ds = kls(f"memory://{tmpdir}/model")
+    ds.save(LazyModel(arr=np.arange(10)))
+    before = set(_staging_dirs())
+    res = ds.load()
+    assert isinstance(res.arr, np.memmap)
+    assert len(set(_staging_dirs()) - before) == 1
+    np.testing.assert_array_equal(res.arr, np.arange(10))
+    ds.release()
+    assert set(_staging_dirs()) == before
+
+
+@pytest.mark.parametrize("fmt", ["zip", "folder", "pack"])
+def test_auto_kept_until_release(fmt, tmpdir):
+    """Staging directories of the auto dataset's inner datasets are removed when it's released."""
+    path = f"memory://{tmpdir}/model"
+    ds = PydanticAutoDataset(path, default_format_pure=fmt, default_format_arbitrary=fmt)
+    ds.save(LazyModel(arr=np.arange(10)))
+    before = set(_staging_dirs())
+    res = ds.load()
+    assert isinstance(res.arr, np.memmap)
+    assert len(set(_staging_dirs()) - before) == 1
+    ds.release()
+    assert set(_staging_dirs()) == before
+
+
+def test_quota(tmpdir, no_quota):
+    """The oldest staging directories are evicted to stay within the quota."""
+    ds = PydanticFolderDataset(f"memory://{tmpdir}/model")
+    ds.save(LazyModel(arr=np.zeros(10_000)))  # about 80kB
+    ds.release()
+    set_cache_quota(200_000)
+    with pytest.warns(UserWarning, match="Evicting staging directory"):
+        models = [ds.load() for _ in range(4)]  # kept, so their directories are too
+    assert 0 < get_cache_usage() <= 200_000
+    ds.release()
+    assert get_cache_usage() == 0
+    del models
+
+
+@pytest.mark.parametrize("fmt", ["zip", "folder", "pack"])
+def test_load_model_collected(fmt, tmpdir):
+    """Staging directories of memory-mapped members are removed with the loaded objects."""
+    path = f"memory://{tmpdir}/model"
+    save_model(LazyModel(arr=np.arange(10)), path, format=fmt)
+    before = set(_staging_dirs())
+    for _ in range(5):
+        res = load_model(path, LazyModel)
+        assert isinstance(res.arr, np.memmap)
+        np.testing.assert_array_equal(res.arr, np.arange(10))
+        assert len(set(_staging_dirs()) - before) == 1
+        del res
+        gc.collect()
+        assert set(_staging_dirs()) == before
+
+    arr = load_model(path, LazyModel).arr[2:]  # views keep the memory map
+    gc.collect()
+    assert len(set(_staging_dirs()) - before) == 1
+    np.testing.assert_array_equal(arr, np.arange(2, 10))
+    del arr
+    gc.collect()
+    assert set(_staging_dirs()) == before
@@ -0,0 +1,108 @@
+"""Test the compact (msgpack + zstd) metadata format."""
+
+import asyncio
+from pathlib import Path
+from typing import Union
+
+import fsspec
+import numpy as np
+import pytest
+
+from pydantic_kedro import (
+    ArbModel,
+    PydanticFolderDataset,
+    PydanticZipDataset,
+    inspect_model,
+)
+from pydantic_kedro.datasets.folder import (
+    COMPACT_META_MAGIC,
+    _dump_metadata,
+    _parse_metadata,
+    _read_metadata,
+)
+
+Kls = Union[PydanticFolderDataset, PydanticZipDataset]
+
+
+class ArrModel(ArbModel):
+    """Model with an array and pure fields."""
+
+    arr: np.ndarray
+    x: int = 1
+    info: dict = {}
+
+
+def _make() -> ArrModel:
+    return ArrModel(arr=np.arange(5), x=3, info={"a": [1.5, None, "b"]})
+
+
+def _check(m2: ArrModel, mdl: ArrModel) -> None:
+    np.testing.assert_array_equal(m2.arr, mdl.arr)
+    assert (m2.x, m2.info) == (mdl.x, mdl.info)
+
+
+@pytest.mark.parametrize("kls", [PydanticFolderDataset, PydanticZipDataset])
+def test_compact_rt(kls: Kls, tmpdir):
+    """Models roundtrip with compact metadata, both locally and from remote."""
+    mdl = _make()
+    for path in [f"{tmpdir}/model_on_disk", f"memory://{tmpdir}/model_in_memory"]:
+        with pytest.warns(UserWarning):
+            kls(path, metadata_format="msgpack").save(mdl)  # type: ignore
+        _check(kls(path).load(), mdl)  # type: ignore
+        res = kls(path, fields=["arr"], partial="dict").load()  # type: ignore
+        np.testing.assert_array_equal(res["arr"], mdl.arr)
+        assert inspect_model(path).model_class == mdl.__module__ + ".ArrModel"
+
+
+def test_compact_file(tmpdir):
+    """The compact metadata is `meta.bin`, and replaces a previous `meta.json` (and vice versa)."""
+    mdl = _make()
+    path = Path(f"{tmpdir}/model")
+    with pytest.warns(UserWarning):
+        PydanticFolderDataset(str(path)).save(mdl)
+        PydanticFolderDataset(str(path), metadata_format="msgpack").save(mdl)
+    assert not (path / "meta.json").exists()
+    assert (path / "meta.bin").read_bytes().startswith(COMPACT_META_MAGIC)
+    with pytest.warns(UserWarning):
+        PydanticFolderDataset(str(path)).save(mdl)
+    assert (path / "meta.json").exists() and not (path / "meta.bin").exists()
+
+
+def test_compact_remote_stale(tmpdir):
+    """Saving to remote folders also removes metadata in other formats."""
+    mdl = _make()
+    path = f"memory://{tmpdir}/stale"
+    fs, fs_path = fsspec.core.url_to_fs(path)
+    with pytest.warns(UserWarning):
+        PydanticFolderDataset(path).save(mdl)
+        PydanticFolderDataset(path, metadata_format="msgpack").save(mdl)
+    assert not fs.exists(f"{fs_path}/meta.json")
+
+    async def main() -> None:
+        await PydanticFolderDataset(path).save_async(mdl)
+
+    with pytest.warns(UserWarning):
+        asyncio.run(main())
+    assert not fs.exists(f"{fs_path}/meta.bin")
+    _check(PydanticFolderDataset(path).load(), mdl)
+
+
+def test_compact_parse(tmpdir):
+    """Both formats parse to the same metadata; bad metadata fails clearly."""
+    path = f"{tmpdir}/model"
+    with pytest.warns(UserWarning):
+        PydanticFolderDataset(path).save(_make())
+    meta = _read_metadata(path)
+    compact = _dump_metadata(meta, "msgpack")
+    assert _parse_metadata(compact) == _parse_metadata(_dump_metadata(meta, "json"))
+    assert _parse_metadata(compact).catalog[".arr"].type_ == meta.catalog[".arr"].type_
+
+    future = COMPACT_META_MAGIC + bytes([99]) + compact[len(COMPACT_META_MAGIC) + 1 :]
+    with pytest.raises(ValueError, match="version"):
+        _parse_metadata(future)
+    with pytest.raises(ValueError, match="Malformed"):
+        _parse_metadata(b'{"model_info": {}}')
+    with pytest.raises(ValueError, match="Malformed"):
+        _parse_metadata(COMPACT_META_MAGIC)  # truncated
+    with pytest.raises(ValueError):
+        PydanticFolderDataset(path, metadata_format="xml")  # type: ignore
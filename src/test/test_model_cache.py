@@ -0,0 +1,117 @@
+"""Tests for the process-level model cache."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pytest
+from kedro.io.core import DatasetError
+
+from pydantic_kedro import (
+    PydanticAutoDataset,
+    PydanticFolderDataset,
+    PydanticJsonDataset,
+    clear_model_cache,
+    load_model,
+    set_model_cache_size,
+)
+from pydantic_kedro._pydantic import BaseModel
+
+
+class Item(BaseModel):
+    """Simple model."""
+
+    v: int
+    tags: List[str] = []
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    clear_model_cache()
+    yield
+    set_model_cache_size(128)
+    clear_model_cache()
+
+
+@pytest.mark.parametrize("kls", [PydanticJsonDataset, PydanticFolderDataset])
+def test_cache_reuse(kls, tmpdir):
+    """Cached loads are reused until the stored model changes."""
+    for path in [f"{tmpdir}/item", f"memory://{tmpdir}/item"]:
+        kls(path).save(Item(v=1))
+        m1 = load_model(path, cache=True)
+        assert load_model(path, cache=True) is m1
+        assert load_model(path) is not m1
+
+        kls(path).save(Item(v=2, tags=["changed"]))  # not via the cache
+        m2 = load_model(path, cache=True)
+        assert m2 == Item(v=2, tags=["changed"])
+        assert load_model(path, cache=True) is m2
+
+
+def test_cache_copy(tmpdir):
+    """Copy-on-read returns equal, but separate, models."""
+    path = f"{tmpdir}/item.json"
+    PydanticJsonDataset(path).save(Item(v=1, tags=["a"]))
+    m1 = load_model(path, cache=True, cache_copy=True)
+    m1.tags.append("b")
+    m2 = load_model(path, cache=True, cache_copy=True)
+    assert m2 == Item(v=1, tags=["a"])
+    assert m2 is not m1
+
+
+def test_cache_variants_and_release(tmpdir):
+    """Partial loads are cached separately; releasing or saving evicts the path."""
+    path = f"{tmpdir}/item.json"
+    ds = PydanticAutoDataset(path, cache=True)
+    ds.save(Item(v=1))
+    m1 = ds.load()
+    partial = PydanticAutoDataset(path, cache=True, fields=["v"], partial="dict").load()
+    assert partial == {"v": 1}
+    assert ds.load() is m1
+    ds.release()
+    assert ds.load() is not m1
+
+
+def test_cache_validate_sample(tmpdir):
+    """Trusted loads with a different `validate_sample` are cached separately."""
+    path = f"{tmpdir}/item.json"
+    PydanticJsonDataset(path).save(Item(v=1))
+    with open(path) as f:
+        txt = f.read().replace('"v": 1', '"v": "bad"')
+    with open(path, "w") as f:
+        f.write(txt)
+    unchecked = PydanticAutoDataset(path, cache=True, trusted=True).load()
+    assert unchecked.v == "bad"
+    with pytest.raises(DatasetError):
+        PydanticAutoDataset(path, cache=True, trusted=True, validate_sample=1.0).load()
+
+
+def test_cache_lru(tmpdir):
+    """The least recently used models are evicted."""
+    set_model_cache_size(1)
+    paths = [f"{tmpdir}/a.json", f"{tmpdir}/b.json"]
+    for i, path in enumerate(paths):
+        PydanticJsonDataset(path).save(Item(v=i))
+    a1 = load_model(paths[0], cache=True)
+    load_model(paths[1], cache=True)
+    assert load_model(paths[0], cache=True) is not a1
+
+
+def test_cache_single_flight(tmpdir, monkeypatch):
+    """Concurrent loads of the same path are coalesced into one load."""
+    path = f"{tmpdir}/item.json"
+    PydanticJsonDataset(path).save(Item(v=1))
+    calls: List[int] = []
+    orig = PydanticAutoDataset._load_uncached
+
+    def slow_load(self):
+        calls.append(threading.get_ident())
+        time.sleep(0.2)
+        return orig(self)
+
+    monkeypatch.setattr(PydanticAutoDataset, "_load_uncached", slow_load)
+    with ThreadPoolExecutor(8) as executor:
+        res = list(executor.map(lambda _: load_model(path, cache=True), range(8)))
+    assert len(calls) == 1
+    assert all(m is res[0] for m in res)
@@ -0,0 +1,131 @@
+"""Test packing collections of arrays and dataframes with `kedro_pack_collections`."""
+
+from pathlib import Path
+from typing import Any, Dict, List, Union
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pydantic_kedro import (
+    ArbConfig,
+    ArbModel,
+    PydanticFolderDataset,
+    PydanticPackDataset,
+    PydanticZipDataset,
+)
+from pydantic_kedro.datasets.folder import get_import_name
+from pydantic_kedro.datasets.npy import NpyDataset
+from pydantic_kedro.datasets.packed import PackedCollectionDataset
+
+Kls = Union[PydanticFolderDataset, PydanticZipDataset, PydanticPackDataset]
+
+
+class PackedModel(ArbModel):
+    """Model that packs its collections."""
+
+    class Config(ArbConfig):
+        """Pack collections."""
+
+        kedro_pack_collections = True
+
+    arrs: List[np.ndarray]
+    frames: Dict[str, pd.DataFrame] = {}
+    mixed: List[Any] = []
+
+
+def _make() -> PackedModel:
+    return PackedModel(
+        arrs=[np.arange(i, dtype="float32") for i in range(50)] + [np.ones((2, 3), dtype="int8")],
+        frames={"a": pd.DataFrame({"x": [1, 2]}), "b": pd.DataFrame({"y": ["u", "v"]}, index=[5, 6])},
+        mixed=[np.zeros(2), pd.DataFrame({"z": [0.5]})],
+    )
+
+
+def _check(m2: PackedModel, mdl: PackedModel) -> None:
+    assert len(m2.arrs) == len(mdl.arrs)
+    for a, b in zip(m2.arrs, mdl.arrs):
+        np.testing.assert_array_equal(a, b)
+        assert a.dtype == b.dtype
+    assert list(m2.frames) == ["a", "b"]
+    for k, df in mdl.frames.items():
+        pd.testing.assert_frame_equal(m2.frames[k], df)
+    np.testing.assert_array_equal(m2.mixed[0], mdl.mixed[0])
+    pd.testing.assert_frame_equal(m2.mixed[1], mdl.mixed[1])
+
+
+def test_packed_folder_files(tmpdir):
+    """Homogeneous collections are single files; others are saved per item."""
+    mdl = _make()
+    path = Path(f"{tmpdir}/model")
+    with pytest.warns(UserWarning):  # `mixed` items use the default dataset
+        PydanticFolderDataset(str(path)).save(mdl)
+    files = sorted(p.name for p in path.iterdir())
+    assert files == [".arrs", ".frames", ".mixed.0", ".mixed.1", "meta.json"]
+    _check(PydanticFolderDataset(str(path)).load(), mdl)
+
+
+class MappedModel(PackedModel):
+    """Model that packs its collections, but maps arrays to its own dataset."""
+
+    class Config(ArbConfig):
+        """Map arrays explicitly."""
+
+        kedro_pack_collections = True
+        kedro_map = {np.ndarray: NpyDataset}
+
+
+def test_packed_kedro_map(tmpdir):
+    """Types in `kedro_map` are saved with their mapping, rather than packed."""
+    frames = {"a": pd.DataFrame({"x": [1]}), "b": pd.DataFrame({"y": [2]})}
+    mdl = MappedModel(arrs=[np.arange(3), np.ones(2)], frames=frames)
+    path = Path(f"{tmpdir}/model")
+    PydanticFolderDataset(str(path)).save(mdl)
+    meta = PydanticFolderDataset(str(path)).inspect()
+    assert meta.catalog[".arrs.0"].type_ == get_import_name(NpyDataset)
+    assert ".arrs" not in meta.catalog
+    assert meta.catalog[".frames"].type_ == get_import_name(PackedCollectionDataset)
+    res = PydanticFolderDataset(str(path)).load()
+    np.testing.assert_array_equal(res.arrs[1], np.ones(2))
+
+
+@pytest.mark.parametrize("kls", [PydanticFolderDataset, PydanticZipDataset, PydanticPackDataset])
+def test_packed_rt(kls: Kls, tmpdir):
+    """Packed collections roundtrip, both locally and from remote."""
+    mdl = _make()
+    for path in [f"{tmpdir}/model_on_disk", f"memory://{tmpdir}/model_in_memory"]:
+        ds: Kls = kls(path)  # type: ignore
+        with pytest.warns(UserWarning):
+            ds.save(mdl)
+        _check(ds.load(), mdl)
+
+
+def test_packed_partial(tmpdir):
+    """Partial loads of a packed collection load the whole collection."""
+    mdl = _make()
+    path = f"{tmpdir}/model"
+    with pytest.warns(UserWarning):
+        PydanticFolderDataset(path).save(mdl)
+    res = PydanticFolderDataset(path, fields=["arrs.3"], partial="dict").load()
+    assert list(res) == ["arrs"]
+    np.testing.assert_array_equal(res["arrs"][3], mdl.arrs[3])
+
+
+def test_packed_direct_save():
+    """Packed collections are saved directly to remote folders."""
+    mdl = _make()
+    path = "memory://packed_direct/model"
+    with pytest.warns(UserWarning):
+        PydanticFolderDataset(path, direct_save=True).save(mdl)
+    _check(PydanticFolderDataset(path, direct_load=True).load(), mdl)
+
+
+def test_packed_dataset(tmpdir):
+    """Test the dataset directly."""
+    ds = PackedCollectionDataset(f"{tmpdir}/arrs.bin", codec="npy")
+    ds.save({"x": np.arange(3), "y": np.eye(2)})
+    res = ds.load()
+    assert list(res) == ["x", "y"]
+    np.testing.assert_array_equal(res["y"], np.eye(2))
+    with pytest.raises(ValueError):
+        PackedCollectionDataset(f"{tmpdir}/arrs.bin", codec="pickle")  # type: ignore
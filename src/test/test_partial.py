@@ -0,0 +1,152 @@
+"""Test partial (field-projection) loading."""
+
+import asyncio
+from typing import Dict, List, Literal
+
+import pandas as pd
+import pytest
+
+from pydantic_kedro import (
+    ArbModel,
+    PydanticAutoDataset,
+    PydanticFolderDataset,
+    PydanticJsonDataset,
+    PydanticPackDataset,
+    PydanticYamlDataset,
+    PydanticZipDataset,
+    load_model,
+    save_model,
+)
+from pydantic_kedro._pydantic import BaseModel
+
+
+class Inner(ArbModel):
+    """Nested model with a dataframe."""
+
+    z: int = 0
+    df: pd.DataFrame = pd.DataFrame()
+
+
+class Wide(ArbModel):
+    """Model with several arbitrary members."""
+
+    x: int
+    df: pd.DataFrame
+    dfs: List[pd.DataFrame] = []
+    dfm: Dict[str, pd.DataFrame] = {}
+    nested: Inner = Inner()
+
+
+class Pure(BaseModel):
+    """Pure model."""
+
+    x: int
+    y: List[str] = []
+    z: str
+
+
+def _make() -> Wide:
+    return Wide(
+        x=1,
+        df=pd.DataFrame({"a": [1, 2]}),
+        dfs=[pd.DataFrame({"b": [3]}), pd.DataFrame({"c": [4]})],
+        dfm={"k": pd.DataFrame({"d": [5]})},
+        nested=Inner(z=7, df=pd.DataFrame({"e": [6]})),
+    )
+
+
+@pytest.mark.filterwarnings("ignore:No dataset defined")
+@pytest.mark.parametrize("kls", [PydanticAutoDataset, PydanticFolderDataset, PydanticZipDataset])
+@pytest.mark.parametrize("prefix", ["", "memory://"])
+def test_partial_arbitrary(kls, prefix: str, tmpdir):
+    """Only the selected fields (and the members they need) are loaded."""
+    mdl = _make()
+    path = f"{prefix}{tmpdir}/model"
+    kls(path).save(mdl)
+
+    res = kls(path, fields=["x", "df"]).load()
+    assert isinstance(res, Wide)
+    assert res.x == 1
+    pd.testing.assert_frame_equal(res.df, mdl.df)
+    assert res.__fields_set__ == {"x", "df"}
+    assert res.dfs == []  # default
+
+    res = kls(path, fields=["dfs.1", "nested.z"]).load()
+    assert len(res.dfs) == 2  # lists are loaded as a whole
+    pd.testing.assert_frame_equal(res.dfs[1], mdl.dfs[1])
+    assert res.nested.z == 7
+    assert res.nested.df.empty  # default
+
+
+@pytest.mark.filterwarnings("ignore:No dataset defined")
+def test_partial_skips_members(tmpdir, monkeypatch):
+    """Members that aren't needed are never loaded, nor staged from remote."""
+    path = f"memory://{tmpdir}/model"
+    PydanticFolderDataset(path).save(_make())
+
+    loaded: List[str] = []
+    from pydantic_kedro.datasets import folder
+
+    orig = folder.KedroDatasetSpec.to_dataset
+
+    def to_dataset(self, *args, **kwargs):
+        loaded.append(self.relative_path)
+        return orig(self, *args, **kwargs)
+
+    monkeypatch.setattr(folder.KedroDatasetSpec, "to_dataset", to_dataset)
+    res = PydanticFolderDataset(path, fields=["dfm"]).load()
+    assert loaded == [".dfm.k"]
+    assert list(res.dfm) == ["k"]
+
+
+@pytest.mark.filterwarnings("ignore:No dataset defined")
+@pytest.mark.parametrize("kls", [PydanticFolderDataset, PydanticZipDataset])
+def test_partial_async(kls, tmpdir):
+    """Partial loads also work with the async API."""
+    path = f"memory://{tmpdir}/model"
+    kls(path).save(_make())
+    res = asyncio.run(kls(path, fields=["nested"], partial="dict").load_async())
+    assert list(res) == ["nested"]
+    assert res["nested"].z == 7
+
+
+@pytest.mark.filterwarnings("ignore:No dataset defined")
+@pytest.mark.parametrize("format", ["folder", "zip", "json", "yaml"])
+def test_partial_dict(format: Literal["folder", "zip", "json", "yaml"], tmpdir):
+    """Partial loads can return a dict of the selected top-level fields."""
+    path = f"{tmpdir}/model"
+    mdl: BaseModel = _make() if format in ["folder", "zip"] else Pure(x=1, y=["a"], z="b")
+    save_model(mdl, path, format=format)
+    res = load_model(path, fields=["x"], partial="dict")
+    assert res == {"x": 1}
+
+
+@pytest.mark.parametrize("kls", [PydanticJsonDataset, PydanticYamlDataset])
+def test_partial_pure(kls, tmpdir):
+    """Only selected fields are validated; missing required fields stay unset."""
+    path = f"{tmpdir}/model"
+    kls(path).save(Pure(x=1, y=["a"], z="b"))
+    res = kls(path, fields=["y"]).load()
+    assert isinstance(res, Pure)
+    assert res.y == ["a"]
+    assert res.__fields_set__ == {"y"}
+    assert not hasattr(res, "z")
+
+
+@pytest.mark.parametrize(
+    "kls",
+    [
+        PydanticAutoDataset,
+        PydanticFolderDataset,
+        PydanticJsonDataset,
+        PydanticPackDataset,
+        PydanticYamlDataset,
+        PydanticZipDataset,
+    ],
+)
+def test_partial_bad_args(kls, tmpdir):
+    """Unknown partial result types, and a single string of fields, are rejected early."""
+    with pytest.raises(ValueError):
+        kls(f"{tmpdir}/model", fields=["x"], partial="bad")  # type: ignore
+    with pytest.raises(TypeError):
+        kls(f"{tmpdir}/model", fields="x")  # type: ignore
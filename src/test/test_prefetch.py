@@ -0,0 +1,111 @@
+"""Tests for prefetching pipeline inputs with `PrefetchHooks`."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Tuple
+
+import pytest
+from kedro.framework.hooks.manager import _create_hook_manager
+from kedro.io import DataCatalog
+from kedro.pipeline import node, pipeline
+from kedro.runner import SequentialRunner
+
+from pydantic_kedro import PydanticFolderDataset, PydanticJsonDataset, PydanticZipDataset
+from pydantic_kedro._prefetch import _PREFETCHED, claim_prefetched, prefetch
+from pydantic_kedro._pydantic import BaseModel
+from pydantic_kedro.hooks import PrefetchHooks
+from pydantic_kedro.instrumentation import STEP_DICT_TO_MODEL, Instrument, InstrumentEvent, instrumented
+
+
+class Item(BaseModel):
+    """Simple model."""
+
+    v: int
+    name: str = "x" * 100
+
+
+class ThreadCollector(Instrument):
+    """Collects the threads that built models."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.threads: List[Tuple[str, str]] = []
+
+    def on_event(self, event: InstrumentEvent) -> None:
+        """Record the thread."""
+        if event.step == STEP_DICT_TO_MODEL:
+            self.threads.append((event.path, threading.current_thread().name))
+
+
+def _add(a: Item, b: Item) -> int:
+    return a.v + b.v
+
+
+def _setup(tmpdir) -> Tuple[DataCatalog, Any]:
+    paths = {"a": f"memory://{tmpdir}/a", "b": f"memory://{tmpdir}/b.zip"}
+    PydanticFolderDataset(paths["a"]).save(Item(v=1))  # 223 bytes
+    PydanticZipDataset(paths["b"]).save(Item(v=2))  # 339 bytes
+    catalog = DataCatalog({"a": PydanticFolderDataset(paths["a"]), "b": PydanticZipDataset(paths["b"])})
+    return catalog, pipeline([node(_add, inputs=["a", "b"], outputs="c")])
+
+
+def _run(hooks: PrefetchHooks, tmpdir) -> Tuple[int, ThreadCollector]:
+    catalog, pipe = _setup(tmpdir)
+    hook_manager = _create_hook_manager()
+    hook_manager.register(hooks)
+    collector = ThreadCollector()
+    with instrumented(collector):
+        # The pipeline hooks are normally called by the Kedro session
+        hook_manager.hook.before_pipeline_run(run_params={}, pipeline=pipe, catalog=catalog)
+        res = SequentialRunner().run(pipe, catalog, hook_manager)
+        hook_manager.hook.after_pipeline_run(
+            run_params={}, run_result=res, pipeline=pipe, catalog=catalog
+        )
+    return res["c"], collector
+
+
+def test_prefetch_hooks(tmpdir):
+    """Pipeline inputs are loaded in background threads, and used by the nodes."""
+    hooks = PrefetchHooks()
+    c, collector = _run(hooks, tmpdir)
+    assert c == 3
+    assert hooks.prefetched == ["a", "b"]
+    assert len(collector.threads) == 2
+    assert all(name.startswith("pydantic-kedro-prefetch") for _, name in collector.threads)
+    assert not _PREFETCHED
+
+
+def test_prefetch_budget(tmpdir):
+    """Datasets bigger than the budget are loaded normally."""
+    hooks = PrefetchHooks(max_bytes=10)
+    c, collector = _run(hooks, tmpdir)
+    assert c == 3
+    assert hooks.prefetched == []
+    assert all(name == threading.main_thread().name for _, name in collector.threads)
+
+
+def test_prefetch_one_at_a_time(tmpdir):
+    """With room for one dataset, the next is prefetched once the first is used."""
+    catalog, pipe = _setup(tmpdir)
+    hooks = PrefetchHooks(max_bytes=400)
+    hooks.before_pipeline_run(run_params={}, pipeline=pipe, catalog=catalog)
+    assert hooks.prefetched == ["a"]
+    assert catalog.load("a") == Item(v=1)
+    assert hooks.prefetched == ["a", "b"]
+    hooks.after_pipeline_run(run_params={}, run_result={}, pipeline=pipe, catalog=catalog)
+    assert not _PREFETCHED
+
+
+def test_claim_prefetched(tmpdir):
+    """Prefetched results are claimed once; failed prefetches load normally."""
+    ds = PydanticJsonDataset(f"{tmpdir}/item.json")
+    with ThreadPoolExecutor(1) as executor:
+        with pytest.raises(Exception):
+            prefetch(ds, executor).result()  # file doesn't exist yet
+        ds.save(Item(v=5))
+        assert claim_prefetched(ds) is None
+        assert ds.load() == Item(v=5)
+
+        future = prefetch(ds, executor)
+        assert ds.load() is future.result()
+        assert claim_prefetched(ds) is None
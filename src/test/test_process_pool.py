@@ -0,0 +1,190 @@
+"""Test saving and loading folder members in worker processes."""
+
+import os
+from typing import Any, Dict, List, Union
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pydantic_kedro import (
+    ArbConfig,
+    ArbModel,
+    PydanticAutoDataset,
+    PydanticFolderDataset,
+    PydanticPackDataset,
+    PydanticZipDataset,
+)
+from pydantic_kedro._process_pool import SHM_MIN_BYTES, free, pack, unpack
+from pydantic_kedro._pydantic import BaseModel
+from pydantic_kedro.datasets import folder
+
+Kls = Union[PydanticAutoDataset, PydanticFolderDataset, PydanticZipDataset, PydanticPackDataset]
+
+
+class Blob:
+    """Custom (pickled) type."""
+
+    def __init__(self, items: List[int]) -> None:
+        self.items = items
+
+    def __eq__(self, other: Any) -> bool:  # noqa: D105
+        return isinstance(other, Blob) and other.items == self.items
+
+
+class Where:
+    """Custom type that remembers the process that pickled it."""
+
+    def __init__(self) -> None:
+        self.pid = os.getpid()
+
+    def __getstate__(self) -> Dict[str, int]:  # noqa: D105
+        return {"pid": os.getpid()}
+
+
+class Leaf(BaseModel):
+    """Pure nested model."""
+
+    v: int = 0
+
+
+class Model(ArbModel):
+    """Model with big and small arbitrary members."""
+
+    big: np.ndarray
+    df: pd.DataFrame
+    blobs: Dict[str, Blob] = {}
+    leaves: List[Leaf] = []
+
+
+class NpyModel(ArbModel):
+    """Model with memory-mapped (lazy) members."""
+
+    class Config(ArbConfig):
+        """Use memory-mapped `.npy` files."""
+
+        kedro_npy = True
+
+    arr: np.ndarray
+
+
+def _make() -> Model:
+    return Model(
+        big=np.arange(SHM_MIN_BYTES // 4, dtype="float64"),  # 2 MiB, so it's in shared memory
+        df=pd.DataFrame({"a": range(5), "b": list("abcde")}),
+        blobs={"x": Blob([1, 2]), "y": Blob([])},
+        leaves=[Leaf(v=1)],
+    )
+
+
+def _check(res: Model, mdl: Model) -> None:
+    assert isinstance(res, Model)
+    np.testing.assert_array_equal(res.big, mdl.big)
+    assert res.df.equals(mdl.df)
+    assert res.blobs == mdl.blobs
+    assert res.leaves == mdl.leaves
+
+
+def _shm_names() -> List[str]:
+    """Names of the shared memory blocks (on Linux)."""
+    if not os.path.isdir("/dev/shm"):
+        return []
+    return sorted(n for n in os.listdir("/dev/shm") if n.startswith("psm_"))
+
+
+@pytest.mark.parametrize(
+    "kls", [PydanticFolderDataset, PydanticZipDataset, PydanticPackDataset, PydanticAutoDataset]
+)
+def test_roundtrip(kls: Kls, tmpdir):
+    """Models saved by worker processes are the same as those saved in-process."""
+    mdl = _make()
+    before = _shm_names()
+    kls(f"{tmpdir}/workers", processes=2).save(mdl)  # type: ignore
+    kls(f"{tmpdir}/inline").save(mdl)  # type: ignore
+    for path in ["workers", "inline"]:
+        _check(kls(f"{tmpdir}/{path}").load(), mdl)  # type: ignore
+        _check(kls(f"{tmpdir}/{path}", processes=2).load(), mdl)  # type: ignore
+    assert _shm_names() == before
+
+
+class WhereModel(ArbModel):
+    """Model with members that remember where they were saved."""
+
+    wheres: List[Where]
+
+
+def test_in_workers(tmpdir):
+    """Members are pickled by the worker processes."""
+    path = f"{tmpdir}/model"
+    PydanticFolderDataset(path, processes=2).save(WhereModel(wheres=[Where(), Where()]))
+    res = PydanticFolderDataset(path).load()
+    assert all(w.pid != os.getpid() for w in res.wheres)
+    PydanticFolderDataset(path).save(WhereModel(wheres=[Where()]))
+    res = PydanticFolderDataset(path).load()
+    assert res.wheres[0].pid == os.getpid()
+
+
+class ArraysModel(ArbModel):
+    """Model with many big arrays."""
+
+    arrays: Dict[str, np.ndarray]
+
+
+def test_bounded_shared_memory(tmpdir, monkeypatch):
+    """Shared memory is freed as members are saved, so only a few blocks are in use at once."""
+    in_use: List[int] = []
+
+    def pack_counted(obj: Any) -> Any:
+        in_use.append(len(_shm_names()))
+        return pack(obj)
+
+    monkeypatch.setattr(folder, "pack", pack_counted)
+    mdl = ArraysModel(arrays={str(i): np.full(SHM_MIN_BYTES // 8, i, dtype="float64") for i in range(8)})
+    PydanticFolderDataset(f"{tmpdir}/model", processes=1).save(mdl)
+    assert len(in_use) == 8
+    assert max(in_use) - in_use[0] <= 2
+    res = PydanticFolderDataset(f"{tmpdir}/model").load()
+    np.testing.assert_array_equal(res.arrays["7"], mdl.arrays["7"])
+
+
+def test_lazy_members(tmpdir):
+    """Memory-mapped members are loaded in this process."""
+    path = f"{tmpdir}/model"
+    PydanticFolderDataset(path, processes=2).save(NpyModel(arr=np.arange(3)))
+    res = PydanticFolderDataset(path, processes=2).load()
+    assert isinstance(res.arr, np.memmap)
+    np.testing.assert_array_equal(res.arr, np.arange(3))
+
+
+def test_memory_fs(tmpdir):
+    """Members in `memory://` are only visible in this process, so they're saved here."""
+    path = f"memory://{tmpdir}/model"
+    PydanticFolderDataset(path, processes=2, direct_save=True, direct_load=True).save(_make())
+    _check(PydanticFolderDataset(path, processes=2, direct_load=True).load(), _make())
+
+
+def test_errors(tmpdir):
+    """Errors are raised, and shared memory is freed."""
+    before = _shm_names()
+    mdl = _make()
+    mdl.blobs["bad"] = Blob([lambda: 1])  # type: ignore  # can't be pickled
+    with pytest.raises(Exception):
+        PydanticFolderDataset(f"{tmpdir}/model", processes=2).save(mdl)
+    assert _shm_names() == before
+
+    with pytest.raises(ValueError):
+        PydanticFolderDataset(f"{tmpdir}/model", processes=-1)
+
+
+def test_pack():
+    """Big buffers are passed in shared memory, small ones are pickled."""
+    arrays = [np.ones(SHM_MIN_BYTES), np.ones(3)]
+    packed, blocks = pack(arrays)
+    try:
+        assert len(packed[1]) == 1
+        res = unpack(packed)
+    finally:
+        free(blocks)
+    for a, b in zip(res, arrays):
+        np.testing.assert_array_equal(a, b)
+    assert res[0].flags.writeable
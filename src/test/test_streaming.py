@@ -0,0 +1,130 @@
+"""Test streaming loading and saving of large pure models."""
+
+import tracemalloc
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+import pytest
+
+from pydantic_kedro import PydanticJsonDataset, PydanticYamlDataset
+from pydantic_kedro._pydantic import BaseModel
+
+
+class Leaf(BaseModel):
+    """Nested model."""
+
+    v: int = 0
+    name: Optional[str] = None
+    xs: List[float] = []
+
+
+class Big(BaseModel):
+    """Model with many nested models and other JSON values."""
+
+    leaves: List[Leaf] = []
+    groups: Dict[str, List[Leaf]] = {}
+    nested: List[List[int]] = []
+    empty: Dict[str, int] = {}
+    when: datetime = datetime(2020, 1, 2)
+    text: str = 'ünïcode "quoted"\n'
+    flag: bool = True
+    ratio: float = 0.5
+
+
+def _big(n: int = 10) -> Big:
+    leaves = [Leaf(v=i, name=None if i % 2 else str(i), xs=[i / 3] * 3) for i in range(n)]
+    return Big(leaves=leaves, groups={"a": leaves[:2], "b": []}, nested=[[1, 2], []])
+
+
+@pytest.mark.parametrize("model", [_big(), Big()])
+def test_json_streaming(model, tmpdir):
+    """Streaming loads give the same models as normal loads."""
+    path = f"{tmpdir}/model.json"
+    PydanticJsonDataset(path).save(model)
+    res = PydanticJsonDataset(path, streaming=True).load()
+    assert res == model
+    assert res == PydanticJsonDataset(path).load()
+    assert PydanticJsonDataset(path, streaming=True, trusted=True).load() == model
+
+
+def test_json_streaming_fields(tmpdir):
+    """Values of top-level fields that aren't selected are skipped."""
+    path = f"{tmpdir}/model.json"
+    PydanticJsonDataset(path).save(_big())
+    res = PydanticJsonDataset(path, streaming=True, fields=["nested", "flag"]).load()
+    assert res.__fields_set__ == {"nested", "flag"}
+    assert res.nested == [[1, 2], []]
+    dct = PydanticJsonDataset(path, streaming=True, fields=["leaves"], partial="dict").load()
+    assert dct == {"leaves": _big().leaves}
+
+
+def test_json_streaming_memory(tmpdir):
+    """Streaming loads don't keep the whole dict tree in memory."""
+    path = f"{tmpdir}/model.json"
+    PydanticJsonDataset(path).save(_big(5000))
+
+    def overhead(streaming: bool) -> int:
+        tracemalloc.start()
+        try:
+            res = PydanticJsonDataset(path, streaming=streaming).load()
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert res == _big(5000)
+        return peak - current
+
+    assert overhead(streaming=True) < overhead(streaming=False) / 2
+
+
+class Color(str, Enum):
+    """Enum, stored as its value."""
+
+    RED = "red"
+
+
+class Rich(BaseModel):
+    """Model with values that need conversion for JSON/YAML."""
+
+    big: Big = Big()
+    by_int: Dict[int, Leaf] = {1: Leaf(v=1)}
+    color: Color = Color.RED
+    pair: Tuple[int, float] = (1, 2.0)
+    tags: Set[str] = {"a"}
+    uid: UUID = UUID(int=5)
+    path: Path = Path("/a/b")
+    nan: float = float("nan")
+    tricky: List[str] = ["123", "true", "null", "- x", "a: b", "'q'", "multi\nline", "word " * 30]
+
+    class Config:
+        """Config."""
+
+        json_encoders = {Path: lambda p: {"path": str(p)}}
+
+
+@pytest.mark.parametrize("model", [_big(), Big(), Rich()])
+def test_yaml_streaming(model, tmpdir):
+    """Streaming saves write the same YAML as normal saves."""
+    PydanticYamlDataset(f"{tmpdir}/normal.yaml").save(model)
+    PydanticYamlDataset(f"{tmpdir}/streamed.yaml", streaming=True).save(model)
+    with open(f"{tmpdir}/normal.yaml") as f1, open(f"{tmpdir}/streamed.yaml") as f2:
+        assert f1.read() == f2.read()
+    if not isinstance(model, Rich):  # can't compare NaN
+        assert PydanticYamlDataset(f"{tmpdir}/streamed.yaml").load() == model
+
+
+def test_yaml_streaming_memory(tmpdir):
+    """Streaming saves don't create copies of the whole model."""
+    model = _big(300)
+
+    def peak(streaming: bool) -> int:
+        tracemalloc.start()
+        try:
+            PydanticYamlDataset(f"{tmpdir}/model.yaml", streaming=streaming).save(model)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    assert peak(streaming=True) < peak(streaming=False) / 4
@@ -0,0 +1,179 @@
+"""Test trusted (unvalidated) loading."""
+
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+import pytest
+
+from pydantic_kedro import (
+    ArbModel,
+    PydanticAutoDataset,
+    PydanticFolderDataset,
+    PydanticJsonDataset,
+    PydanticJsonLinesDataset,
+    PydanticPackDataset,
+    PydanticYamlDataset,
+    PydanticZipDataset,
+    load_model,
+    load_models,
+)
+from pydantic_kedro._dict_io import KLS_MARK_STR, dict_to_model, get_kls_path, get_validated_fields
+from pydantic_kedro._pydantic import BaseModel, Extra, Field, ValidationError, validator
+
+
+class Color(str, Enum):
+    """Enum, stored as its value."""
+
+    RED = "red"
+    BLUE = "blue"
+
+
+class Leaf(BaseModel):
+    """Nested model."""
+
+    v: int = 0
+    name: Optional[str] = None
+
+
+class Pure(BaseModel):
+    """Pure model, with fields that need conversion and fields that don't."""
+
+    x: int
+    ys: List[float] = []
+    leaves: Dict[str, Leaf] = {}
+    when: datetime = datetime(2020, 1, 2, 3, 4, 5)
+    color: Color = Color.RED
+    pair: Tuple[int, int] = (1, 2)
+    aliased: int = Field(0, alias="Aliased")
+    upper: str = "a"
+
+    @validator("upper")
+    def _upper(cls, v: str) -> str:  # noqa: N805
+        return v.upper()
+
+
+class Loose(BaseModel):
+    """Model that keeps extra fields."""
+
+    x: int = 0
+
+    class Config:
+        """Config."""
+
+        extra = Extra.allow
+
+
+class Arb(ArbModel):
+    """Model with an arbitrary member."""
+
+    df: pd.DataFrame
+    leaf: Leaf = Leaf()
+
+
+def _pure() -> Pure:
+    return Pure(x=1, ys=[1.5, 2.0], leaves={"a": Leaf(v=2, name="a")}, Aliased=3, upper="b")
+
+
+def test_validated_fields():
+    """Only the fields whose stored values need conversion (or have validators) are validated."""
+    assert get_validated_fields(Pure) == {"when", "color", "pair", "upper"}
+    assert get_validated_fields(Leaf) == set()
+
+
+@pytest.mark.parametrize(
+    "kls", [PydanticJsonDataset, PydanticYamlDataset, PydanticFolderDataset, PydanticAutoDataset]
+)
+def test_trusted_pure(kls, tmpdir):
+    """Trusted loads give the same models as validated loads."""
+    path = f"{tmpdir}/model"
+    kls(path).save(_pure())
+    res = kls(path, trusted=True).load()
+    expected = kls(path).load()
+    assert res == expected
+    assert res.__fields_set__ == expected.__fields_set__
+    assert isinstance(res.when, datetime) and isinstance(res.pair, tuple)
+    assert res.color is Color.RED
+    assert isinstance(res.leaves["a"], Leaf)
+
+
+@pytest.mark.parametrize("kls", [PydanticFolderDataset, PydanticZipDataset, PydanticPackDataset])
+def test_trusted_arbitrary(kls, tmpdir):
+    """Arbitrary members are loaded by their datasets, as usual."""
+    path = f"{tmpdir}/model"
+    kls(path).save(Arb(df=pd.DataFrame({"a": [1, 2]}), leaf=Leaf(v=1)))
+    res = kls(path, trusted=True).load()
+    assert isinstance(res, Arb)
+    assert res.df.equals(pd.DataFrame({"a": [1, 2]}))
+    assert res.leaf == Leaf(v=1)
+
+
+def test_trusted_skips_validation(tmpdir):
+    """Stored values that are already of a JSON type are not checked."""
+    path = f"{tmpdir}/model.json"
+    PydanticJsonDataset(path).save(Leaf(v=1))
+    with open(path) as f:
+        dct = json.load(f)
+    dct["v"] = "not an int"
+    with open(path, "w") as f:
+        json.dump(dct, f)
+
+    with pytest.raises(Exception):
+        load_model(path)
+    assert load_model(path, trusted=True).v == "not an int"
+    with pytest.raises(Exception):
+        load_model(path, trusted=True, validate_sample=1.0)
+
+
+def test_trusted_extra_and_partial(tmpdir):
+    """Extra fields are kept if allowed; partial loads only set the selected fields."""
+    path = f"{tmpdir}/model.json"
+    PydanticJsonDataset(path).save(Loose(x=1, extra="e"))  # type: ignore
+    assert load_model(path, trusted=True) == Loose(x=1, extra="e")  # type: ignore
+
+    path = f"{tmpdir}/pure.json"
+    PydanticJsonDataset(path).save(_pure())
+    res = load_model(path, fields=["x", "when"], trusted=True)
+    assert res.__fields_set__ == {"x", "when"}
+    assert res.when == _pure().when
+
+
+class Aliased(BaseModel):
+    """Model with a required, aliased field."""
+
+    value: int = Field(alias="v")
+
+
+def test_trusted_missing_required():
+    """Missing required fields fail as they do with validation, rather than being left unset."""
+    kls = {KLS_MARK_STR: get_kls_path(Aliased)}
+    assert dict_to_model({**kls, "v": 1}, trusted=True) == Aliased(v=1)  # type: ignore
+    for data in [kls, {**kls, "value": 1}]:  # missing, or not stored under its alias
+        with pytest.raises(ValidationError):
+            dict_to_model(data)
+        with pytest.raises(ValidationError):
+            dict_to_model(data, trusted=True)
+    res = dict_to_model(kls, partial=True, trusted=True)
+    assert res.__fields_set__ == set()
+
+
+def test_trusted_jsonl_and_batch(tmpdir):
+    """Trusted loads of collections."""
+    path = f"{tmpdir}/leaves.jsonl"
+    PydanticJsonLinesDataset(path).save(Leaf(v=i) for i in range(3))
+    assert list(PydanticJsonLinesDataset(path, trusted=True).load()) == [Leaf(v=i) for i in range(3)]
+
+    uris = [f"{tmpdir}/{i}.json" for i in range(3)]
+    for i, uri in enumerate(uris):
+        PydanticJsonDataset(uri).save(Leaf(v=i))
+    assert load_models(uris, Leaf, trusted=True) == [Leaf(v=i) for i in range(3)]
+
+
+def test_validate_sample_range():
+    """The sample fraction must be between 0 and 1."""
+    with pytest.raises(ValueError):
+        PydanticJsonDataset("memory://x.json", trusted=True, validate_sample=1.5)
+    with pytest.raises(ValidationError):
+        Leaf(v="x")  # type: ignore
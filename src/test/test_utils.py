@@ -2,8 +2,11 @@
 
 from typing import Any
 
-from pydantic_kedro import load_model, save_model
+import pytest
+
+from pydantic_kedro import load_model, load_models, save_model, save_models
 from pydantic_kedro._pydantic import BaseModel
+from pydantic_kedro.utils import BatchError
 
 
 class MyModel(BaseModel):
@@ -12,6 +15,13 @@ class MyModel(BaseModel):
     x: str
 
 
+class PairModel(BaseModel):
+    """Model with two fields."""
+
+    x: str
+    y: int = 0
+
+
 def test_utils_load_save(tmpdir: str):
     """Minimal test for load/save."""
     # using memory to avoid tempfile
@@ -20,3 +30,33 @@ def test_utils_load_save(tmpdir: str):
     obj: Any = load_model(f"{tmpdir}/model")
     assert isinstance(obj, MyModel)
     assert obj.x == "example"
+
+
+def test_utils_batch(tmpdir: str):
+    """Test batch load/save, including per-item errors."""
+    models = [MyModel(x=str(i)) for i in range(10)]
+    uris = [f"{tmpdir}/model_{i}" for i in range(10)]
+    save_models(models, uris, max_workers=4)
+
+    loaded = load_models(uris, MyModel, max_workers=4)
+    assert loaded == models
+
+    with pytest.raises(BatchError) as exc_info:
+        load_models([uris[0], f"{tmpdir}/missing", uris[2]])
+    err = exc_info.value
+    assert list(err.errors.keys()) == [1]
+    assert err.results[0] == models[0]
+    assert err.results[1] is None
+    assert err.results[2] == models[2]
+
+
+def test_utils_batch_options(tmpdir: str):
+    """Batch loads take the same options as `load_model`."""
+    models = [PairModel(x=str(i), y=i) for i in range(3)]
+    uris = [f"{tmpdir}/model_{i}" for i in range(3)]
+    save_models(models, uris)
+
+    assert load_models(uris, fields=["y"], partial="dict") == [{"y": i} for i in range(3)]
+    cached = load_models(uris, PairModel, cache=True)
+    assert cached == models
+    assert all(a is b for a, b in zip(load_models(uris, cache=True), cached))